@@ -0,0 +1,122 @@
+"""
+Measures the per-request cost of resolving a service dependency, for the
+previous per-request graph (service -> repository -> session + condition
+builder, all created per request) and for the shared service that only
+resolves the session.
+
+Only FastAPI's dependency resolution runs: the session dependency is
+overridden with a placeholder, so no database is needed.
+
+Usage (APP_CONFIG__ env set):
+    PYTHONPATH=fastapi_application python benchmarks/dependency_overhead.py
+    PYTHONPATH=fastapi_application python benchmarks/dependency_overhead.py \
+        --requests 50000
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import Any, AsyncGenerator, Callable
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+
+from core.db_helper import db_helper
+from core.factories import get_service_by_model
+from core.registry import model_registry
+from domains.queues import Queue
+
+
+class LegacyConditionBuilder:
+    """The previous builder: created per request, state kept on the instance."""
+
+    def __init__(self, model: Any):
+        self.model = model
+        self.filters: list[Any] = []
+        self.options: list[Any] = []
+
+
+def legacy_service_by_model(model_cls: Any) -> Callable[..., Any]:
+    """
+    The previous dependency graph, reproduced for comparison.
+    """
+    service_cls, repo_cls = model_registry.MODEL_REGISTRY[model_cls]
+
+    def get_condition_builder() -> LegacyConditionBuilder:
+        return LegacyConditionBuilder(model_cls)
+
+    def create_repository(
+        session: Any = Depends(db_helper.session_getter),
+        condition_builder: Any = Depends(get_condition_builder),
+    ) -> Any:
+        return repo_cls(session, condition_builder)
+
+    def create_service(repository: Any = Depends(create_repository)) -> Any:
+        return service_cls(repository)
+
+    return create_service
+
+
+async def placeholder_session() -> AsyncGenerator[object, None]:
+    yield object()
+
+
+async def measure(
+    name: str,
+    dependency: Callable[..., Any],
+    app: FastAPI,
+    requests: int,
+) -> float:
+    async def endpoint(service: Any = Depends(dependency)) -> None:
+        pass
+
+    dependant = get_dependant(path="/queues", call=endpoint)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/queues",
+        "query_string": b"",
+        "headers": [],
+    }
+
+    async def resolve() -> None:
+        async with AsyncExitStack() as stack:
+            solved = await solve_dependencies(
+                request=Request(scope),
+                dependant=dependant,
+                dependency_overrides_provider=app,
+                async_exit_stack=stack,
+                embed_body_fields=False,
+            )
+            assert not solved.errors
+
+    await resolve()  # warm-up
+    started = time.perf_counter()
+    for _ in range(requests):
+        await resolve()
+    elapsed = time.perf_counter() - started
+    per_request = elapsed / requests * 1e6
+    print(f"{name:<20} {requests:>7} requests {per_request:>8.1f} us/request")
+    return per_request
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    app = FastAPI()
+    app.dependency_overrides[db_helper.session_getter] = placeholder_session
+
+    before = await measure(
+        "per-request graph", legacy_service_by_model(Queue), app, args.requests
+    )
+    after = await measure(
+        "shared service", get_service_by_model(Queue), app, args.requests
+    )
+    print(f"saved: {before - after:.1f} us/request (x{before / after:.1f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
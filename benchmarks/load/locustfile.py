@@ -0,0 +1,194 @@
+"""
+Load scenarios of the API hot paths, run against the local docker-compose
+stack with the dataset of `benchmarks/load/seed.py`.
+
+Every virtual user logs in as its own seeded user (token bootstrap), so
+requests go through the real authentication path. User classes:
+    Browser: lists queues (first and following pages) and opens queue details.
+    RushUser: a registration rush: takes the next free position in a queue,
+    refreshes the queue and leaves it again, with no think time.
+    LoginUser: logs in repeatedly.
+
+With `--report PATH` the statistics of every endpoint (requests, failures,
+RPS, average, p50/p95/p99 in ms) are written to PATH as JSON on exit;
+`benchmarks/load/run.py` runs the named scenarios and collects them.
+
+Usage (`locust` from the load_testing dependency group):
+    locust -f benchmarks/load/locustfile.py --host http://localhost:50000 \
+        --headless -u 200 -r 50 -t 1m --report results.json Browser RushUser
+"""
+
+import json
+import random
+from itertools import count
+from pathlib import Path
+from typing import Any
+
+from locust import HttpUser, between, constant, events, task
+from locust.env import Environment
+
+API = "/api_v1"
+DEFAULT_DATASET = Path(__file__).with_name("dataset.json")
+PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+dataset: dict[str, Any] = {}
+# hands out the seeded users to virtual users in turn
+user_numbers = count()
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser: Any) -> None:
+    parser.add_argument(
+        "--dataset",
+        default=str(DEFAULT_DATASET),
+        help="manifest written by benchmarks/load/seed.py",
+    )
+    parser.add_argument("--report", default="", help="write a JSON report here")
+
+
+@events.test_start.add_listener
+def load_dataset(environment: Environment, **kwargs: Any) -> None:
+    dataset.update(json.loads(Path(environment.parsed_options.dataset).read_text()))
+
+
+def endpoint_stats(entry: Any) -> dict[str, Any]:
+    return {
+        "requests": entry.num_requests,
+        "failures": entry.num_failures,
+        "rps": round(entry.total_rps, 2),
+        "avg_ms": round(entry.avg_response_time, 2),
+        **{
+            name: entry.get_response_time_percentile(percentile)
+            for name, percentile in PERCENTILES.items()
+        },
+    }
+
+
+@events.quitting.add_listener
+def write_report(environment: Environment, **kwargs: Any) -> None:
+    path = environment.parsed_options.report
+    if not path:
+        return
+
+    total = environment.stats.total
+    report = {
+        "user_classes": sorted(
+            user_class.__name__ for user_class in environment.user_classes
+        ),
+        "users": environment.parsed_options.num_users,
+        "duration_s": round(
+            (total.last_request_timestamp or total.start_time) - total.start_time, 2
+        ),
+        "total": endpoint_stats(total),
+        "endpoints": {
+            f"{method} {name}": endpoint_stats(entry)
+            for (name, method), entry in sorted(environment.stats.entries.items())
+        },
+    }
+    Path(path).write_text(json.dumps(report, indent=2))
+
+
+class ApiUser(HttpUser):
+    """
+    A virtual user logged in as one of the seeded users.
+    """
+
+    abstract = True
+
+    def on_start(self) -> None:
+        users = dataset["users"]
+        self.email = users[next(user_numbers) % len(users)]
+        self.login()
+
+    def login(self) -> None:
+        response = self.client.post(
+            f"{API}/auth/login",
+            data={"username": self.email, "password": dataset["password"]},
+            name=f"{API}/auth/login",
+        )
+        if response.ok:
+            token = response.json()["access_token"]
+            self.client.headers["Authorization"] = f"Bearer {token}"
+
+    def random_queue(self) -> int:
+        return random.choice(dataset["queue_ids"])
+
+    def get_queue(self, queue_id: int) -> None:
+        self.client.get(f"{API}/queues/{queue_id}", name=f"{API}/queues/[id]")
+
+
+class Browser(ApiUser):
+    """
+    Reads the queue listing and queue details.
+    """
+
+    weight = 3
+    wait_time = between(0.5, 2)
+
+    @task(3)
+    def list_queues(self) -> None:
+        response = self.client.get(f"{API}/queues", params={"limit": 50})
+        if response.ok and (cursor := response.json()["next_cursor"]):
+            self.client.get(
+                f"{API}/queues",
+                params={"limit": 50, "cursor": cursor},
+                name=f"{API}/queues?cursor",
+            )
+
+    @task(5)
+    def queue_detail(self) -> None:
+        self.get_queue(self.random_queue())
+
+
+class RushUser(ApiUser):
+    """
+    Takes and gives back queue positions as fast as it can.
+    """
+
+    weight = 1
+    wait_time = constant(0)
+
+    queue_id: int | None = None
+
+    @task
+    def take_position(self) -> None:
+        if self.queue_id is not None:
+            self.leave()
+            return
+
+        queue_id = self.random_queue()
+        with self.client.post(
+            f"{API}/queue",
+            json={"queue_id": queue_id},
+            catch_response=True,
+        ) as response:
+            # a full queue or a position already held is expected in a rush
+            if response.status_code == 409:
+                response.success()
+            elif response.ok:
+                self.queue_id = queue_id
+        self.get_queue(queue_id)
+
+    def leave(self) -> None:
+        self.client.delete(
+            f"{API}/queue/{self.queue_id}",
+            name=f"{API}/queue/[id]",
+        )
+        self.queue_id = None
+
+    def on_stop(self) -> None:
+        if self.queue_id is not None:
+            self.leave()
+
+
+class LoginUser(ApiUser):
+    """
+    Logs in again and again.
+    """
+
+    weight = 1
+    wait_time = between(0.5, 1)
+
+    @task
+    def relogin(self) -> None:
+        self.login()
@@ -0,0 +1,100 @@
+"""
+Runs the load scenarios headless against the local docker-compose stack
+and collects one JSON report per scenario, plus a summary of all of them.
+
+Scenarios:
+    browse: readers only (listing and details).
+    rush: a registration rush: all users arrive at once, a third of them
+    taking and leaving positions without think time while the rest read.
+    login: logins only.
+    mixed: readers, rush users and logins together.
+
+Usage (stack running, dataset seeded with benchmarks/load/seed.py):
+    python benchmarks/load/run.py
+    python benchmarks/load/run.py rush --users 500 --duration 2m \
+        --out-dir benchmarks/load/results
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+HERE = Path(__file__).parent
+
+# user classes, users, spawn rate (users per second)
+SCENARIOS: dict[str, tuple[list[str], int, int]] = {
+    "browse": (["Browser"], 100, 20),
+    "rush": (["Browser", "RushUser"], 300, 300),
+    "login": (["LoginUser"], 50, 10),
+    "mixed": (["Browser", "RushUser", "LoginUser"], 200, 50),
+}
+
+
+def run_scenario(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    user_classes, users, spawn_rate = SCENARIOS[name]
+    users = args.users or users
+    report = args.out_dir / f"{name}.json"
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "locust",
+            "-f",
+            str(HERE / "locustfile.py"),
+            "--host",
+            args.host,
+            "--headless",
+            "--only-summary",
+            "--users",
+            str(users),
+            "--spawn-rate",
+            str(min(spawn_rate, users)),
+            "--run-time",
+            args.duration,
+            "--dataset",
+            str(args.dataset),
+            "--report",
+            str(report),
+            *user_classes,
+        ],
+        # locust exits with 1 when requests failed; the report says which
+        check=False,
+    )
+    return json.loads(report.read_text())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)"
+    )
+    parser.add_argument("--host", default="http://localhost:50000")
+    parser.add_argument("--duration", default="1m")
+    parser.add_argument(
+        "--users", type=int, default=0, help="override the scenario's users"
+    )
+    parser.add_argument("--dataset", type=Path, default=HERE / "dataset.json")
+    parser.add_argument("--out-dir", type=Path, default=HERE / "results")
+    args = parser.parse_args()
+    if unknown := set(args.scenarios) - set(SCENARIOS):
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    summary = {}
+    for name in args.scenarios or SCENARIOS:
+        total = run_scenario(name, args)["total"]
+        summary[name] = total
+        print(
+            f"{name:<8} {total['rps']:>8.1f} rps  p50 {total['p50']:>6} ms  "
+            f"p95 {total['p95']:>6} ms  p99 {total['p99']:>6} ms  "
+            f"failures {total['failures']}"
+        )
+    (args.out_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Seeds the database of the local docker-compose stack with a benchmark
+dataset (queues x entries x users) and writes the manifest the load
+scenarios read (`benchmarks/load/locustfile.py`).
+
+All benchmark users share one password and are named `bench-<n>@example.com`,
+benchmark queues are named `bench<n>`; `--reset` deletes both (entries and
+tag links go with them through ON DELETE CASCADE). Rows are written with
+executemany INSERTs in batches, so large datasets take seconds.
+
+Usage (docker-compose stack running, migrations applied,
+APP_CONFIG__ env set with APP_CONFIG__DB__URL pointing at localhost:5432):
+    PYTHONPATH=fastapi_application python benchmarks/load/seed.py --reset
+    PYTHONPATH=fastapi_application python benchmarks/load/seed.py --reset \
+        --queues 500 --entries 20 --users 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import batched
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from fastapi_users.password import PasswordHelper
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.db_helper import db_helper
+from domains.queues import Queue, QueueEntries
+from domains.users import User
+
+DEFAULT_MANIFEST = Path(__file__).with_name("dataset.json")
+BATCH_SIZE = 5000
+# the `check_position_range` constraint of queue entries
+MAX_POSITION = 30
+
+
+def user_rows(users: int, password_hash: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": uuid4(),
+            "email": f"bench-{i}@example.com",
+            "hashed_password": password_hash,
+            "is_active": True,
+            "is_superuser": False,
+            "is_verified": True,
+            "first_name": f"Bench{i}",
+            "last_name": "User",
+        }
+        for i in range(users)
+    ]
+
+
+def queue_rows(queues: int, max_slots: int) -> list[dict[str, Any]]:
+    # future start times, as required by the `check_event_date` constraint
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+    return [
+        {
+            "name": f"bench{i}",
+            "start_time": start + timedelta(minutes=i),
+            "max_slots": max_slots,
+        }
+        for i in range(queues)
+    ]
+
+
+def entry_rows(
+    queue_ids: list[int],
+    user_ids: list[Any],
+    entries: int,
+) -> list[dict[str, Any]]:
+    # users are taken round-robin, so no user appears twice in a queue
+    return [
+        {
+            "queue_id": queue_id,
+            "user_id": user_ids[(n * entries + position) % len(user_ids)],
+            "position": position + 1,
+        }
+        for n, queue_id in enumerate(queue_ids)
+        for position in range(entries)
+    ]
+
+
+async def insert_rows(
+    connection: AsyncConnection,
+    model: Any,
+    rows: list[dict[str, Any]],
+    returning: Any = None,
+) -> list[Any]:
+    values = []
+    for batch in batched(rows, BATCH_SIZE):
+        stmt = insert(model)
+        if returning is None:
+            await connection.execute(stmt, list(batch))
+            continue
+        result = await connection.execute(
+            stmt.returning(returning, sort_by_parameter_order=True), list(batch)
+        )
+        values.extend(result.scalars().all())
+    return values
+
+
+async def seed(args: argparse.Namespace) -> dict[str, Any]:
+    password_hash = PasswordHelper().hash(args.password)
+
+    async with db_helper.engine.begin() as connection:
+        if args.reset:
+            await connection.execute(
+                delete(User).where(User.email.like("bench-%@example.com"))
+            )
+            await connection.execute(delete(Queue).where(Queue.name.like("bench%")))
+
+        users = user_rows(args.users, password_hash)
+        await insert_rows(connection, User, users)
+        queue_ids = await insert_rows(
+            connection,
+            Queue,
+            queue_rows(args.queues, args.max_slots),
+            returning=Queue.id,
+        )
+        await insert_rows(
+            connection,
+            QueueEntries,
+            entry_rows(queue_ids, [user["id"] for user in users], args.entries),
+        )
+
+    await db_helper.dispose()
+    return {
+        "password": args.password,
+        "users": [user["email"] for user in users],
+        "queue_ids": queue_ids,
+        "entries_per_queue": args.entries,
+        "max_slots": args.max_slots,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--queues", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=10, help="per queue")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument(
+        "--max-slots",
+        type=int,
+        default=MAX_POSITION,
+        help="slots per queue; the rest after --entries is left for the rush",
+    )
+    parser.add_argument("--password", default="bench-password")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument(
+        "--reset", action="store_true", help="delete the previous dataset first"
+    )
+    args = parser.parse_args()
+
+    if not 0 <= args.entries <= min(args.max_slots, MAX_POSITION, args.users):
+        parser.error("--entries must be at most --max-slots, 30 and --users")
+
+    started = time.perf_counter()
+    manifest = asyncio.run(seed(args))
+    args.manifest.write_text(json.dumps(manifest, indent=2))
+    print(
+        f"seeded {args.users} users, {args.queues} queues and "
+        f"{args.queues * args.entries} entries in "
+        f"{time.perf_counter() - started:.1f}s -> {args.manifest}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Runs the micro-benchmarks of the repository and serialization layers
+(tests/benchmarks, pytest-benchmark), saves baselines and compares a run
+against them, failing when a benchmark got slower than the threshold.
+
+Baselines are stored in benchmarks/baselines, grouped by machine
+(platform, interpreter and its version) by pytest-benchmark, so save them
+on the machine that compares, e.g. the CI runner; `compare` exits with
+status 2 when that machine has no baseline yet. The benchmarks use the
+test database of tests/conftest.py (APP_CONFIG__TEST_DB__URL).
+Unknown arguments are passed on to pytest.
+
+Usage (APP_CONFIG__ env set):
+    python benchmarks/micro.py save
+    python benchmarks/micro.py compare --threshold 10
+    python benchmarks/micro.py compare --against 0003 --stat mean -k schemas
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+TESTS = ROOT / "tests" / "benchmarks"
+STORAGE = Path(__file__).resolve().parent / "baselines"
+NO_BASELINE = 2
+
+
+def find_baseline(against: str | None) -> Path | None:
+    """
+    Finds the baseline a run of this machine would be compared to.
+
+    Args:
+        against (str | None): The baseline run number, or None for the latest.
+
+    Returns:
+        Path | None: The baseline file, or None if there is none.
+    """
+    from pytest_benchmark.utils import get_machine_id
+
+    pattern = f"{against}_*.json" if against is not None else "*.json"
+    baselines = sorted((STORAGE / get_machine_id()).glob(pattern))
+    return baselines[-1] if baselines else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save = commands.add_parser("save", help="run and store a new baseline")
+    save.add_argument("--name", default="baseline")
+
+    compare = commands.add_parser("compare", help="run and compare to a baseline")
+    compare.add_argument(
+        "--against",
+        default=None,
+        help="the baseline run number (e.g. 0003), the latest one by default",
+    )
+    compare.add_argument(
+        "--threshold",
+        type=int,
+        default=10,
+        help="the allowed slowdown, in whole percent",
+    )
+    compare.add_argument(
+        "--stat",
+        choices=["min", "max", "mean", "median"],
+        default="median",
+    )
+    args, pytest_args = parser.parse_known_args()
+
+    options = [
+        str(TESTS),
+        "--benchmark-only",
+        f"--benchmark-storage=file://{STORAGE}",
+        "--benchmark-sort=name",
+    ]
+    if args.command == "save":
+        options.append(f"--benchmark-save={args.name}")
+    else:
+        baseline = find_baseline(args.against)
+        if baseline is None:
+            print(
+                f"No baseline for this machine in {STORAGE}; "
+                "record one with `python benchmarks/micro.py save` first.",
+                file=sys.stderr,
+            )
+            return NO_BASELINE
+        run_number = baseline.name.partition("_")[0]
+        options += [
+            f"--benchmark-compare={run_number}",
+            f"--benchmark-compare-fail={args.stat}:{args.threshold}%",
+        ]
+    return pytest.main(options + pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
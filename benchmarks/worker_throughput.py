@@ -0,0 +1,90 @@
+"""
+Measures how many log tasks per second a single Celery worker process
+can execute, with and without the persistent worker context.
+
+The task bodies are executed in-process (no broker), so the numbers
+isolate the per-task overhead of the event loop and the MongoDB client.
+Logs are written to a throwaway database that is dropped afterwards.
+
+Usage (MongoDB from docker-compose must be running, APP_CONFIG__ env set):
+    PYTHONPATH=fastapi_application python benchmarks/worker_throughput.py
+    PYTHONPATH=fastapi_application python benchmarks/worker_throughput.py \
+        --tasks 5000 --db-name worker_benchmark
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from tasks.tasks import process_log
+from tasks.worker import get_worker_context
+
+from core.config import settings
+from core.mongodb.connection import get_mongo_manager
+from core.mongodb.schemas import ActionLog
+
+
+def make_log() -> dict[str, Any]:
+    return {
+        "action": "POST",
+        "parameters": {"queue_id": 1, "position": 1},
+        "status": "success",
+        "timestamp": datetime.now(timezone.utc),
+        "collection_name": "queue_entries",
+    }
+
+
+def run_per_task_loop() -> None:
+    """
+    The previous behaviour: a new event loop and a new client per task.
+    """
+
+    async def process(log_data: dict[str, Any]) -> None:
+        collection_name = log_data.pop("collection_name")
+        manager = get_mongo_manager()
+        collection = manager.get_collection(collection_name)
+        await collection.insert_one(ActionLog(**log_data).model_dump())
+        manager.client.close()
+
+    asyncio.run(process(make_log()))
+
+
+def run_persistent_context() -> None:
+    """
+    The current behaviour: the task body runs on the worker context.
+    """
+    process_log.run(make_log())
+
+
+def measure(name: str, run_task: Callable[[], None], tasks: int) -> float:
+    run_task()  # warm-up
+    started = time.perf_counter()
+    for _ in range(tasks):
+        run_task()
+    elapsed = time.perf_counter() - started
+    rate = tasks / elapsed
+    print(f"{name:<20} {tasks:>7} tasks {elapsed:>8.2f} s {rate:>10.1f} tasks/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--db-name", default="worker_benchmark")
+    args = parser.parse_args()
+
+    settings.mongo.db_name = args.db_name
+
+    before = measure("per-task loop", run_per_task_loop, args.tasks)
+    after = measure("persistent context", run_persistent_context, args.tasks)
+    print(f"speed-up: x{after / before:.1f}")
+
+    context = get_worker_context()
+    context.run(context.mongo.client.drop_database(args.db_name))
+    context.close()
+
+
+if __name__ == "__main__":
+    main()
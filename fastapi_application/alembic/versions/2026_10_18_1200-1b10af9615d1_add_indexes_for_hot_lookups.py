@@ -0,0 +1,54 @@
+"""add indexes for hot lookups
+
+Revision ID: 1b10af9615d1
+Revises: ba8ae0b8fdcb
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1b10af9615d1"
+down_revision: Union[str, None] = "ba8ae0b8fdcb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns)
+INDEXES = [
+    # "my queues" lookups and the cascade on user delete
+    ("ix_queue_entries_user_id", "queue_entries", ["user_id"]),
+    # the cascade on tag delete and tag -> queues lookups
+    ("ix_queue_tags_tag_id", "queue_tags", ["tag_id"]),
+    # keyset pagination and time-window filters of the queue listing
+    ("ix_queues_start_time_id", "queues", ["start_time", "id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction;
+    # IF NOT EXISTS lets a rerun skip indexes built before an interruption
+    # (an interrupted build leaves an INVALID index that must be dropped first)
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
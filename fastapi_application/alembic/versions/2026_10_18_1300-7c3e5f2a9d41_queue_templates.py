@@ -0,0 +1,88 @@
+"""queue templates
+
+Revision ID: 7c3e5f2a9d41
+Revises: 1b10af9615d1
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e5f2a9d41"
+down_revision: Union[str, None] = "1b10af9615d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "queue_templates",
+        sa.Column("name", sa.String(length=10), nullable=False),
+        sa.Column("max_slots", sa.Integer(), nullable=False),
+        sa.Column("next_start_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("interval_days", sa.Integer(), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.CheckConstraint(
+            "max_slots BETWEEN 1 AND 40",
+            name=op.f("ck_queue_templates_check_template_position_number"),
+        ),
+        sa.CheckConstraint(
+            "interval_days >= 1",
+            name=op.f("ck_queue_templates_check_template_interval"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_queue_templates")),
+    )
+    op.create_index(
+        "ix_queue_templates_active_next_start_time",
+        "queue_templates",
+        ["active", "next_start_time"],
+        unique=False,
+    )
+    op.create_table(
+        "queue_template_tags",
+        sa.Column("template_id", sa.Integer(), nullable=False),
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.ForeignKeyConstraint(
+            ["template_id"],
+            ["queue_templates.id"],
+            name=op.f("fk_queue_template_tags_template_id_queue_templates"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["tag_id"],
+            ["tags.id"],
+            name=op.f("fk_queue_template_tags_tag_id_tags"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_queue_template_tags")),
+        sa.UniqueConstraint(
+            "template_id",
+            "tag_id",
+            name=op.f("uq_template_tag"),
+        ),
+    )
+    op.create_index(
+        op.f("ix_queue_template_tags_tag_id"),
+        "queue_template_tags",
+        ["tag_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_queue_template_tags_tag_id"), table_name="queue_template_tags"
+    )
+    op.drop_table("queue_template_tags")
+    op.drop_index(
+        "ix_queue_templates_active_next_start_time", table_name="queue_templates"
+    )
+    op.drop_table("queue_templates")
@@ -0,0 +1,112 @@
+"""queue archive tables
+
+Revision ID: 4e9a1c7b2f60
+Revises: 7c3e5f2a9d41
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import fastapi_users_db_sqlalchemy
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e9a1c7b2f60"
+down_revision: Union[str, None] = "7c3e5f2a9d41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "queues_archive",
+        sa.Column("name", sa.String(length=10), nullable=False),
+        sa.Column("start_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("max_slots", sa.Integer(), nullable=False),
+        sa.Column("taken_slots", sa.Integer(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_queues_archive")),
+    )
+    op.create_index(
+        "ix_queues_archive_start_time_id",
+        "queues_archive",
+        ["start_time", "id"],
+        unique=False,
+    )
+    op.create_table(
+        "queue_entries_archive",
+        sa.Column("queue_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "user_id",
+            fastapi_users_db_sqlalchemy.generics.GUID(),
+            nullable=False,
+        ),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.ForeignKeyConstraint(
+            ["queue_id"],
+            ["queues_archive.id"],
+            name=op.f("fk_queue_entries_archive_queue_id_queues_archive"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            name=op.f("fk_queue_entries_archive_user_id_user"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_queue_entries_archive")),
+    )
+    op.create_index(
+        op.f("ix_queue_entries_archive_queue_id"),
+        "queue_entries_archive",
+        ["queue_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_queue_entries_archive_user_id"),
+        "queue_entries_archive",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_table(
+        "queue_tags_archive",
+        sa.Column("queue_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=15), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.ForeignKeyConstraint(
+            ["queue_id"],
+            ["queues_archive.id"],
+            name=op.f("fk_queue_tags_archive_queue_id_queues_archive"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_queue_tags_archive")),
+    )
+    op.create_index(
+        op.f("ix_queue_tags_archive_queue_id"),
+        "queue_tags_archive",
+        ["queue_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_queue_tags_archive_queue_id"), table_name="queue_tags_archive"
+    )
+    op.drop_table("queue_tags_archive")
+    op.drop_index(
+        op.f("ix_queue_entries_archive_user_id"), table_name="queue_entries_archive"
+    )
+    op.drop_index(
+        op.f("ix_queue_entries_archive_queue_id"), table_name="queue_entries_archive"
+    )
+    op.drop_table("queue_entries_archive")
+    op.drop_index("ix_queues_archive_start_time_id", table_name="queues_archive")
+    op.drop_table("queues_archive")
@@ -4,14 +4,24 @@ __all__ = [
     "get_tags_service",
     "get_queue_tags_service",
     "get_queue_entries_service",
+    "get_queue_template_service",
+    "get_queue_read_service",
+    "get_queue_detail_service",
+    "get_tags_read_service",
+    "get_queue_tags_read_service",
     "current_user",
     "current_super_user",
     "fastapi_users",
 ]
 from .services import (
+    get_queue_detail_service,
     get_queue_entries_service,
+    get_queue_read_service,
     get_queue_service,
+    get_queue_tags_read_service,
     get_queue_tags_service,
+    get_queue_template_service,
+    get_tags_read_service,
     get_tags_service,
     get_user_service,
 )
@@ -1,5 +1,6 @@
+from core.config import settings
 from core.factories import get_service_by_model
-from domains.queues import Queue, QueueEntries, QueueTags
+from domains.queues import Queue, QueueEntries, QueueTags, QueueTemplate
 from domains.tags import Tags
 from domains.users import User
 
@@ -23,6 +24,10 @@ Factories:
     get_tags_service: Creates a service instance for Tags.
     get_queue_tags_service: Creates a service instance for QueueTags.
     get_queue_service: Creates a service instance for Queue.
+    get_queue_template_service: Creates a service instance for QueueTemplate.
+    get_tags_read_service, get_queue_tags_read_service, get_queue_read_service:
+    The same services for read-only routes, backed by a read replica.
+    get_queue_detail_service: Serves the queue detail route.
 """
 
 get_user_service = get_service_by_model(User)
@@ -39,3 +44,23 @@ get_queue_tags_service = get_service_by_model(QueueTags)
 
 get_queue_service = get_service_by_model(Queue)
 """Creates a service instance for Queue."""
+
+get_queue_template_service = get_service_by_model(QueueTemplate)
+"""Creates a service instance for QueueTemplate."""
+
+get_tags_read_service = get_service_by_model(Tags, read_only=True)
+"""Creates a Tags service for read-only routes."""
+
+get_queue_tags_read_service = get_service_by_model(QueueTags, read_only=True)
+"""Creates a QueueTags service for read-only routes."""
+
+get_queue_read_service = get_service_by_model(Queue, read_only=True)
+"""Creates a Queue service for read-only routes."""
+
+# The detail payload is cached under the version current at the time of
+# the read; a miss filled from a lagging replica would be cached as the
+# post-write payload, so with the cache on misses are read from the primary.
+get_queue_detail_service = (
+    get_queue_service if settings.cache.enabled else get_queue_read_service
+)
+"""Creates a Queue service for the queue detail route."""
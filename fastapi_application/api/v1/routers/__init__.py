@@ -4,7 +4,9 @@ from core.config import settings
 
 from .auth import router as auth_router
 from .health import router as health_router
+from .queue_events import router as queue_events_router
 from .queue_tag import router as queue_tag_router
+from .queue_templates import router as queue_templates_router
 from .queues import router as queues_views_router
 from .queues_entries import router as queues_entries_views_router
 from .tags import router as tags_router
@@ -17,8 +19,10 @@ router.include_router(custom_router)
 router.include_router(auth_router)
 router.include_router(queues_views_router)
 router.include_router(queues_entries_views_router)
+router.include_router(queue_events_router)
 router.include_router(tags_router)
 router.include_router(queue_tag_router)
+router.include_router(queue_templates_router)
 router.include_router(health_router)
 
 __all__ = ["router"]
@@ -1,8 +1,18 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi_users import BaseUserManager, exceptions
+from starlette import status
 
 from api.dependencies import fastapi_users
-from core.auth import auth_backend
-from domains.users import UserCreate, UserRead
+from core.auth import (
+    JWTAccessStrategy,
+    auth_backend,
+    get_jwt_strategy,
+    get_user_manager,
+)
+from core.config import settings
+from domains.users import RefreshTokenRequest, UserCreate, UserRead
 
 router = APIRouter(
     prefix="/auth",
@@ -24,3 +34,33 @@ router.include_router(
         UserCreate,
     )
 )
+
+
+if settings.access_token.strategy == "jwt":
+
+    @router.post("/refresh")
+    async def refresh(
+        body: RefreshTokenRequest,
+        user_manager: Annotated[BaseUserManager, Depends(get_user_manager)],
+        strategy: Annotated[JWTAccessStrategy, Depends(get_jwt_strategy)],
+    ) -> Response:
+        """
+        Exchanges a refresh token for a new access and refresh token pair.
+
+        The user is reloaded, so changed permissions take effect.
+        The refresh token can only be used once.
+        """
+        user = None
+        user_id = await strategy.consume_refresh_token(body.refresh_token)
+        if user_id is not None:
+            try:
+                user = await user_manager.get(user_manager.parse_id(user_id))
+            except (exceptions.UserNotExists, exceptions.InvalidID):
+                pass
+
+        if user is None or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
+        return await auth_backend.login(strategy, user)
@@ -0,0 +1,72 @@
+from typing import Annotated, AsyncGenerator
+
+import orjson
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import current_user, get_queue_service
+from core.broadcast import Subscription, queue_broadcaster
+from core.config import settings
+from domains.queues import QueueService
+from domains.users import User
+
+router = APIRouter(
+    prefix="/queues",
+    tags=["queue_events"],
+)
+
+
+async def stream_events(
+    subscription: Subscription,
+    snapshot: bytes,
+) -> AsyncGenerator[bytes]:
+    """
+    Streams a queue snapshot followed by occupancy deltas as server-sent events.
+
+    The stream ends after a `queue_closed` event (the queue was deleted
+    or archived), so clients do not wait on a queue that is gone.
+
+    Args:
+        subscription (Subscription): The subscription to read deltas from.
+        snapshot (bytes): The serialized `GetQueueWithEntries` payload.
+
+    Yields:
+        bytes: SSE-formatted messages, with keep-alive comments when idle.
+    """
+    try:
+        yield b'data: {"type":"snapshot","queue":' + snapshot + b"}\n\n"
+        while True:
+            event = await subscription.get(settings.broadcast.heartbeat_seconds)
+            if event is None:
+                yield b": keep-alive\n\n"
+            else:
+                yield b"data: " + event + b"\n\n"
+                if orjson.loads(event)["type"] == "queue_closed":
+                    return
+    finally:
+        queue_broadcaster.unsubscribe(subscription)
+
+
+@router.get(
+    "/{queue_id}/events",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def get_queue_events(
+    queue_id: int,
+    user: Annotated[User, Depends(current_user)],
+    service: Annotated[QueueService, Depends(get_queue_service)],
+):
+    # subscribe before reading the snapshot so no delta falls in between
+    subscription = queue_broadcaster.subscribe(queue_id)
+    try:
+        snapshot = await service.get_with_entries(queue_id)
+    except Exception:
+        queue_broadcaster.unsubscribe(subscription)
+        raise
+
+    return StreamingResponse(
+        stream_events(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
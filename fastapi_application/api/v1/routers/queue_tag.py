@@ -1,9 +1,15 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends
 from starlette import status
 
-from api.dependencies import current_super_user, current_user, get_queue_tags_service
+from api.dependencies import (
+    current_super_user,
+    current_user,
+    get_queue_tags_read_service,
+    get_queue_tags_service,
+)
+from core.base import MAX_BULK_ITEMS, BulkDelete, BulkResults
 from domains.tags import CreateTagQueue, TagsService
 from domains.users import User
 
@@ -19,7 +25,7 @@ router = APIRouter(
 )
 async def get_tag_queue(
     user: Annotated[User, Depends(current_user)],
-    service: Annotated[TagsService, Depends(get_queue_tags_service)],
+    service: Annotated[TagsService, Depends(get_queue_tags_read_service)],
 ):
     return await service.get_all()
 
@@ -37,6 +43,39 @@ async def create_tag_queue(
     return await service.create(tag_queue_to_create.model_dump())
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+async def create_tag_queues(
+    tag_queues_to_create: Annotated[
+        list[CreateTagQueue],
+        Body(min_length=1, max_length=MAX_BULK_ITEMS),
+    ],
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[TagsService, Depends(get_queue_tags_service)],
+):
+    queue_tags = await service.create_many(
+        [tag_queue.model_dump() for tag_queue in tag_queues_to_create]
+    )
+    return BulkResults.created(queue_tags)
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+async def delete_tag_queues(
+    tag_queues_to_delete: BulkDelete,
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[TagsService, Depends(get_queue_tags_service)],
+):
+    deleted = await service.delete_many(tag_queues_to_delete.ids)
+    return BulkResults.deleted(tag_queues_to_delete.ids, deleted)
+
+
 @router.delete(
     "/{ queue_tag_id }",
     status_code=status.HTTP_204_NO_CONTENT,
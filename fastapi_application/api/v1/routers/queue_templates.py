@@ -0,0 +1,56 @@
+from typing import Annotated, List
+
+from fastapi import APIRouter, Depends, Path, status
+
+from api.dependencies import (
+    current_super_user,
+    get_queue_template_service,
+)
+from domains.queues import (
+    CreateQueueTemplate,
+    GetQueueTemplate,
+    QueueTemplateService,
+)
+from domains.users import User
+
+router = APIRouter(
+    tags=["queue_templates"],
+    prefix="/queue_templates",
+)
+
+
+@router.post(
+    "",
+    response_model=GetQueueTemplate,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_queue_template(
+    template_to_create: CreateQueueTemplate,
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[QueueTemplateService, Depends(get_queue_template_service)],
+):
+    return await service.create(template_to_create.model_dump())
+
+
+@router.get(
+    "",
+    response_model=List[GetQueueTemplate],
+    status_code=status.HTTP_200_OK,
+)
+async def get_queue_templates(
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[QueueTemplateService, Depends(get_queue_template_service)],
+):
+    return await service.get_all()
+
+
+@router.delete(
+    "/{template_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_queue_template(
+    template_id: Annotated[int, Path(..., ge=1)],
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[QueueTemplateService, Depends(get_queue_template_service)],
+):
+    return await service.delete({"id": template_id})
@@ -1,15 +1,24 @@
-from typing import Annotated, List
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, Query, Response, status
 
-from api.dependencies import current_super_user, current_user, get_queue_service
+from api.dependencies import (
+    current_super_user,
+    current_user,
+    get_queue_detail_service,
+    get_queue_read_service,
+    get_queue_service,
+)
+from core.base import MAX_BULK_ITEMS, BulkDelete, BulkResults
 from domains.queues import QueueService
 from domains.queues.schemas.queues import (
     CreateQueue,
-    GetQueue,
+    GetQueuesPage,
     GetQueueWithEntries,
     PutQueue,
 )
+from domains.queues.serializers import dump_queues_page
 from domains.users import User
 from utils.logger import log_action
 
@@ -21,14 +30,33 @@ router = APIRouter(
 
 @router.get(
     "",
-    response_model=List[GetQueue],
+    response_model=GetQueuesPage,
     status_code=status.HTTP_200_OK,
 )
 async def get_queues(
-    service: Annotated[QueueService, Depends(get_queue_service)],
+    service: Annotated[QueueService, Depends(get_queue_read_service)],
     user: Annotated[User, Depends(current_user)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: str | None = None,
+    name: str | None = None,
+    tag: str | None = None,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    include_archived: bool = False,
 ):
-    return await service.get_all()
+    queues, next_cursor = await service.get_page(
+        limit,
+        cursor,
+        name=name,
+        tag=tag,
+        start_from=start_from,
+        start_to=start_to,
+        include_archived=include_archived,
+    )
+    return Response(
+        content=dump_queues_page(queues, next_cursor),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -49,6 +77,49 @@ async def create_queue(
     return await service.create(queue_to_create.model_dump())
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+@log_action(
+    "POST",
+    "queues",
+    ("user",),
+)
+async def create_queues(
+    queues_to_create: Annotated[
+        list[CreateQueue],
+        Body(min_length=1, max_length=MAX_BULK_ITEMS),
+    ],
+    service: Annotated[QueueService, Depends(get_queue_service)],
+    user: Annotated[User, Depends(current_user)],
+):
+    queues = await service.create_many(
+        [queue.model_dump() for queue in queues_to_create]
+    )
+    return BulkResults.created(queues)
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+@log_action(
+    "DELETE",
+    "queues",
+    ("queues_to_delete", "user"),
+)
+async def delete_queues(
+    queues_to_delete: BulkDelete,
+    service: Annotated[QueueService, Depends(get_queue_service)],
+    user: Annotated[User, Depends(current_super_user)],
+):
+    deleted = await service.delete_many(queues_to_delete.ids)
+    return BulkResults.deleted(queues_to_delete.ids, deleted)
+
+
 @router.get(
     "/{queue_id}",
     response_model=GetQueueWithEntries | None,
@@ -57,9 +128,13 @@ async def create_queue(
 async def get_queue_with_entries(
     queue_id: int,
     user: Annotated[User, Depends(current_user)],
-    service: Annotated[QueueService, Depends(get_queue_service)],
+    service: Annotated[QueueService, Depends(get_queue_detail_service)],
+    include_archived: bool = False,
 ):
-    return await service.get_by_id(queue_id)
+    return Response(
+        content=await service.get_with_entries(queue_id, include_archived),
+        media_type="application/json",
+    )
 
 
 @router.put(
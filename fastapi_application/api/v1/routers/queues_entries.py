@@ -1,13 +1,14 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, status
 
 from api.dependencies import (
     current_super_user,
     current_user,
     get_queue_entries_service,
 )
-from domains.queues import CreateQueueEntry, QueueEntryService
+from core.base import MAX_BULK_ITEMS, BulkDelete, BulkResults
+from domains.queues import AssignQueueEntry, CreateQueueEntry, QueueEntryService
 from domains.users import User
 from utils.logger import log_action
 
@@ -32,6 +33,12 @@ async def create_queue_entry(
     service: Annotated[QueueEntryService, Depends(get_queue_entries_service)],
     user: Annotated[User, Depends(current_user)],
 ):
+    if queue_entry_to_create.position is None:
+        return await service.create_in_free_slot(
+            queue_entry_to_create.queue_id,
+            user.id,
+        )
+
     return await service.create(
         {
             **queue_entry_to_create.model_dump(),
@@ -40,6 +47,49 @@ async def create_queue_entry(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+@log_action(
+    "POST",
+    "queue_entries",
+    ("user",),
+)
+async def create_queue_entries(
+    queue_entries_to_create: Annotated[
+        list[AssignQueueEntry],
+        Body(min_length=1, max_length=MAX_BULK_ITEMS),
+    ],
+    service: Annotated[QueueEntryService, Depends(get_queue_entries_service)],
+    user: Annotated[User, Depends(current_super_user)],
+):
+    entries = await service.create_many(
+        [entry.model_dump() for entry in queue_entries_to_create]
+    )
+    return BulkResults.created(entries)
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+@log_action(
+    "DELETE",
+    "queue_entries",
+    ("queue_entries_to_delete", "user"),
+)
+async def delete_queue_entries(
+    queue_entries_to_delete: BulkDelete,
+    service: Annotated[QueueEntryService, Depends(get_queue_entries_service)],
+    user: Annotated[User, Depends(current_super_user)],
+):
+    deleted = await service.delete_many(queue_entries_to_delete.ids)
+    return BulkResults.deleted(queue_entries_to_delete.ids, deleted)
+
+
 @router.delete(
     "/{queue_id}",
     status_code=status.HTTP_204_NO_CONTENT,
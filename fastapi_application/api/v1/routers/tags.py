@@ -1,8 +1,14 @@
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, status
 
-from api.dependencies import current_super_user, current_user, get_tags_service
+from api.dependencies import (
+    current_super_user,
+    current_user,
+    get_tags_read_service,
+    get_tags_service,
+)
+from core.base import MAX_BULK_ITEMS, BulkDelete, BulkResults
 from domains.tags import CreateTag, GetTag, PatchTag, TagsService
 from domains.users import User
 
@@ -25,13 +31,44 @@ async def create_tag(
     return await service.create(tag_to_create.model_dump())
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+async def create_tags(
+    tags_to_create: Annotated[
+        list[CreateTag],
+        Body(min_length=1, max_length=MAX_BULK_ITEMS),
+    ],
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[TagsService, Depends(get_tags_service)],
+):
+    tags = await service.create_many([tag.model_dump() for tag in tags_to_create])
+    return BulkResults.created(tags)
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkResults,
+    status_code=status.HTTP_200_OK,
+)
+async def delete_tags(
+    tags_to_delete: BulkDelete,
+    user: Annotated[User, Depends(current_super_user)],
+    service: Annotated[TagsService, Depends(get_tags_service)],
+):
+    deleted = await service.delete_many(tags_to_delete.ids)
+    return BulkResults.deleted(tags_to_delete.ids, deleted)
+
+
 @router.get(
     "",
     response_model=List[GetTag],
     status_code=status.HTTP_200_OK,
 )
 async def get_tags(
-    service: Annotated[TagsService, Depends(get_tags_service)],
+    service: Annotated[TagsService, Depends(get_tags_read_service)],
     user: Annotated[User, Depends(current_user)],
 ):
     return await service.get_all()
@@ -1,7 +1,12 @@
 __all__ = [
+    "JWTAccessStrategy",
     "auth_backend",
+    "get_jwt_strategy",
     "get_user_manager",
+    "revocation_list",
 ]
 
 from .backend import auth_backend
+from .revocation import revocation_list
+from .strategy import JWTAccessStrategy, get_jwt_strategy
 from .user_manager import get_user_manager
@@ -1,12 +1,41 @@
 # type: ignore
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
 from fastapi_users.authentication import AuthenticationBackend
 
-from .strategy import get_redis_strategy
+from core.config import settings
+
+from .strategy import JWTAccessStrategy, get_jwt_strategy, get_redis_strategy
 from .transport import bearer_transport
 
-# Configure authentication backend using Redis
-auth_backend = AuthenticationBackend(
-    name="redis",
-    transport=bearer_transport,
-    get_strategy=get_redis_strategy,
-)
+
+class RefreshableAuthenticationBackend(AuthenticationBackend):
+    """
+    Authentication backend whose login response also carries a refresh token.
+    """
+
+    async def login(self, strategy: JWTAccessStrategy, user) -> Response:
+        access_token, refresh_token = await strategy.write_tokens(user)
+        return ORJSONResponse(
+            {
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "token_type": "bearer",
+            }
+        )
+
+
+if settings.access_token.strategy == "jwt":
+    # Signed access tokens verified locally, refresh tokens in Redis
+    auth_backend = RefreshableAuthenticationBackend(
+        name="jwt",
+        transport=bearer_transport,
+        get_strategy=get_jwt_strategy,
+    )
+else:
+    # Configure authentication backend using Redis
+    auth_backend = AuthenticationBackend(
+        name="redis",
+        transport=bearer_transport,
+        get_strategy=get_redis_strategy,
+    )
@@ -0,0 +1,249 @@
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Iterator
+
+import redis.asyncio
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.pubsub import listen, redis_client
+
+log = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    A fixed-size bloom filter: no false negatives, rare false positives.
+    """
+
+    def __init__(self, size_bits: int, hashes: int):
+        self.size_bits = size_bits
+        self.hashes = hashes
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8])
+        h2 = int.from_bytes(digest[8:]) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevocationList:
+    """
+    Revoked access tokens and users, stored in Redis and mirrored
+    in a local bloom filter.
+
+    A token is revoked by its `jti` (logout); a user is revoked by time,
+    which rejects every token issued to them before that moment (permission
+    changes). Most tokens are not revoked, so most checks are answered by
+    the bloom filter alone; only bloom hits are confirmed in Redis.
+    Revocations reach every worker through a pub/sub channel, and the
+    filter is rebuilt from Redis on (re)connect and every `rebuild_seconds`,
+    so expired revocations eventually leave it. While the channel is not
+    connected, every check goes to Redis.
+
+    Attributes:
+        redis (redis.asyncio.Redis): The Redis client (must not decode responses).
+        prefix (str): Prefix of the Redis keys.
+        enabled (bool): Whether the revocation list is in use.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.asyncio.Redis,
+        prefix: str,
+        channel: str,
+        bloom_bits: int,
+        bloom_hashes: int,
+        rebuild_seconds: float,
+        enabled: bool = True,
+    ):
+        """
+        Initializes the revocation list.
+
+        Args:
+            redis_client (redis.asyncio.Redis): The Redis client.
+            prefix (str): Prefix of the Redis keys.
+            channel (str): Pub/sub channel of revocations.
+            bloom_bits (int): Size of the bloom filter.
+            bloom_hashes (int): Number of hash functions of the bloom filter.
+            rebuild_seconds (float): How often the bloom filter is rebuilt.
+            enabled (bool, optional): Whether the list is in use. Defaults - True.
+        """
+        self.redis = redis_client
+        self.prefix = prefix
+        self.enabled = enabled
+        self._channel = channel
+        self._bloom_bits = bloom_bits
+        self._bloom_hashes = bloom_hashes
+        self._rebuild_seconds = rebuild_seconds
+        self._bloom = BloomFilter(bloom_bits, bloom_hashes)
+        self._rebuilding: list[str] | None = None
+        self._subscribed = False
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def _key(self, member: str) -> str:
+        return f"{self.prefix}:{member}"
+
+    async def revoke_token(self, jti: str, ttl_seconds: int) -> None:
+        """
+        Revokes a single access token until it expires.
+
+        Args:
+            jti (str): The id of the token.
+            ttl_seconds (int): Remaining lifetime of the token.
+        """
+        if ttl_seconds > 0:
+            await self._revoke(f"token:{jti}", b"1", ttl_seconds)
+
+    async def revoke_user(self, user_id: Any, ttl_seconds: int) -> None:
+        """
+        Revokes all access tokens issued to a user so far.
+
+        Args:
+            user_id (Any): The id of the user.
+            ttl_seconds (int): Lifetime of access tokens.
+        """
+        await self._revoke(f"user:{user_id}", repr(time.time()).encode(), ttl_seconds)
+
+    async def _revoke(self, member: str, value: bytes, ttl_seconds: int) -> None:
+        if not self.enabled:
+            return
+
+        self._add(member)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(member), value, ex=ttl_seconds)
+            pipe.publish(self._channel, member)
+            await pipe.execute()
+
+    async def is_revoked(self, jti: str, user_id: str, issued_at: float) -> bool:
+        """
+        Checks whether an access token has been revoked.
+
+        Args:
+            jti (str): The id of the token.
+            user_id (str): The id of the token owner.
+            issued_at (float): When the token was issued (unix time).
+
+        Returns:
+            bool: True if the token must be rejected.
+        """
+        if not self.enabled:
+            return False
+
+        token_member, user_member = f"token:{jti}", f"user:{user_id}"
+        maybe_revoked = token_member in self._bloom or user_member in self._bloom
+        if self._subscribed and not maybe_revoked:
+            return False
+
+        try:
+            token_revoked, user_revoked_at = await self.redis.mget(
+                self._key(token_member),
+                self._key(user_member),
+            )
+        except RedisError as e:
+            # without Redis, fall back to what the filter knows
+            log.warning("Revocation check failed: %s", e)
+            return maybe_revoked
+
+        return token_revoked is not None or (
+            user_revoked_at is not None and issued_at <= float(user_revoked_at)
+        )
+
+    def _add(self, member: str) -> None:
+        self._bloom.add(member)
+        if self._rebuilding is not None:
+            self._rebuilding.append(member)
+
+    async def _rebuild(self) -> None:
+        """
+        Replaces the bloom filter with one built from the revocations in Redis.
+        """
+        self._rebuilding = []
+        try:
+            bloom = BloomFilter(self._bloom_bits, self._bloom_hashes)
+            prefix = f"{self.prefix}:".encode()
+            async for key in self.redis.scan_iter(match=f"{self.prefix}:*", count=1000):
+                bloom.add(key[len(prefix) :].decode())
+            # revocations received while scanning
+            for member in self._rebuilding:
+                bloom.add(member)
+            self._bloom = bloom
+        finally:
+            self._rebuilding = None
+
+    async def start(self) -> None:
+        """
+        Starts receiving revocations and rebuilding the bloom filter.
+        """
+        if self.enabled and not self._tasks:
+            self._tasks = [
+                asyncio.create_task(
+                    listen(
+                        self.redis,
+                        self._channel,
+                        self._on_message,
+                        name="Revocation channel",
+                        on_subscribe=self._on_subscribe,
+                        on_unsubscribe=self._on_unsubscribe,
+                    )
+                ),
+                asyncio.create_task(self._rebuild_periodically()),
+            ]
+
+    async def stop(self) -> None:
+        """
+        Stops the background tasks; the Redis client is left open.
+        """
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _rebuild_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._rebuild_seconds)
+            if not self._subscribed:
+                continue
+            try:
+                await self._rebuild()
+            except RedisError as e:
+                log.warning("Revocation filter rebuild failed: %s", e)
+
+    def _on_message(self, channel: bytes, data: bytes) -> None:
+        self._add(data.decode())
+
+    async def _on_subscribe(self) -> None:
+        await self._rebuild()
+        self._subscribed = True
+
+    def _on_unsubscribe(self) -> None:
+        # revocations may be missed until we resubscribe
+        self._subscribed = False
+
+
+revocation_list = RevocationList(
+    redis_client=redis_client,
+    prefix="auth:revoked",
+    channel=settings.access_token.revocation_channel,
+    bloom_bits=settings.access_token.bloom_bits,
+    bloom_hashes=settings.access_token.bloom_hashes,
+    rebuild_seconds=settings.access_token.lifetime_seconds,
+    enabled=settings.access_token.strategy == "jwt",
+)
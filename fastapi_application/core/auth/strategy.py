@@ -1,8 +1,20 @@
 # type: ignore
+import hashlib
+import secrets
+import time
+import uuid
+
+import jwt
 import redis.asyncio
-from fastapi_users.authentication import RedisStrategy
+from fastapi_users import BaseUserManager, exceptions
+from fastapi_users.authentication import RedisStrategy, Strategy
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from redis.asyncio import Redis
 
+from core.auth.revocation import revocation_list
+from core.cache import user_cache
 from core.config import settings
+from domains.users import User
 
 """
 cr
@@ -13,11 +25,242 @@ redis = redis.asyncio.from_url(
 )
 
 
-def get_redis_strategy() -> RedisStrategy:
+class CachedRedisStrategy(RedisStrategy):
+    """
+    Redis token strategy that serves hot tokens from the in-process user cache.
+    """
+
+    async def read_token(
+        self,
+        token: str | None,
+        user_manager: BaseUserManager,
+    ) -> User | None:
+        """
+        Resolves a token to its user, skipping Redis and the database on a hit.
+
+        Args:
+            token (str | None): The access token.
+            user_manager (BaseUserManager): Loads the user on a miss.
+
+        Returns:
+            User | None: The user, or None if the token is invalid.
+        """
+        if token is None:
+            return None
+
+        user = user_cache.get(token)
+        if user is not None:
+            return user
+
+        epoch = user_cache.epoch
+        user = await super().read_token(token, user_manager)
+        if user is not None:
+            user_cache.set(token, user, epoch)
+        return user
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        """
+        Deletes a token (logout) and drops it from the cache of every worker.
+
+        Args:
+            token (str): The access token.
+            user (User): The owner of the token.
+        """
+        await super().destroy_token(token, user)
+        await user_cache.invalidate_token(token)
+
+
+class JWTAccessStrategy(Strategy[User, uuid.UUID]):
+    """
+    Signed access tokens verified locally, with opaque refresh tokens in Redis.
+
+    Access tokens are short-lived JWTs that carry everything `current_user`
+    needs (id, names, email, active/superuser/verified flags), so reading
+    one needs no Redis lookup and no SELECT; only tokens that hit the local
+    revocation bloom filter are checked in Redis. Refresh tokens are stored
+    in Redis for `refresh_lifetime_seconds` and are single-use.
+
+    Attributes:
+        redis (redis.asyncio.Redis): Stores refresh tokens.
+        secret (str): Key used to sign access tokens.
+        algorithm (str): Signing algorithm.
+        lifetime_seconds (int): Lifetime of access tokens.
+        refresh_lifetime_seconds (int): Lifetime of refresh tokens.
+    """
+
+    audience = "fastapi-users:auth"
+    refresh_key_prefix = "auth:refresh:"
+
+    def __init__(
+        self,
+        redis: Redis,
+        secret: str,
+        lifetime_seconds: int,
+        refresh_lifetime_seconds: int,
+        algorithm: str = "HS256",
+    ):
+        self.redis = redis
+        self.secret = secret
+        self.algorithm = algorithm
+        self.lifetime_seconds = lifetime_seconds
+        self.refresh_lifetime_seconds = refresh_lifetime_seconds
+
+    @staticmethod
+    def _session_id(refresh_token: str) -> str:
+        return hashlib.sha256(refresh_token.encode()).hexdigest()[:32]
+
+    def _decode(self, token: str) -> dict | None:
+        try:
+            return decode_jwt(token, self.secret, [self.audience], [self.algorithm])
+        except jwt.PyJWTError:
+            return None
+
+    async def read_token(
+        self,
+        token: str | None,
+        user_manager: BaseUserManager,
+    ) -> User | None:
+        """
+        Verifies an access token and builds its user from the claims.
+
+        Args:
+            token (str | None): The access token.
+            user_manager (BaseUserManager): Parses the user id.
+
+        Returns:
+            User | None: A transient user, or None if the token is invalid,
+            expired or revoked.
+        """
+        if token is None:
+            return None
+
+        claims = self._decode(token)
+        if claims is None:
+            return None
+
+        try:
+            user_id = user_manager.parse_id(claims["sub"])
+        except (exceptions.InvalidID, KeyError):
+            return None
+
+        if await revocation_list.is_revoked(
+            claims["jti"], claims["sub"], claims["iat"]
+        ):
+            return None
+
+        return User(
+            id=user_id,
+            email=claims["email"],
+            first_name=claims["first_name"],
+            last_name=claims["last_name"],
+            is_active=claims["is_active"],
+            is_superuser=claims["is_superuser"],
+            is_verified=claims["is_verified"],
+        )
+
+    async def write_token(self, user: User) -> str:
+        """
+        Issues an access token without a refresh token.
+
+        Args:
+            user (User): The authenticated user.
+
+        Returns:
+            str: The access token.
+        """
+        return self._access_token(user, session_id=None)
+
+    async def write_tokens(self, user: User) -> tuple[str, str]:
+        """
+        Issues an access token and a refresh token.
+
+        Args:
+            user (User): The authenticated user.
+
+        Returns:
+            tuple[str, str]: The access token and the refresh token.
+        """
+        refresh_token = secrets.token_urlsafe()
+        session_id = self._session_id(refresh_token)
+        await self.redis.set(
+            f"{self.refresh_key_prefix}{session_id}",
+            str(user.id),
+            ex=self.refresh_lifetime_seconds,
+        )
+        return self._access_token(user, session_id), refresh_token
+
+    def _access_token(self, user: User, session_id: str | None) -> str:
+        claims = {
+            "sub": str(user.id),
+            "aud": self.audience,
+            "jti": uuid.uuid4().hex,
+            "iat": time.time(),
+            "sid": session_id,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_active": user.is_active,
+            "is_superuser": user.is_superuser,
+            "is_verified": user.is_verified,
+        }
+        return generate_jwt(claims, self.secret, self.lifetime_seconds, self.algorithm)
+
+    async def consume_refresh_token(self, refresh_token: str) -> str | None:
+        """
+        Invalidates a refresh token and returns the id of its user.
+
+        Args:
+            refresh_token (str): The refresh token.
+
+        Returns:
+            str | None: The user id, or None if the token is unknown or expired.
+        """
+        user_id = await self.redis.getdel(
+            f"{self.refresh_key_prefix}{self._session_id(refresh_token)}"
+        )
+        return user_id.decode() if isinstance(user_id, bytes) else user_id
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        """
+        Logs out: revokes the access token and deletes its refresh token.
+
+        Args:
+            token (str): The access token.
+            user (User): The owner of the token.
+        """
+        claims = self._decode(token)
+        if claims is None:
+            return
+
+        await revocation_list.revoke_token(
+            claims["jti"],
+            int(claims["exp"] - time.time()) + 1,
+        )
+        if claims.get("sid"):
+            await self.redis.delete(f"{self.refresh_key_prefix}{claims['sid']}")
+
+
+def get_jwt_strategy() -> JWTAccessStrategy:
+    """
+    Creates and returns the signed access token strategy.
+
+    Returns:
+        JWTAccessStrategy: The authentication strategy instance.
+    """
+    return JWTAccessStrategy(
+        redis,
+        settings.access_token.secret.get_secret_value(),
+        lifetime_seconds=settings.access_token.lifetime_seconds,
+        refresh_lifetime_seconds=settings.redis.lifetime_seconds,
+        algorithm=settings.access_token.algorithm,
+    )
+
+
+def get_redis_strategy() -> CachedRedisStrategy:
     """
     Creates and returns a Redis-based authentication strategy.
 
     Returns:
-        RedisStrategy: The authentication strategy instance.
+        CachedRedisStrategy: The authentication strategy instance.
     """
-    return RedisStrategy(redis, settings.redis.lifetime_seconds)
+    return CachedRedisStrategy(redis, settings.redis.lifetime_seconds)
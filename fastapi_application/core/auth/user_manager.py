@@ -1,11 +1,13 @@
 import logging
 import uuid
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, UUIDIDMixin
 
 from core.auth.get_db import get_user_db
+from core.auth.revocation import revocation_list
+from core.cache import user_cache
 from core.config import settings
 from domains.users import User
 
@@ -76,6 +78,44 @@ class UserManager(
             token,
         )
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Request | None = None,
+    ) -> None:
+        """
+        Hook executed after a user is updated; drops their cached sessions
+        and revokes their access tokens.
+
+        Args:
+            user (User): The updated user.
+            update_dict (dict[str, Any]): The updated fields.
+            request (Request | None, optional): The HTTP request, if available.
+        """
+        await user_cache.invalidate_user(user.id)
+        await revocation_list.revoke_user(
+            user.id, settings.access_token.lifetime_seconds
+        )
+
+    async def on_after_delete(
+        self,
+        user: User,
+        request: Request | None = None,
+    ) -> None:
+        """
+        Hook executed after a user is deleted; drops their cached sessions
+        and revokes their access tokens.
+
+        Args:
+            user (User): The deleted user.
+            request (Request | None, optional): The HTTP request, if available.
+        """
+        await user_cache.invalidate_user(user.id)
+        await revocation_list.revoke_user(
+            user.id, settings.access_token.lifetime_seconds
+        )
+
 
 async def get_user_manager(
     user_db=Depends(get_user_db),
@@ -2,8 +2,12 @@ __all__ = [
     "Base",
     "BaseRepository",
     "BaseService",
+    "BulkDelete",
+    "BulkResults",
+    "MAX_BULK_ITEMS",
 ]
 
 from .model import Base
 from .repository import BaseRepository
+from .schemas import MAX_BULK_ITEMS, BulkDelete, BulkResults
 from .services import BaseService
@@ -1,11 +1,19 @@
-from typing import Any, Generic, Type
-
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from itertools import batched
+from typing import Any, Generic, Sequence, Type
+
+from sqlalchemy import Select, UniqueConstraint, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql.expression import and_, delete, update
 
+from core.session_context import current_session
 from core.types import TModels
 from utils.condition_builder import ConditionBuilder
+from utils.pagination import decode_cursor, encode_cursor
 
 
 class BaseRepository(Generic[TModels]):
@@ -17,15 +25,28 @@ class BaseRepository(Generic[TModels]):
 
     Attributes:
         model (Type[TModels]): The SQLAlchemy model managed by this repository.
-        session (AsyncSession): The asynchronous SQLAlchemy session.
+        session (AsyncSession): The asynchronous SQLAlchemy session; the one
+        given to the constructor, otherwise the session bound to `session_var`
+        for the current request.
+        session_var (ContextVar[AsyncSession]): Where shared repositories
+        find the session of the current request.
         condition_builder (ConditionBuilder):
         A utility for generating filtering conditions.
+        cursor_fields (tuple[str, ...]):
+        Model fields used as the keyset for cursor pagination.
+        bulk_batch_size (int): The maximum number of rows sent
+        in one multi-row INSERT by `create_many`.
     """
 
+    cursor_fields: tuple[str, ...] = ("id",)
+    # 1000 rows of a few columns stay far below asyncpg's 32767 parameters
+    bulk_batch_size: int = 1000
+    session_var: ContextVar[AsyncSession] = current_session
+
     def __init__(
         self,
         model: Type[TModels],
-        session: AsyncSession,
+        session: AsyncSession | None,
         condition_builder: "ConditionBuilder",  # Quotes for forward declaration
     ):
         """
@@ -34,15 +55,38 @@ class BaseRepository(Generic[TModels]):
 
         Args:
             model (Type[TModels]): The SQLAlchemy model associated with this repository.
-            session (AsyncSession): The asynchronous database session.
+            session (AsyncSession | None): The asynchronous database session,
+            or None for a repository shared between requests.
             condition_builder (ConditionBuilder):
             A condition builder for dynamic filtering.
         """
 
         self.model = model
-        self.session = session
+        self._session = session
         self.condition_builder = condition_builder
 
+    @property
+    def session(self) -> AsyncSession:
+        """
+        The session used by the repository.
+
+        Raises:
+            RuntimeError: If the repository is shared and no session
+            is bound to the current request.
+        """
+        if self._session is not None:
+            return self._session
+        try:
+            return self.session_var.get()
+        except LookupError:
+            raise RuntimeError(
+                f"No database session is bound to '{self.session_var.name}'"
+            ) from None
+
+    @session.setter
+    def session(self, session: AsyncSession | None) -> None:
+        self._session = session
+
     async def create(
         self,
         obj_data: dict[str, Any],
@@ -63,6 +107,143 @@ class BaseRepository(Generic[TModels]):
         await self.session.commit()
         return obj
 
+    async def create_many(
+        self,
+        objs_data: Sequence[dict[str, Any]],
+    ) -> list[TModels | IntegrityError | None]:
+        """
+        Creates many records with multi-row `INSERT ... RETURNING` statements
+        and commits them once.
+
+        Rows conflicting with a unique constraint (with existing records or
+        with an earlier row of the batch) are skipped. If the batch violates
+        any other constraint, the rows are inserted one by one, each in its
+        own savepoint, so that only the offending rows are rejected.
+
+        Args:
+            objs_data (Sequence[dict[str, Any]]):
+            Field values of the new objects.
+
+        Returns:
+            list[TModels | IntegrityError | None]: For each row of `objs_data`,
+            the created object, None if it was skipped as a duplicate, or the
+            error of the constraint (foreign key, check) that rejected it.
+        """
+
+        try:
+            async with self.session.begin_nested():
+                objs: list[TModels | IntegrityError | None] = []
+                for batch in batched(objs_data, self.bulk_batch_size):
+                    objs.extend(await self._insert_batch(batch))
+        except IntegrityError:
+            objs = [await self._insert_one(obj_data) for obj_data in objs_data]
+
+        await self.session.commit()
+        return objs
+
+    async def _insert_batch(
+        self,
+        objs_data: Sequence[dict[str, Any]],
+    ) -> list[TModels | None]:
+        """
+        Inserts rows in one round trip (SQLAlchemy turns the executemany
+        into a multi-row INSERT), skipping unique conflicts.
+
+        Skipped rows are not returned, so the returned rows are matched
+        back to `objs_data` by the columns of all unique keys of the table
+        (a row skipped for one key may share the other with an inserted row).
+        Tables without one cannot conflict and are returned in parameter order.
+
+        Args:
+            objs_data (Sequence[dict[str, Any]]): Field values of the rows.
+
+        Returns:
+            list[TModels | None]: The created objects, in the order of
+            `objs_data`; None for each skipped row.
+        """
+
+        unique_keys = self._unique_keys()
+        if not unique_keys:
+            result = await self.session.execute(
+                self._dialect_insert().returning(
+                    self.model, sort_by_parameter_order=True
+                ),
+                objs_data,
+            )
+            return list(result.scalars().all())
+
+        result = await self.session.execute(
+            self._dialect_insert().on_conflict_do_nothing().returning(self.model),
+            objs_data,
+        )
+
+        key = tuple(dict.fromkeys(field for key in unique_keys for field in key))
+        positions: defaultdict[tuple[Any, ...], deque[int]] = defaultdict(deque)
+        for position, obj_data in enumerate(objs_data):
+            positions[tuple(obj_data.get(field) for field in key)].append(position)
+
+        objs: list[TModels | None] = [None] * len(objs_data)
+        for obj in result.scalars().all():
+            # of rows sharing all keys, the first one is inserted
+            position = positions[tuple(getattr(obj, field) for field in key)]
+            objs[position.popleft()] = obj
+        return objs
+
+    async def _insert_one(
+        self,
+        obj_data: dict[str, Any],
+    ) -> TModels | IntegrityError | None:
+        """
+        Inserts a row in its own savepoint.
+
+        Args:
+            obj_data (dict[str, Any]): Field values of the row.
+
+        Returns:
+            TModels | IntegrityError | None: The created object, None if
+            the row conflicts with a unique constraint, or the error of
+            the constraint that rejected it.
+        """
+
+        try:
+            async with self.session.begin_nested():
+                result = await self.session.execute(
+                    self._dialect_insert()
+                    .values(obj_data)
+                    .on_conflict_do_nothing()
+                    .returning(self.model)
+                )
+                return result.scalar_one_or_none()
+        except IntegrityError as exc:
+            return exc
+
+    def _unique_keys(self) -> list[tuple[str, ...]]:
+        """
+        Returns the column sets of the model's unique constraints.
+
+        Returns:
+            list[tuple[str, ...]]: Column names of each unique constraint.
+        """
+
+        return [
+            tuple(column.key for column in constraint.columns)
+            for constraint in self.model.__table__.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+
+    def _dialect_insert(self) -> postgresql.Insert | sqlite.Insert:
+        """
+        Returns an INSERT construct of the session's dialect,
+        which supports `on_conflict_do_nothing`.
+
+        Returns:
+            postgresql.Insert | sqlite.Insert: The INSERT construct for the model.
+        """
+
+        if self.session.get_bind().dialect.name == "sqlite":
+            return sqlite.insert(self.model)
+        return postgresql.insert(self.model)
+
     async def get_by_id(
         self,
         obj_id: int,
@@ -92,6 +273,88 @@ class BaseRepository(Generic[TModels]):
         )
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> tuple[list[TModels], str | None]:
+        """
+        Retrieves one page of records ordered by `cursor_fields`.
+
+        Args:
+            limit (int): The maximum number of records to return.
+            cursor (str | None): The cursor returned with the previous page.
+            **filters (Any): Field-value pairs the records must match.
+
+        Returns:
+            tuple[list[TModels], str | None]: The records and the cursor
+            of the next page, or None if this page is the last one.
+        """
+
+        conditions = self.condition_builder.create_conditions(**filters)
+        query = select(self.model).filter(*conditions)
+
+        return await self._paginate(query, limit, cursor)
+
+    async def _paginate(
+        self,
+        query: Select[Any],
+        limit: int,
+        cursor: str | None,
+        *queries: Select[Any],
+    ) -> tuple[list[TModels], str | None]:
+        """
+        Applies keyset pagination on `cursor_fields` to a query and executes it.
+
+        One extra row is fetched to find out whether a next page exists,
+        so no COUNT query is needed. Further queries (of models that share
+        the cursor fields) are paginated the same way and their rows merged
+        into one page; each one is still served in index order.
+
+        Args:
+            query (Select): The query selecting the model.
+            limit (int): The maximum number of records to return.
+            cursor (str | None): The cursor returned with the previous page.
+            *queries (Select): Further queries the page is merged from.
+
+        Returns:
+            tuple[list[TModels], str | None]: The records and the next cursor.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+
+        objs = []
+        for page_query in (query, *queries):
+            entity = page_query.column_descriptions[0]["entity"]
+            columns = [getattr(entity, field) for field in self.cursor_fields]
+
+            if cursor:
+                values = decode_cursor(cursor, columns)
+                page_query = page_query.filter(tuple_(*columns) > tuple_(*values))
+
+            result = await self.session.execute(
+                page_query.order_by(*columns).limit(limit + 1),
+            )
+            objs.extend(result.scalars().all())
+
+        if queries:
+            objs.sort(
+                key=lambda obj: tuple(
+                    getattr(obj, field) for field in self.cursor_fields
+                )
+            )
+
+        if len(objs) <= limit:
+            return objs, None
+
+        objs = objs[:limit]
+        last = objs[-1]
+        return objs, encode_cursor(
+            [getattr(last, field) for field in self.cursor_fields]
+        )
+
     async def delete(
         self,
         **conditions: dict[str, Any],
@@ -124,6 +387,41 @@ class BaseRepository(Generic[TModels]):
 
         return deleted_obj
 
+    async def delete_many(
+        self,
+        obj_ids: Sequence[int],
+    ) -> list[TModels]:
+        """
+        Deletes the records with the given IDs in one
+        `DELETE ... RETURNING` statement.
+
+        Args:
+            obj_ids (Sequence[int]): The IDs of the records to delete.
+
+        Returns:
+            list[TModels]: The deleted objects; IDs without a record
+            have no object.
+        """
+
+        query_conditions = self.condition_builder.create_conditions(
+            id__in=list(obj_ids)
+        )
+        stmt = (
+            delete(self.model)
+            .filter(and_(*query_conditions))
+            .returning(
+                self.model,
+            )
+        )
+
+        result = await self.session.execute(stmt)
+        deleted_objs = list(result.scalars().all())
+
+        if deleted_objs:
+            await self.session.commit()
+
+        return deleted_objs
+
     async def patch(
         self,
         filters: dict[str, Any],
@@ -0,0 +1,103 @@
+from typing import Annotated, Any, Sequence
+
+from fastapi import status
+from pydantic import BaseModel, Field
+from sqlalchemy.exc import IntegrityError
+
+from core.exceptions import NotFoundError, PositionOutOfRangeError
+
+# The maximum number of objects in one bulk request
+MAX_BULK_ITEMS = 1000
+
+# Constraint violations by SQLSTATE (PostgreSQL) or extended result code (SQLite):
+# a missing referenced object, or a value the schema does not allow
+MISSING_REFERENCE_ERRORS = {"23503", "SQLITE_CONSTRAINT_FOREIGNKEY"}
+INVALID_VALUE_ERRORS = {
+    "23502",
+    "23514",
+    "SQLITE_CONSTRAINT_NOTNULL",
+    "SQLITE_CONSTRAINT_CHECK",
+}
+
+
+def bulk_error_status(error: Exception | None) -> int:
+    """
+    Maps the reason an item of a bulk creation was not created to a status:
+    404 for a missing referenced object, 422 for an invalid value,
+    409 for a duplicate (None) or any other conflict.
+
+    Args:
+        error (Exception | None): The error that rejected the item,
+        or None if it was skipped as a duplicate.
+
+    Returns:
+        int: The HTTP status of the item.
+    """
+    if isinstance(error, IntegrityError):
+        code = getattr(error.orig, "sqlstate", None) or getattr(
+            error.orig, "sqlite_errorname", None
+        )
+        if code in MISSING_REFERENCE_ERRORS:
+            return status.HTTP_404_NOT_FOUND
+        if code in INVALID_VALUE_ERRORS:
+            return status.HTTP_422_UNPROCESSABLE_ENTITY
+    elif isinstance(error, NotFoundError):
+        return status.HTTP_404_NOT_FOUND
+    elif isinstance(error, PositionOutOfRangeError):
+        return status.HTTP_422_UNPROCESSABLE_ENTITY
+    return status.HTTP_409_CONFLICT
+
+
+class BulkDelete(BaseModel):
+    ids: Annotated[list[int], Field(min_length=1, max_length=MAX_BULK_ITEMS)]
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: int
+    id: int | None = None
+
+
+class BulkResults(BaseModel):
+    results: list[BulkItemResult]
+
+    @classmethod
+    def created(cls, objs: Sequence[Any | Exception | None]) -> "BulkResults":
+        """
+        Builds the results of a bulk creation: 201 with the new ID,
+        or the status of the reason an object was not created
+        (see `bulk_error_status`).
+        """
+        return cls(
+            results=[
+                (
+                    BulkItemResult(
+                        index=index, status=status.HTTP_201_CREATED, id=obj.id
+                    )
+                    if obj is not None and not isinstance(obj, Exception)
+                    else BulkItemResult(index=index, status=bulk_error_status(obj))
+                )
+                for index, obj in enumerate(objs)
+            ]
+        )
+
+    @classmethod
+    def deleted(cls, obj_ids: Sequence[int], deleted: Sequence[bool]) -> "BulkResults":
+        """
+        Builds the results of a bulk deletion: 204,
+        or 404 for an ID without an object.
+        """
+        return cls(
+            results=[
+                BulkItemResult(
+                    index=index,
+                    status=(
+                        status.HTTP_204_NO_CONTENT
+                        if was_deleted
+                        else status.HTTP_404_NOT_FOUND
+                    ),
+                    id=obj_id,
+                )
+                for index, (obj_id, was_deleted) in enumerate(zip(obj_ids, deleted))
+            ]
+        )
@@ -1,4 +1,4 @@
-from typing import Any, Generic
+from typing import Any, Generic, Sequence
 
 from fastapi import HTTPException, status
 
@@ -47,6 +47,24 @@ class BaseService(Generic[TModels, TRepositories]):
         """
         return await self.repository.create(obj_data)
 
+    async def create_many(
+        self,
+        objs_data: Sequence[dict[str, Any]],
+    ) -> list[TModels | Exception | None]:
+        """
+        Creates many objects in one transaction.
+
+        Args:
+            objs_data (Sequence[dict[str, Any]]):
+            Field values of the new objects.
+
+        Returns:
+            list[TModels | Exception | None]: For each item of `objs_data`,
+            the created object, None for a duplicate, or the error that
+            rejected it (see `BulkResults.created`).
+        """
+        return await self.repository.create_many(objs_data)
+
     async def get_by_id(
         self,
         obj_id: int,
@@ -84,6 +102,27 @@ class BaseService(Generic[TModels, TRepositories]):
 
         return await self.repository.get_all()
 
+    async def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        **filters: Any,
+    ) -> tuple[list[TModels], str | None]:
+        """
+        Retrieves one page of objects using keyset pagination.
+
+        Args:
+            limit (int): The maximum number of objects to return.
+            cursor (str | None): The cursor returned with the previous page.
+            **filters (Any): Filtering criteria passed to the repository.
+
+        Returns:
+            tuple[list[TModels], str | None]: The objects and the cursor
+            of the next page, or None if there are no more objects.
+        """
+
+        return await self.repository.get_page(limit, cursor, **filters)
+
     async def delete(
         self,
         filters: dict[str, Any],
@@ -111,6 +150,23 @@ class BaseService(Generic[TModels, TRepositories]):
             detail="Not Found",
         )
 
+    async def delete_many(
+        self,
+        obj_ids: Sequence[int],
+    ) -> list[bool]:
+        """
+        Deletes many objects by their IDs in one transaction.
+
+        Args:
+            obj_ids (Sequence[int]): The IDs of the objects to delete.
+
+        Returns:
+            list[bool]: For each ID, whether an object was deleted.
+        """
+
+        deleted_ids = {obj.id for obj in await self.repository.delete_many(obj_ids)}
+        return [obj_id in deleted_ids for obj_id in obj_ids]
+
     async def patch(
         self,
         filters: dict[str, Any],
@@ -0,0 +1,7 @@
+__all__ = [
+    "Broadcaster",
+    "Subscription",
+    "queue_broadcaster",
+]
+
+from .broadcaster import Broadcaster, Subscription, queue_broadcaster
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any
+
+import orjson
+import redis.asyncio
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.pubsub import listen, redis_client
+
+log = logging.getLogger(__name__)
+
+RESYNC_EVENT = orjson.dumps({"type": "resync"})
+
+
+class Subscription:
+    """
+    A bounded buffer of events for a single subscriber (e.g. one SSE stream).
+
+    If the subscriber falls behind, buffered events are dropped and replaced
+    by a single `resync` event, so the client knows to reload the full state.
+
+    Attributes:
+        key (str): The key the subscription listens to (e.g. a queue id).
+    """
+
+    def __init__(self, key: str, maxsize: int):
+        self.key = key
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize)
+
+    def put(self, event: bytes) -> None:
+        """
+        Buffers an event without blocking the publisher.
+
+        Args:
+            event (bytes): The serialized event.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self, max_wait: float) -> bytes | None:
+        """
+        Waits for the next event.
+
+        Args:
+            max_wait (float): Maximum time to wait (in seconds).
+
+        Returns:
+            bytes | None: The serialized event, or None on timeout.
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), max_wait)
+        except TimeoutError:
+            return None
+
+
+class Broadcaster:
+    """
+    Fans out events to subscribers in all workers through Redis pub/sub.
+
+    Each worker keeps a single pattern subscription on `<prefix>:*` and
+    dispatches incoming events to its local subscribers, so the number
+    of Redis connections does not grow with the number of clients.
+    When disabled, events are only dispatched within the current worker.
+
+    Attributes:
+        redis (redis.asyncio.Redis): The Redis client (must not decode responses).
+        prefix (str): Prefix of the pub/sub channels.
+        enabled (bool): Whether events are published through Redis.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.asyncio.Redis,
+        prefix: str,
+        subscriber_queue_size: int,
+        enabled: bool = True,
+    ):
+        """
+        Initializes the broadcaster.
+
+        Args:
+            redis_client (redis.asyncio.Redis): The Redis client.
+            prefix (str): Prefix of the pub/sub channels.
+            subscriber_queue_size (int): Events buffered per subscriber.
+            enabled (bool, optional): Whether to publish through Redis.
+            Defaults - True.
+        """
+        self.redis = redis_client
+        self.prefix = prefix
+        self.enabled = enabled
+        self._subscriber_queue_size = subscriber_queue_size
+        self._subscribers: defaultdict[str, set[Subscription]] = defaultdict(set)
+        self._listener: asyncio.Task[None] | None = None
+
+    def subscribe(self, key: int | str) -> Subscription:
+        """
+        Registers a new local subscriber.
+
+        Args:
+            key (int | str): The key to listen to.
+
+        Returns:
+            Subscription: The subscription; pass it to `unsubscribe` when done.
+        """
+        subscription = Subscription(str(key), self._subscriber_queue_size)
+        self._subscribers[subscription.key].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Removes a local subscriber.
+
+        Args:
+            subscription (Subscription): The subscription to remove.
+        """
+        subscribers = self._subscribers.get(subscription.key)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.key]
+
+    async def publish(self, key: int | str, event: dict[str, Any]) -> None:
+        """
+        Publishes an event to the subscribers of a key in every worker.
+
+        Publishing errors are logged and never propagated to the caller.
+
+        Args:
+            key (int | str): The key the event belongs to.
+            event (dict[str, Any]): The event payload.
+        """
+        data = orjson.dumps(event)
+        if not self.enabled:
+            self._dispatch(str(key), data)
+            return
+
+        try:
+            await self.redis.publish(f"{self.prefix}:{key}", data)
+        except RedisError:
+            log.exception("Failed to publish event for %r", key)
+
+    def _dispatch(self, key: str, data: bytes) -> None:
+        for subscription in self._subscribers.get(key, ()):
+            subscription.put(data)
+
+    def _resync_all(self) -> None:
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                subscription.put(RESYNC_EVENT)
+
+    async def start(self) -> None:
+        """
+        Starts receiving events published by all workers.
+        """
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(
+                listen(
+                    self.redis,
+                    f"{self.prefix}:*",
+                    self._on_message,
+                    name="Event channel",
+                    pattern=True,
+                    # events may have been missed while disconnected
+                    on_unsubscribe=self._resync_all,
+                )
+            )
+
+    async def stop(self) -> None:
+        """
+        Stops receiving events; the Redis client is left open.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _on_message(self, channel: bytes, data: bytes) -> None:
+        self._dispatch(channel[len(self.prefix) + 1 :].decode(), data)
+
+
+queue_broadcaster = Broadcaster(
+    redis_client=redis_client,
+    prefix=settings.broadcast.channel_prefix,
+    subscriber_queue_size=settings.broadcast.subscriber_queue_size,
+    enabled=settings.broadcast.enabled,
+)
@@ -0,0 +1,9 @@
+__all__ = [
+    "TieredCache",
+    "UserCache",
+    "queue_cache",
+    "user_cache",
+]
+
+from .tiered import TieredCache, queue_cache
+from .users import UserCache, user_cache
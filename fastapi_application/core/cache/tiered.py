@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+import redis.asyncio
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.pubsub import listen, redis_client
+
+log = logging.getLogger(__name__)
+
+
+class TieredCache:
+    """
+    A two-tier cache for serialized payloads: a short-lived in-process LRU
+    in front of Redis.
+
+    Every key has a version counter in Redis. Payloads are stored together with
+    the version they were computed under, and `invalidate` bumps the version,
+    so a payload computed before a write is never served after it. In-process
+    copies are dropped in all workers through a pub/sub channel; while that
+    channel is not connected the in-process tier is bypassed.
+
+    Attributes:
+        redis (redis.asyncio.Redis): The Redis client (must not decode responses).
+        namespace (str): Prefix for all Redis keys of this cache.
+        enabled (bool): Whether caching is active at all.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.asyncio.Redis,
+        namespace: str,
+        ttl_seconds: int,
+        local_ttl_seconds: float,
+        local_max_size: int,
+        channel: str,
+        enabled: bool = True,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            redis_client (redis.asyncio.Redis): The Redis client.
+            namespace (str): Prefix for Redis keys and invalidation messages.
+            ttl_seconds (int): Lifetime of payloads in Redis.
+            local_ttl_seconds (float): Lifetime of payloads in-process.
+            local_max_size (int): Maximum number of in-process payloads.
+            channel (str): Pub/sub channel for invalidation messages.
+            enabled (bool, optional): Whether caching is active. Defaults - True.
+        """
+        self.redis = redis_client
+        self.namespace = namespace
+        self.enabled = enabled
+        self._ttl = ttl_seconds
+        self._local_ttl = local_ttl_seconds
+        self._local_max_size = local_max_size
+        self._channel = channel
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._epoch = 0
+        self._subscribed = False
+        self._listener: asyncio.Task[None] | None = None
+
+    def _data_key(self, key: str) -> str:
+        return f"{self.namespace}:data:{key}"
+
+    def _version_key(self, key: str) -> str:
+        return f"{self.namespace}:version:{key}"
+
+    async def get_or_set(
+        self,
+        key: int | str,
+        factory: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """
+        Returns the cached payload for a key, computing and storing it on a miss.
+
+        Redis errors are logged and never fail the request; the payload
+        is then simply computed by the factory.
+
+        Args:
+            key (int | str): The cache key (e.g. a queue id).
+            factory (Callable[[], Awaitable[bytes]]): Computes the payload.
+
+        Returns:
+            bytes: The serialized payload.
+        """
+
+        if not self.enabled:
+            return await factory()
+
+        key = str(key)
+        payload = self._get_local(key)
+        if payload is not None:
+            return payload
+
+        epoch = self._epoch
+        version = None
+        try:
+            version, payload = await self._get_remote(key)
+        except RedisError as e:
+            log.warning("Cache read failed for %r: %s", key, e)
+
+        if payload is None:
+            payload = await factory()
+            if version is not None:
+                await self._set_remote(key, version, payload)
+
+        if epoch == self._epoch:
+            self._set_local(key, payload)
+        return payload
+
+    async def invalidate(self, key: int | str) -> None:
+        """
+        Invalidates a key in both tiers and in every other worker.
+
+        Args:
+            key (int | str): The cache key to invalidate.
+        """
+
+        if not self.enabled:
+            return
+
+        key = str(key)
+        self._evict_local(key)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(self._version_key(key))
+                pipe.expire(self._version_key(key), self._ttl * 10)
+                pipe.delete(self._data_key(key))
+                pipe.publish(self._channel, f"{self.namespace}:{key}")
+                await pipe.execute()
+        except RedisError:
+            log.exception("Cache invalidation failed for %r", key)
+
+    async def _get_remote(self, key: str) -> tuple[int, bytes | None]:
+        raw_version, raw_payload = await self.redis.mget(
+            self._version_key(key),
+            self._data_key(key),
+        )
+        version = int(raw_version or 0)
+        if raw_payload is None:
+            return version, None
+
+        stored_version, _, payload = raw_payload.partition(b":")
+        if int(stored_version) != version:
+            return version, None
+        return version, payload
+
+    async def _set_remote(self, key: str, version: int, payload: bytes) -> None:
+        try:
+            await self.redis.set(
+                self._data_key(key),
+                b"%d:%b" % (version, payload),
+                ex=self._ttl,
+            )
+        except RedisError as e:
+            log.warning("Cache write failed for %r: %s", key, e)
+
+    def _get_local(self, key: str) -> bytes | None:
+        if not self._subscribed:
+            return None
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at < time.monotonic():
+            self._local.pop(key, None)
+            return None
+
+        self._local.move_to_end(key)
+        return payload
+
+    def _set_local(self, key: str, payload: bytes) -> None:
+        if not self._subscribed:
+            return
+
+        self._local[key] = (time.monotonic() + self._local_ttl, payload)
+        self._local.move_to_end(key)
+        while len(self._local) > self._local_max_size:
+            self._local.popitem(last=False)
+
+    def _evict_local(self, key: str) -> None:
+        self._epoch += 1
+        self._local.pop(key, None)
+
+    def _drop_local(self) -> None:
+        self._epoch += 1
+        self._local.clear()
+
+    async def start(self) -> None:
+        """
+        Starts listening for invalidations from other workers.
+        """
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(
+                listen(
+                    self.redis,
+                    self._channel,
+                    self._on_message,
+                    name="Cache invalidation channel",
+                    on_subscribe=self._on_subscribe,
+                    on_unsubscribe=self._on_unsubscribe,
+                )
+            )
+
+    async def stop(self) -> None:
+        """
+        Stops the invalidation listener; the Redis client is left open.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _on_message(self, channel: bytes, data: bytes) -> None:
+        prefix = f"{self.namespace}:".encode()
+        if data.startswith(prefix):
+            self._evict_local(data[len(prefix) :].decode())
+
+    async def _on_subscribe(self) -> None:
+        self._drop_local()
+        self._subscribed = True
+
+    def _on_unsubscribe(self) -> None:
+        # invalidations may be missed until we resubscribe
+        self._subscribed = False
+        self._drop_local()
+
+
+queue_cache = TieredCache(
+    redis_client=redis_client,
+    namespace="queue",
+    ttl_seconds=settings.cache.ttl_seconds,
+    local_ttl_seconds=settings.cache.local_ttl_seconds,
+    local_max_size=settings.cache.local_max_size,
+    channel=settings.cache.invalidation_channel,
+    enabled=settings.cache.enabled,
+)
@@ -0,0 +1,234 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import redis.asyncio
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from core.config import settings
+from core.pubsub import listen, redis_client
+
+log = logging.getLogger(__name__)
+
+
+class UserCache:
+    """
+    A short-lived in-process cache of authenticated users by access token.
+
+    A hit skips both the token lookup in Redis and the user SELECT.
+    Entries are keyed by a digest of the token and indexed by user id,
+    so all tokens of a user can be dropped at once. Only a read-only
+    snapshot of the user's columns is kept; every hit builds a new detached
+    instance from it, so requests never share one ORM object. Invalidations
+    are broadcast to every worker through a pub/sub channel; while that
+    channel is not connected the cache is bypassed.
+
+    Attributes:
+        redis (redis.asyncio.Redis): The Redis client (must not decode responses).
+        enabled (bool): Whether caching is active at all.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.asyncio.Redis,
+        ttl_seconds: float,
+        max_size: int,
+        channel: str,
+        enabled: bool = True,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            redis_client (redis.asyncio.Redis): The Redis client.
+            ttl_seconds (float): Lifetime of cached users.
+            max_size (int): Maximum number of cached tokens.
+            channel (str): Pub/sub channel for invalidation messages.
+            enabled (bool, optional): Whether caching is active. Defaults - True.
+        """
+        self.redis = redis_client
+        self.enabled = enabled
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._channel = channel
+        self._entries: OrderedDict[str, tuple[float, str, type, Mapping[str, Any]]] = (
+            OrderedDict()
+        )
+        self._keys_by_user: defaultdict[str, set[str]] = defaultdict(set)
+        self.epoch = 0
+        self._subscribed = False
+        self._listener: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Any | None:
+        """
+        Returns the cached user of a token.
+
+        Args:
+            token (str): The access token.
+
+        Returns:
+            Any | None: A new instance of the user, or None on a miss.
+        """
+        if not (self.enabled and self._subscribed):
+            return None
+
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, _, user_class, columns = entry
+        if expires_at < time.monotonic():
+            self._pop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        # detached rather than transient: adding it to a session
+        # (e.g. a profile update) must UPDATE the row, not INSERT it
+        user = user_class(**columns)
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, token: str, user: Any, epoch: int) -> None:
+        """
+        Caches the user of a token.
+
+        Args:
+            token (str): The access token.
+            user (Any): The authenticated user, a mapped instance with an `id`
+            whose columns are loaded.
+            epoch (int): The value of `epoch` before the user was loaded;
+            if an invalidation happened since then, nothing is cached.
+        """
+        if not (self.enabled and self._subscribed) or epoch != self.epoch:
+            return
+
+        key = self._key(token)
+        user_id = str(user.id)
+        columns = MappingProxyType(
+            {
+                attr.key: getattr(user, attr.key)
+                for attr in inspect(user).mapper.column_attrs
+            }
+        )
+        self._pop(key)
+        self._entries[key] = (
+            time.monotonic() + self._ttl,
+            user_id,
+            type(user),
+            columns,
+        )
+        self._keys_by_user[user_id].add(key)
+        while len(self._entries) > self._max_size:
+            self._pop(next(iter(self._entries)))
+
+    async def invalidate_token(self, token: str) -> None:
+        """
+        Drops a token (e.g. on logout) in every worker.
+
+        Args:
+            token (str): The access token.
+        """
+        await self._invalidate(f"token:{self._key(token)}")
+
+    async def invalidate_user(self, user_id: Any) -> None:
+        """
+        Drops all tokens of a user (e.g. after an update) in every worker.
+
+        Args:
+            user_id (Any): The id of the user.
+        """
+        await self._invalidate(f"user:{user_id}")
+
+    async def _invalidate(self, message: str) -> None:
+        if not self.enabled:
+            return
+
+        self._evict(message)
+        try:
+            await self.redis.publish(self._channel, message)
+        except RedisError:
+            log.exception("User cache invalidation failed for %r", message)
+
+    def _evict(self, message: str) -> None:
+        self.epoch += 1
+        kind, _, value = message.partition(":")
+        if kind == "token":
+            self._pop(value)
+        elif kind == "user":
+            for key in self._keys_by_user.pop(value, set()):
+                self._entries.pop(key, None)
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_user.get(entry[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry[1]]
+
+    def _clear(self) -> None:
+        self.epoch += 1
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    async def start(self) -> None:
+        """
+        Starts listening for invalidations from other workers.
+        """
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(
+                listen(
+                    self.redis,
+                    self._channel,
+                    self._on_message,
+                    name="User cache invalidation channel",
+                    on_subscribe=self._on_subscribe,
+                    on_unsubscribe=self._on_unsubscribe,
+                )
+            )
+
+    async def stop(self) -> None:
+        """
+        Stops the invalidation listener; the Redis client is left open.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _on_message(self, channel: bytes, data: bytes) -> None:
+        self._evict(data.decode())
+
+    async def _on_subscribe(self) -> None:
+        self._clear()
+        self._subscribed = True
+
+    def _on_unsubscribe(self) -> None:
+        # invalidations may be missed until we resubscribe
+        self._subscribed = False
+        self._clear()
+
+
+user_cache = UserCache(
+    redis_client=redis_client,
+    ttl_seconds=settings.auth_cache.ttl_seconds,
+    max_size=settings.auth_cache.max_size,
+    channel=settings.auth_cache.invalidation_channel,
+    enabled=settings.auth_cache.enabled,
+)
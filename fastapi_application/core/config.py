@@ -1,7 +1,9 @@
 import os
+import tempfile
 from pathlib import Path
+from typing import Literal
 
-from pydantic import BaseModel, Field, PostgresDsn
+from pydantic import BaseModel, Field, PostgresDsn, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 current_path = Path(__file__).resolve()
@@ -67,6 +69,98 @@ class Redis(BaseModel):
     lifetime_seconds: int = 60 * 60 * 24  # сутки
 
 
+class CacheConfig(BaseModel):
+    """
+    Response cache settings.
+
+    Attributes:
+        enabled (bool): Whether responses are cached at all.
+        ttl_seconds (int): Lifetime of cached payloads in Redis (in seconds).
+        local_ttl_seconds (float): Lifetime of payloads in the in-process tier.
+        local_max_size (int): Maximum number of payloads kept in-process.
+        invalidation_channel (str): Redis pub/sub channel used to drop
+        in-process copies in every worker.
+    """
+
+    enabled: bool = True
+    ttl_seconds: int = 60
+    local_ttl_seconds: float = 2.0
+    local_max_size: int = 1024
+    invalidation_channel: str = "cache:invalidate"
+
+
+class AuthCacheConfig(BaseModel):
+    """
+    In-process cache of authenticated users by access token.
+
+    Attributes:
+        enabled (bool): Whether authenticated users are cached.
+        ttl_seconds (float): Lifetime of a cached user; bounds staleness
+        if an invalidation message is lost.
+        max_size (int): Maximum number of cached tokens per worker.
+        invalidation_channel (str): Redis pub/sub channel used to drop
+        cached users in every worker.
+    """
+
+    enabled: bool = True
+    ttl_seconds: float = 10.0
+    max_size: int = 10_000
+    invalidation_channel: str = "auth:invalidate"
+
+
+class BroadcastConfig(BaseModel):
+    """
+    Real-time event broadcasting settings.
+
+    Attributes:
+        enabled (bool): Whether events are fanned out through Redis pub/sub.
+        If disabled, events only reach subscribers of the same worker.
+        channel_prefix (str): Prefix of the Redis pub/sub channels.
+        subscriber_queue_size (int): Events buffered per subscriber
+        before it is asked to resynchronize.
+        heartbeat_seconds (float): Interval of keep-alive messages on idle streams.
+    """
+
+    enabled: bool = True
+    channel_prefix: str = "queue_events"
+    subscriber_queue_size: int = 100
+    heartbeat_seconds: float = 15.0
+
+
+class AccessTokenConfig(BaseModel):
+    """
+    Authentication strategy settings.
+
+    Attributes:
+        strategy (Literal["redis", "jwt"]): `redis` stores opaque tokens
+        in Redis and looks them up on every request; `jwt` issues signed
+        access tokens verified locally, with Redis-backed refresh tokens
+        and a revocation list.
+        secret (SecretStr | None): Key used to sign access tokens;
+        required by the `jwt` strategy.
+        algorithm (str): Signing algorithm of access tokens.
+        lifetime_seconds (int): Lifetime of access tokens (`jwt` strategy);
+        refresh tokens live `redis.lifetime_seconds`.
+        revocation_channel (str): Redis pub/sub channel of revocations.
+        bloom_bits (int): Size of the local revocation bloom filter.
+        bloom_hashes (int): Number of hash functions of the bloom filter.
+    """
+
+    strategy: Literal["redis", "jwt"] = "redis"
+    secret: SecretStr | None = None
+    algorithm: str = "HS256"
+    lifetime_seconds: int = 15 * 60
+    revocation_channel: str = "auth:revoked"
+    bloom_bits: int = 1 << 20
+    bloom_hashes: int = 7
+
+    @model_validator(mode="after")
+    def check_secret(self) -> "AccessTokenConfig":
+        if self.strategy == "jwt" and self.secret is None:
+            raise ValueError("access_token.secret is required by the jwt strategy")
+        return self
+
+
 class UserManager(BaseModel):
     """
     User manager configuration for authentication.
@@ -88,8 +182,36 @@ class DatabaseConfig(BaseModel):
         url (PostgresDsn): The database connection URL.
         echo (bool): Whether to log SQL statements.
         echo_pool (bool): Whether to log connection pool activity.
-        max_overflow (int): Maximum number of overflow connections.
-        pool_size (int): Maximum number of persistent connections.
+        max_connections (int): Connections Postgres can give this application
+        (all workers together); per-worker pool limits are derived from it.
+        default_pool_size (int): Persistent connections per worker
+        if `pool_size` is not set.
+        max_overflow (int | None): Maximum number of overflow connections
+        per worker. Defaults to the rest of the per-worker share.
+        pool_size (int | None): Maximum number of persistent connections
+        per worker. Defaults to `default_pool_size`, capped by the share.
+        pool_timeout (float): Seconds to wait for a free connection.
+        pool_recycle (int): Seconds after which a connection is replaced
+        (-1 to keep connections forever).
+        pool_pre_ping (bool): Whether to check a connection before use.
+        statement_cache_size (int): Prepared statements cached per connection.
+        statement_timeout_ms (int | None): Server-side limit for a statement.
+        idle_in_transaction_timeout_ms (int | None): Server-side limit
+        for a session idling inside an open transaction.
+        jit (bool): Whether the Postgres JIT compiler is enabled; it mostly
+        adds planning time to short OLTP queries.
+        replica_urls (list[PostgresDsn]): Read replicas for read-only routes;
+        reads use the primary if empty.
+        read_your_writes_seconds (float): How long a client's reads stay
+        on the primary after its own write; should exceed the replica lag.
+        pgbouncer (bool): Whether connections go through PgBouncer in transaction
+        pooling mode. Prepared statements are then never reused, since a
+        transaction may run on a different server connection than the one
+        that prepared them, and `server_settings()` is not sent on connect;
+        set timeouts and jit on the database role instead.
+        pgbouncer_pool_size (int): Connections each worker keeps to PgBouncer
+        in that mode; 0 opens one per session (NullPool), leaving pooling
+        to PgBouncer.
         naming_conventions (dict[str, str]):
         SQLAlchemy naming conventions for schema objects.
     """
@@ -97,8 +219,58 @@ class DatabaseConfig(BaseModel):
     url: PostgresDsn
     echo: bool = False
     echo_pool: bool = False
-    max_overflow: int = 50
-    pool_size: int = 10
+    max_connections: int = 100
+    default_pool_size: int = 10
+    max_overflow: int | None = None
+    pool_size: int | None = None
+    pool_timeout: float = 30.0
+    pool_recycle: int = 30 * 60
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+    statement_timeout_ms: int | None = 30_000
+    idle_in_transaction_timeout_ms: int | None = 60_000
+    jit: bool = False
+    replica_urls: list[PostgresDsn] = []
+    read_your_writes_seconds: float = 5.0
+    pgbouncer: bool = False
+    pgbouncer_pool_size: int = 0
+
+    def pool_limits(self, workers: int) -> tuple[int, int]:
+        """
+        Returns the pool size and overflow of one worker process, so that
+        all workers together never open more than `max_connections`.
+
+        Args:
+            workers (int): Number of worker processes.
+
+        Returns:
+            tuple[int, int]: The pool size and the maximum overflow.
+        """
+        share = max(1, self.max_connections // max(1, workers))
+        pool_size = min(
+            self.pool_size if self.pool_size is not None else self.default_pool_size,
+            share,
+        )
+        max_overflow = share - pool_size
+        if self.max_overflow is not None:
+            max_overflow = min(self.max_overflow, max_overflow)
+        return pool_size, max_overflow
+
+    def server_settings(self) -> dict[str, str]:
+        """
+        Returns the session settings sent to Postgres on connect.
+
+        Returns:
+            dict[str, str]: Postgres run-time parameters.
+        """
+        server_settings = {"jit": "on" if self.jit else "off"}
+        if self.statement_timeout_ms is not None:
+            server_settings["statement_timeout"] = str(self.statement_timeout_ms)
+        if self.idle_in_transaction_timeout_ms is not None:
+            server_settings["idle_in_transaction_session_timeout"] = str(
+                self.idle_in_transaction_timeout_ms
+            )
+        return server_settings
 
     naming_conventions: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
@@ -137,12 +309,97 @@ class MongoConfig(BaseModel):
     db_name: str
 
 
+class LogBufferConfig(BaseModel):
+    """
+    Settings of the in-process buffer that batches action logs
+    before they are sent to the broker.
+
+    Attributes:
+        batch_size (int): Number of logs that triggers an immediate flush.
+        flush_interval_seconds (float): Maximum time a log waits in the buffer.
+        max_size (int): Maximum number of buffered logs; the oldest logs
+        are dropped once it is reached.
+    """
+
+    batch_size: int = 100
+    flush_interval_seconds: float = 1.0
+    max_size: int = 10_000
+
+
+class PublisherConfig(BaseModel):
+    """
+    Settings of the background thread that sends tasks to the broker.
+
+    Attributes:
+        queue_size (int): Maximum number of messages waiting to be sent.
+        overflow_policy (Literal["drop_newest", "drop_oldest", "spill"]):
+        What happens to a message when the queue is full;
+        `spill` writes it to the spool.
+        shutdown_timeout_seconds (float): How long shutdown waits
+        for queued messages.
+    """
+
+    queue_size: int = 1000
+    overflow_policy: Literal["drop_newest", "drop_oldest", "spill"] = "drop_newest"
+    shutdown_timeout_seconds: float = 5.0
+
+
+class SpoolConfig(BaseModel):
+    """
+    Settings of the on-disk spool for messages the broker did not accept.
+
+    Attributes:
+        enabled (bool): Whether undeliverable messages are spooled.
+        If disabled, they are logged and lost.
+        path (str): The spool directory; it must be local to the host,
+        since ownership of segments is tracked by process ids.
+        max_segment_bytes (int): Size after which a segment file is sealed.
+        replay_interval_seconds (float): How often spooled messages are resent.
+        fsync (bool): Whether every record is fsynced to survive power loss.
+    """
+
+    enabled: bool = True
+    path: str = os.path.join(tempfile.gettempdir(), "queue_api_spool")
+    max_segment_bytes: int = 16 * 1024 * 1024
+    replay_interval_seconds: float = 10.0
+    fsync: bool = False
+
+
 class CeleryConfig(BaseModel):
     url: str
 
 
+class QueueTemplatesConfig(BaseModel):
+    """
+    Settings of the job creating the queues of recurring templates.
+
+    Attributes:
+        horizon_days (int): How far ahead queues are created.
+        materialize_interval_seconds (float): How often the job runs (Celery beat).
+    """
+
+    horizon_days: int = 28
+    materialize_interval_seconds: float = 60 * 60
+
+
+class ArchiveConfig(BaseModel):
+    """
+    Settings of the job moving past queues to the archive tables.
+
+    Attributes:
+        retention_days (int): How long queues stay live after their start.
+        batch_size (int): Queues moved per transaction; bounds lock time.
+        interval_seconds (float): How often the job runs (Celery beat).
+    """
+
+    retention_days: int = 30
+    batch_size: int = 500
+    interval_seconds: float = 24 * 60 * 60
+
+
 class TestDBConfig(BaseModel):
     url: str
+    pgbouncer_url: str | None = None
 
 
 class Settings(BaseSettings):
@@ -152,8 +409,17 @@ class Settings(BaseSettings):
     Attributes:
         db (DatabaseConfig): Database configuration.
         user_manager (UserManager): User manager settings.
+        access_token (AccessTokenConfig): Authentication strategy settings.
         mongo (MongoConfig): MongoDB configuration.
+        log_buffer (LogBufferConfig): Action log batching settings.
+        publisher (PublisherConfig): Broker publishing settings.
+        spool (SpoolConfig): Settings of the spool for undeliverable messages.
+        queue_templates (QueueTemplatesConfig): Recurring queue job settings.
+        archive (ArchiveConfig): Queue archival job settings.
         redis (Redis): Redis configuration.
+        cache (CacheConfig): Response cache settings.
+        auth_cache (AuthCacheConfig): Authenticated user cache settings.
+        broadcast (BroadcastConfig): Real-time event broadcasting settings.
         cors (CORSConfig): CORS settings.
         run (RunConfig): Application runtime settings.
         gunicorn (GunicornConfig): Gunicorn server settings.
@@ -169,10 +435,19 @@ class Settings(BaseSettings):
 
     db: DatabaseConfig = Field(...)
     user_manager: UserManager = Field(...)
+    access_token: AccessTokenConfig = AccessTokenConfig()
     mongo: MongoConfig = Field(...)
     celery: CeleryConfig = Field(...)
+    log_buffer: LogBufferConfig = LogBufferConfig()
+    publisher: PublisherConfig = PublisherConfig()
+    spool: SpoolConfig = SpoolConfig()
+    queue_templates: QueueTemplatesConfig = QueueTemplatesConfig()
+    archive: ArchiveConfig = ArchiveConfig()
     test_db: TestDBConfig = Field(...)
     redis: Redis = Redis()
+    cache: CacheConfig = CacheConfig()
+    auth_cache: AuthCacheConfig = AuthCacheConfig()
+    broadcast: BroadcastConfig = BroadcastConfig()
     cors: CORSConfig = CORSConfig()
     run: RunConfig = RunConfig()
     gunicorn: GunicornConfig = GunicornConfig()
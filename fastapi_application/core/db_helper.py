@@ -1,13 +1,26 @@
-from typing import AsyncGenerator
+from itertools import cycle
+from typing import Any, AsyncGenerator, Sequence
+from uuid import uuid4
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from core.config import settings
+from core.db_routing import SAFE_METHODS, ReadYourWrites, read_your_writes
+
+
+def unique_statement_name() -> str:
+    """
+    Returns a prepared statement name that is unique across server
+    connections, so statements never collide behind PgBouncer.
+    """
+    return f"__asyncpg_{uuid4()}__"
 
 
 class DatabaseHelper:
@@ -21,6 +34,9 @@ class DatabaseHelper:
         engine (AsyncEngine): The asynchronous SQLAlchemy engine instance.
         session_factory (async_sessionmaker[AsyncSession]):
         A factory for creating database sessions.
+        replica_engines (list[AsyncEngine]): Engines of the read replicas.
+        read_your_writes (ReadYourWrites): Keeps a client's reads on the primary
+        right after its own writes.
     """
 
     def __init__(
@@ -30,6 +46,15 @@ class DatabaseHelper:
         echo_pool: bool = True,
         max_overflow: int = 10,
         pool_size: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 100,
+        server_settings: dict[str, str] | None = None,
+        replica_urls: Sequence[str] = (),
+        read_your_writes: ReadYourWrites = read_your_writes,
+        pgbouncer: bool = False,
+        pgbouncer_pool_size: int = 0,
     ):
         """
         Initializes the database helper with configuration options.
@@ -43,16 +68,76 @@ class DatabaseHelper:
             exceeding the pool size. Defaults - 10.
             pool_size (int, optional): The maximum number of persistent connections.
             Defaults - 10.
+            pool_timeout (float, optional): Seconds to wait for a free connection.
+            Defaults - 30.0.
+            pool_recycle (int, optional): Seconds after which a connection
+            is replaced; -1 keeps connections forever. Defaults - -1.
+            pool_pre_ping (bool, optional): Whether to check a connection
+            before use. Defaults - False.
+            statement_cache_size (int, optional): Prepared statements cached
+            per connection; 0 disables the cache. Defaults - 100.
+            server_settings (dict[str, str] | None, optional): Postgres
+            run-time parameters set on every connection. Defaults - None.
+            replica_urls (Sequence[str], optional): Read replica URLs; each gets
+            an engine with the same pool options. Defaults - ().
+            read_your_writes (ReadYourWrites, optional): Tracks recent writers.
+            Defaults - the application tracker.
+            pgbouncer (bool, optional): Whether connections go through PgBouncer
+            in transaction pooling mode; disables prepared statement reuse and
+            the startup `server_settings`. Defaults - False.
+            pgbouncer_pool_size (int, optional): Persistent connections kept
+            in PgBouncer mode, which replace the pool options; 0 uses NullPool.
+            Defaults - 0.
         """
-        self.engine: AsyncEngine = create_async_engine(
-            url=url,
-            echo=echo,
-            echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+        engine_options: dict[str, Any] = dict(echo=echo, echo_pool=echo_pool)
+        if pgbouncer:
+            engine_options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": unique_statement_name,
+            }
+            if pgbouncer_pool_size:
+                engine_options.update(
+                    pool_size=pgbouncer_pool_size,
+                    max_overflow=0,
+                    pool_timeout=pool_timeout,
+                    pool_recycle=pool_recycle,
+                    pool_pre_ping=pool_pre_ping,
+                )
+            else:
+                engine_options["poolclass"] = NullPool
+        else:
+            engine_options.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=pool_pre_ping,
+                connect_args={
+                    "prepared_statement_cache_size": statement_cache_size,
+                    "server_settings": server_settings or {},
+                },
+            )
+        self.engine: AsyncEngine = create_async_engine(url=url, **engine_options)
+        self.session_factory: async_sessionmaker[AsyncSession] = self._sessionmaker(
+            self.engine
+        )
+
+        self.replica_engines: list[AsyncEngine] = [
+            create_async_engine(url=replica_url, **engine_options)
+            for replica_url in replica_urls
+        ]
+        self._replica_factories = (
+            cycle([self._sessionmaker(engine) for engine in self.replica_engines])
+            if self.replica_engines
+            else None
         )
-        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
-            bind=self.engine,
+        self.read_your_writes = read_your_writes
+
+    @staticmethod
+    def _sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=engine,
             autocommit=False,
             autoflush=False,
             expire_on_commit=False,
@@ -60,9 +145,35 @@ class DatabaseHelper:
 
     async def dispose(self) -> None:
         """
-        Disposes of the database engine, closing all active connections.
+        Disposes of the database engines, closing all active connections.
         """
         await self.engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
+
+    def read_session_factory(
+        self,
+        request: Request,
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Picks the session factory for a read-only route.
+
+        Replicas are used round-robin for safe requests, unless no replica
+        is configured or the client wrote within the read-your-writes window.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: A replica or the primary factory.
+        """
+        if (
+            self._replica_factories is None
+            or request.method not in SAFE_METHODS
+            or self.read_your_writes.wrote_recently(request)
+        ):
+            return self.session_factory
+        return next(self._replica_factories)
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
         """
@@ -80,12 +191,39 @@ class DatabaseHelper:
         except Exception as e:
             raise e
 
+    async def read_session_getter(
+        self,
+        request: Request,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Provides a session for read-only routes, bound to a replica
+        when one can serve the request.
+
+        Args:
+            request (Request): The incoming request.
+
+        Yields:
+            AsyncSession: A database session instance.
+        """
+        async with self.read_session_factory(request)() as session:
+            yield session
+
 
-# Initialize the database helper using settings
+# Initialize the database helper using settings;
+# pool limits are per worker process
+pool_size, max_overflow = settings.db.pool_limits(settings.gunicorn.workers)
 db_helper = DatabaseHelper(
     url=str(settings.db.url),
     echo=settings.db.echo,
     echo_pool=settings.db.echo_pool,
-    pool_size=settings.db.pool_size,
-    max_overflow=settings.db.max_overflow,
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    statement_cache_size=settings.db.statement_cache_size,
+    server_settings=settings.db.server_settings(),
+    replica_urls=[str(url) for url in settings.db.replica_urls],
+    pgbouncer=settings.db.pgbouncer,
+    pgbouncer_pool_size=settings.db.pgbouncer_pool_size,
 )
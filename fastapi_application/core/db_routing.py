@@ -0,0 +1,128 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI, Request, Response
+
+from core.config import settings
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWrites:
+    """
+    Remembers clients that wrote recently, so their reads go to the primary
+    until replicas have caught up with their own writes.
+
+    A successful write is recorded twice: in-process, keyed by a digest
+    of the `Authorization` header, and in a cookie holding the end of the
+    window, which reaches every worker and every instance of the API.
+
+    Attributes:
+        window_seconds (float): How long reads stay on the primary after a write.
+        cookie_name (str): The cookie holding the end of the window.
+    """
+
+    cookie_name = "read_primary_until"
+
+    def __init__(self, window_seconds: float, max_size: int = 10_000):
+        """
+        Initializes the tracker.
+
+        Args:
+            window_seconds (float): How long reads stay on the primary
+            after a write.
+            max_size (int, optional): Maximum number of clients remembered
+            in-process. Defaults - 10000.
+        """
+        self.window_seconds = window_seconds
+        self._max_size = max_size
+        self._writes: OrderedDict[str, float] = OrderedDict()
+
+    @staticmethod
+    def _client_key(request: Request) -> str | None:
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        return hashlib.sha256(authorization.encode()).hexdigest()
+
+    def wrote_recently(self, request: Request) -> bool:
+        """
+        Checks whether the client of a request wrote within the window.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            bool: True if the request must be served from the primary.
+        """
+        now = time.time()
+        try:
+            if float(request.cookies.get(self.cookie_name, 0)) > now:
+                return True
+        except ValueError:
+            pass
+
+        key = self._client_key(request)
+        if key is None:
+            return False
+        written_until = self._writes.get(key)
+        if written_until is None:
+            return False
+        if written_until <= now:
+            self._writes.pop(key, None)
+            return False
+        return True
+
+    def mark(self, request: Request, response: Response) -> None:
+        """
+        Records a write by the client of a request.
+
+        Args:
+            request (Request): The request that wrote.
+            response (Response): Its response; receives the cookie.
+        """
+        until = time.time() + self.window_seconds
+        key = self._client_key(request)
+        if key is not None:
+            self._writes[key] = until
+            self._writes.move_to_end(key)
+            while len(self._writes) > self._max_size:
+                self._writes.popitem(last=False)
+
+        response.set_cookie(
+            self.cookie_name,
+            repr(until),
+            max_age=int(self.window_seconds) + 1,
+            httponly=True,
+            samesite="lax",
+        )
+
+    async def middleware(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """
+        HTTP middleware marking every successful unsafe request as a write.
+        """
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            self.mark(request, response)
+        return response
+
+
+read_your_writes = ReadYourWrites(settings.db.read_your_writes_seconds)
+
+
+def register_read_your_writes(app: FastAPI) -> None:
+    """
+    Installs the read-your-writes middleware if read replicas are configured;
+    without them every read goes to the primary and nothing needs tracking.
+
+    Args:
+        app (FastAPI): The application.
+    """
+    if settings.db.replica_urls:
+        app.middleware("http")(read_your_writes.middleware)
@@ -14,3 +14,21 @@ class NotFoundError(ServiceError):
     """
     Exception raised when an object is not found in the database.
     """
+
+
+class PositionTakenError(ServiceError):
+    """
+    Exception raised when a queue position is already occupied by another user.
+    """
+
+
+class PositionOutOfRangeError(ServiceError):
+    """
+    Exception raised when a queue position exceeds the queue's available slots.
+    """
+
+
+class QueueFullError(ServiceError):
+    """
+    Exception raised when a queue has no free positions left.
+    """
@@ -1,6 +1,6 @@
 from typing import Type
 
-from utils.condition_builder import ConditionBuilder
+from utils.condition_builder import ConditionBuilder, get_condition_builder
 
 
 class ConditionBuilderFactory[TModels]:
@@ -11,17 +11,16 @@ class ConditionBuilderFactory[TModels]:
     @staticmethod
     def create_for_model(model: Type[TModels]) -> ConditionBuilder:
         """
-        Creates and returns a `ConditionBuilder` instance for the specified model.
+        Returns the shared `ConditionBuilder` instance for the specified model.
 
         Args:
             model (Type[TModels]): The SQLAlchemy model class
             for which to create a condition builder.
 
         Returns:
-            ConditionBuilder: A new instance of 'ConditionBuilder'
-            for the specified model.
+            ConditionBuilder: The 'ConditionBuilder' of the specified model.
         """
-        return ConditionBuilder(model)
+        return get_condition_builder(model)()
 
 
 def get_condition_builder_factory() -> Type[ConditionBuilderFactory]:
@@ -1,54 +1,70 @@
-from typing import Annotated, Callable, Type
+from contextvars import ContextVar
+from typing import Annotated, AsyncGenerator, Callable, Type
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db_helper import db_helper
 from core.registry import model_registry
+from core.session_context import current_read_session, current_session
 from core.types import TModels, TRepositories
-from utils import get_condition_builder
-from utils.condition_builder import ConditionBuilder
 
 
-def get_repository_by_model(model_cls: Type[TModels]) -> Callable[..., TRepositories]:
+def get_session_binder(
+    read_only: bool = False,
+) -> tuple[Callable[..., AsyncGenerator[AsyncSession, None]], ContextVar[AsyncSession]]:
     """
-    Retrieves the repository class associated with the given model and returns
-    a factory function that creates instances of the repository.
+    Returns the session dependency and the context variable it is bound to.
+
+    Args:
+        read_only (bool, optional): Whether the session is for read-only routes
+        and may be bound to a read replica. Defaults - False.
+
+    Returns:
+        tuple: The session dependency and the context variable.
+    """
+    if read_only:
+        return db_helper.read_session_getter, current_read_session
+    return db_helper.session_getter, current_session
+
+
+def get_repository_by_model(
+    model_cls: Type[TModels],
+    read_only: bool = False,
+) -> Callable[..., TRepositories]:
+    """
+    Returns a dependency that provides the shared repository of the given
+    model, with the request's session bound to it.
 
     Args:
         model_cls (Type[TModels]): The model class used
         to look up the corresponding repository.
+        read_only (bool, optional): Whether the repository only reads; its session
+        is then routed to a read replica when possible. Defaults - False.
 
     Returns:
         Callable[..., TRepositories]: A function that, when called,
-        returns an instance of the associated repository.
+        returns the repository of the model.
     """
 
-    # Retrieve the repository class from the registry
-    _, repo_cls = model_registry.MODEL_REGISTRY[model_cls]
-
-    def _create_repository(
-        session: Annotated[
-            AsyncSession,
-            Depends(db_helper.session_getter),
-        ],
-        condition_builder: Annotated[
-            ConditionBuilder,
-            Depends(get_condition_builder(model_cls)),
-        ],
+    repository = model_registry.get_repository(model_cls, read_only)
+    session_getter, session_var = get_session_binder(read_only)
+
+    # async, so the context variable is set in the request's task
+    # rather than in a threadpool worker
+    async def _bind_repository(
+        session: Annotated[AsyncSession, Depends(session_getter)],
     ) -> TRepositories:
         """
-        Creates and returns an instance of the repository
-        class using injected dependencies.
+        Binds the request's session and returns the repository.
 
         Args:
             session (AsyncSession): The database session, injected via FastAPI Depends.
-            condition_builder (ConditionBuilder): The condition builder
-            for query filtering, injected via Depends.
 
         Returns:
-            TRepositories: An instance of the associated repository class.
+            TRepositories: The shared repository instance.
         """
-        return repo_cls(session, condition_builder)
+        session_var.set(session)
+        return repository
 
-    return _create_repository
+    return _bind_repository
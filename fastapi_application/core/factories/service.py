@@ -1,46 +1,54 @@
-from typing import Callable, Type
+from typing import Annotated, Callable, Type
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.registry import model_registry
 
-from ..base import BaseService
 from ..types import TModels, TService
-from .repository import get_repository_by_model
+from .repository import get_session_binder
 
 
 def get_service_by_model(
     model_cls: Type[TModels],
+    read_only: bool = False,
 ) -> Callable[..., TService]:
     """
-    Retrieves the service class associated with the given model and
-    returns a factory function that creates instances of the service.
+    Returns a dependency that provides the shared service of the given
+    model, with the request's session bound to it.
+
+    The service and its repository are created once; per request only
+    the session dependency is resolved.
 
     Args:
         model_cls (Type[TModels]): The model class used
         to look up the corresponding service.
+        read_only (bool, optional): Whether the service is only used for reads,
+        so its repository may use a read replica. Defaults - False.
 
     Returns:
         Callable[..., TService]: A function that, when called,
-        returns an instance of the associated service.
+        returns the service of the model.
     """
 
-    # Retrieve the service and repository classes from the registry
-    service_cls, repo_cls = model_registry.MODEL_REGISTRY[model_cls]
+    service = model_registry.get_service(model_cls, read_only)
+    session_getter, session_var = get_session_binder(read_only)
 
-    def _create_service(
-        repository=Depends(get_repository_by_model(model_cls)),
-    ) -> BaseService[TModels, TService]:
+    # async, so the context variable is set in the request's task
+    # rather than in a threadpool worker
+    async def _bind_service(
+        session: Annotated[AsyncSession, Depends(session_getter)],
+    ) -> TService:
         """
-        Creates and returns an instance of the service class
-        using the injected repository.
+        Binds the request's session and returns the service.
 
         Args:
-            repository: The repository instance, injected via FastAPI Depends.
+            session (AsyncSession): The database session, injected via FastAPI Depends.
 
         Returns:
-            TService: An instance of the associated service class.
+            TService: The shared service instance.
         """
-        return service_cls(repository)
+        session_var.set(session)
+        return service
 
-    return _create_service
+    return _bind_service
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, NoReturn
+
+import redis.asyncio
+from redis.exceptions import RedisError
+
+from core.config import settings
+
+log = logging.getLogger(__name__)
+
+# One connection pool shared by the caches, the revocation list and
+# the broadcaster (responses are not decoded); every subscription
+# still holds a connection of its own while it is open
+redis_client = redis.asyncio.from_url(settings.redis.url)
+
+
+async def listen(
+    redis_client: redis.asyncio.Redis,
+    channel: str,
+    on_message: Callable[[bytes, bytes], None],
+    *,
+    name: str,
+    pattern: bool = False,
+    on_subscribe: Callable[[], Awaitable[None]] | None = None,
+    on_unsubscribe: Callable[[], None] | None = None,
+    max_delay: float = 30.0,
+) -> NoReturn:
+    """
+    Keeps a pub/sub subscription open and passes its messages on.
+
+    When the connection is lost the subscription is reopened with
+    exponential backoff (1 second up to `max_delay`). Messages published
+    in between are lost, so subscribers that mirror state should drop or
+    rebuild it in `on_unsubscribe` / `on_subscribe`. Run it as a task
+    and cancel the task to stop listening.
+
+    Args:
+        redis_client (redis.asyncio.Redis): The Redis client.
+        channel (str): The channel, or a glob-style pattern if `pattern`.
+        on_message (Callable[[bytes, bytes], None]): Called with the channel
+        and the data of every message.
+        name (str): What the channel is for, used in log messages.
+        pattern (bool, optional): Whether `channel` is a pattern. Defaults - False.
+        on_subscribe (Callable[[], Awaitable[None]] | None, optional): Awaited
+        after every (re)subscription, before the first message is passed on.
+        on_unsubscribe (Callable[[], None] | None, optional): Called whenever
+        the subscription is lost or the listener is stopped.
+        max_delay (float, optional): Longest wait between reconnection
+        attempts, in seconds. Defaults - 30.
+    """
+    delay = 1.0
+
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            if pattern:
+                await pubsub.psubscribe(channel)
+            else:
+                await pubsub.subscribe(channel)
+            if on_subscribe is not None:
+                await on_subscribe()
+            delay = 1.0
+
+            async for message in pubsub.listen():
+                if message["type"] in ("message", "pmessage"):
+                    on_message(message["channel"], message["data"])
+        except RedisError as e:
+            log.warning("%s lost: %s", name, e)
+        finally:
+            if on_unsubscribe is not None:
+                on_unsubscribe()
+            await pubsub.aclose()
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_delay)
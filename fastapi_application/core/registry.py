@@ -1,5 +1,6 @@
 from typing import Generic, Type
 
+from core.session_context import current_read_session
 from core.types import TModels, TRepositories, TService
 from domains.queues import (
     Queue,
@@ -11,17 +12,30 @@ from domains.queues import (
     QueueTags,
     QueueTagService,
     QueueTagsRepository,
+    QueueTemplate,
+    QueueTemplateRepository,
+    QueueTemplateService,
 )
 from domains.tags import Tags, TagsRepository, TagsService
 from domains.users import User, UserRepository, UserService
+from utils import get_condition_builder
 
 
 class ModelRegistry(Generic[TModels, TService, TRepositories]):
+    """
+    Maps models to their service and repository classes, and holds the
+    shared, session-less instances built from them.
+
+    Attributes:
+        MODEL_REGISTRY (dict): Service and repository classes by model.
+    """
+
     def __init__(self) -> None:
         self.MODEL_REGISTRY: dict[
             Type[TModels],
             tuple[Type[TService], Type[TRepositories]],
         ] = {}
+        self._services: dict[tuple[Type[TModels], bool], TService] = {}
 
     def register(
         self,
@@ -30,10 +44,53 @@ class ModelRegistry(Generic[TModels, TService, TRepositories]):
     ) -> None:
         self.MODEL_REGISTRY[model] = service_repo
 
+    def get_service(self, model: Type[TModels], read_only: bool = False) -> TService:
+        """
+        Returns the shared service of a model, creating it on first use.
+
+        The service and its repository hold no session; the repository
+        reads the session bound to the current request.
+
+        Args:
+            model (Type[TModels]): The model of the service.
+            read_only (bool, optional): Whether the service serves read-only routes;
+            its repository then uses the read session. Defaults - False.
+
+        Returns:
+            TService: The shared service instance.
+        """
+        service = self._services.get((model, read_only))
+        if service is None:
+            service_cls, repo_cls = self.MODEL_REGISTRY[model]
+            repository = repo_cls(None, get_condition_builder(model)())
+            if read_only:
+                repository.session_var = current_read_session
+            service = self._services[(model, read_only)] = service_cls(repository)
+        return service
+
+    def get_repository(
+        self,
+        model: Type[TModels],
+        read_only: bool = False,
+    ) -> TRepositories:
+        """
+        Returns the shared repository of a model.
+
+        Args:
+            model (Type[TModels]): The model of the repository.
+            read_only (bool, optional): Whether the repository uses
+            the read session. Defaults - False.
+
+        Returns:
+            TRepositories: The shared repository instance.
+        """
+        return self.get_service(model, read_only).repository
+
 
 model_registry: ModelRegistry[TModels, TService, TRepositories] = ModelRegistry()
 model_registry.register(Queue, (QueueService, QueueRepository))
 model_registry.register(QueueEntries, (QueueEntryService, QueueEntriesRepository))
 model_registry.register(QueueTags, (QueueTagService, QueueTagsRepository))
+model_registry.register(QueueTemplate, (QueueTemplateService, QueueTemplateRepository))
 model_registry.register(Tags, (TagsService, TagsRepository))
 model_registry.register(User, (UserService, UserRepository))
@@ -0,0 +1,20 @@
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+"""
+Database sessions of the current request.
+
+Services and repositories are created once per model and shared by all
+requests; the service dependency binds the request's session to one of
+these variables, and repositories read it from there. Every request runs
+in its own asyncio task, so the binding never leaks between requests.
+
+Variables:
+    current_session: The primary session, used for reads and writes.
+    current_read_session: The session of read-only routes,
+    which may be bound to a read replica.
+"""
+
+current_session: ContextVar[AsyncSession] = ContextVar("current_session")
+current_read_session: ContextVar[AsyncSession] = ContextVar("current_read_session")
@@ -1,13 +1,21 @@
 __all__ = [
+    "ArchivedQueue",
+    "ArchivedQueueEntries",
+    "ArchivedQueueTags",
     "Queue",
     "QueueTags",
     "QueueEntries",
+    "QueueTemplate",
+    "QueueTemplateTags",
     "QueueRepository",
     "QueueTagsRepository",
     "QueueEntriesRepository",
+    "QueueTemplateRepository",
     "QueueService",
     "QueueTagService",
     "QueueEntryService",
+    "QueueTemplateService",
+    "AssignQueueEntry",
     "CreateQueueEntry",
     "QueueEntry",
     "GetQueueEntryAndUser",
@@ -15,17 +23,43 @@ __all__ = [
     "PutQueue",
     "CreateQueue",
     "GetQueueWithEntries",
+    "GetQueuesPage",
+    "CreateQueueTemplate",
+    "GetQueueTemplate",
 ]
 
-from .models import Queue, QueueEntries, QueueTags
-from .repositories import QueueEntriesRepository, QueueRepository, QueueTagsRepository
+from .models import (
+    ArchivedQueue,
+    ArchivedQueueEntries,
+    ArchivedQueueTags,
+    Queue,
+    QueueEntries,
+    QueueTags,
+    QueueTemplate,
+    QueueTemplateTags,
+)
+from .repositories import (
+    QueueEntriesRepository,
+    QueueRepository,
+    QueueTagsRepository,
+    QueueTemplateRepository,
+)
 from .schemas import (
+    AssignQueueEntry,
     CreateQueue,
     CreateQueueEntry,
+    CreateQueueTemplate,
     GetQueue,
     GetQueueEntryAndUser,
+    GetQueuesPage,
+    GetQueueTemplate,
     GetQueueWithEntries,
     PutQueue,
     QueueEntry,
 )
-from .services import QueueEntryService, QueueService, QueueTagService
+from .services import (
+    QueueEntryService,
+    QueueService,
+    QueueTagService,
+    QueueTemplateService,
+)
@@ -2,14 +2,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING, List
 
 from sqlalchemy import (
+    Boolean,
     CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from core.base import Base
 from core.base.mixins import IntIdPkMixin
@@ -18,6 +20,10 @@ if TYPE_CHECKING:
     from domains.tags import Tags
     from domains.users import User
 
+# Highest position `check_position_range` allows, also for queues
+# whose `max_slots` is larger
+MAX_POSITION = 30
+
 
 class Queue(IntIdPkMixin, Base):
     """
@@ -29,6 +35,8 @@ class Queue(IntIdPkMixin, Base):
         max_slots (int): The maximum number of slots (default: 30).
         entries (List["QueueEntries"]): Related queue entries.
         queue_tags (List["Tags"]): Tags associated with the queue.
+        taken_slots (int | None): Number of taken positions; only loaded
+        by queries that ask for it (see `QueueRepository.taken_slots`).
     """
 
     __tablename__ = "queues"
@@ -58,6 +66,8 @@ class Queue(IntIdPkMixin, Base):
         back_populates="queues",
     )
 
+    taken_slots: Mapped[int | None] = query_expression()
+
     __table_args__ = (
         CheckConstraint(
             "max_slots BETWEEN 1 AND 40",
@@ -67,6 +77,8 @@ class Queue(IntIdPkMixin, Base):
             "start_time >= CURRENT_DATE",
             name="check_event_date",
         ),
+        # keyset pagination and time-window filters of the listing
+        Index("ix_queues_start_time_id", "start_time", "id"),
     )
 
 
@@ -99,6 +111,7 @@ class QueueEntries(IntIdPkMixin, Base):
             onupdate="CASCADE",
         ),
         nullable=False,
+        index=True,
     )
     position: Mapped[int] = mapped_column(
         Integer,
@@ -126,7 +139,7 @@ class QueueEntries(IntIdPkMixin, Base):
             name="uq_queue_user",
         ),
         CheckConstraint(
-            "position BETWEEN 1 AND 30",
+            f"position BETWEEN 1 AND {MAX_POSITION}",
             name="check_position_range",
         ),
     )
@@ -159,6 +172,7 @@ class QueueTags(IntIdPkMixin, Base):
             onupdate="CASCADE",
         ),
         nullable=False,
+        index=True,
     )
 
     __table_args__ = (
@@ -168,3 +182,222 @@ class QueueTags(IntIdPkMixin, Base):
             name="uq_username_email",
         ),
     )
+
+
+class QueueTemplate(IntIdPkMixin, Base):
+    """
+    Represents a recurring queue: the queues of the series are created
+    ahead of time from the template by the materialization job.
+
+    Attributes:
+        name (str): The name of the created queues (max length: 10).
+        max_slots (int): The number of slots of the created queues.
+        next_start_time (datetime): The start time of the next queue
+        of the series that was not created yet.
+        interval_days (int): The number of days between two queues.
+        active (bool): Whether queues are still created from the template.
+        tags (List["Tags"]): Tags given to the created queues.
+    """
+
+    __tablename__ = "queue_templates"
+
+    name: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+    )
+    max_slots: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=30,
+    )
+    next_start_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    interval_days: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=7,
+    )
+    active: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+    )
+
+    tags: Mapped[List["Tags"]] = relationship(
+        "Tags",
+        secondary="queue_template_tags",
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "max_slots BETWEEN 1 AND 40",
+            name="check_template_position_number",
+        ),
+        CheckConstraint(
+            "interval_days >= 1",
+            name="check_template_interval",
+        ),
+        # the due templates of the materialization job
+        Index("ix_queue_templates_active_next_start_time", "active", "next_start_time"),
+    )
+
+
+class QueueTemplateTags(IntIdPkMixin, Base):
+    """
+    Represents a link between a queue template and a tag.
+
+    Attributes:
+        template_id (int): Foreign key referencing the template.
+        tag_id (int): Foreign key referencing the tag.
+    """
+
+    __tablename__ = "queue_template_tags"
+
+    template_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "queue_templates.id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "tags.id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "template_id",
+            "tag_id",
+            name="uq_template_tag",
+        ),
+    )
+
+
+class ArchivedQueue(IntIdPkMixin, Base):
+    """
+    Represents a queue moved out of `queues` after it took place.
+
+    Archived queues are read-only, so their occupancy is stored
+    instead of being counted. They keep the ID they had while live.
+
+    Attributes:
+        name (str): The name of the queue.
+        start_time (datetime): The start time of the queue.
+        max_slots (int): The number of positions.
+        taken_slots (int): The number of taken positions.
+        archived_at (datetime): When the queue was archived.
+        entries (List["ArchivedQueueEntries"]): The archived entries.
+        queue_tags (List["ArchivedQueueTags"]): The names of the queue's tags.
+    """
+
+    __tablename__ = "queues_archive"
+
+    name: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+    )
+    start_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    max_slots: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    taken_slots: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    entries: Mapped[List["ArchivedQueueEntries"]] = relationship(
+        "ArchivedQueueEntries",
+    )
+    queue_tags: Mapped[List["ArchivedQueueTags"]] = relationship(
+        "ArchivedQueueTags",
+        order_by="ArchivedQueueTags.id",
+    )
+
+    __table_args__ = (
+        # keyset pagination of listings that include archived queues
+        Index("ix_queues_archive_start_time_id", "start_time", "id"),
+    )
+
+
+class ArchivedQueueEntries(IntIdPkMixin, Base):
+    """
+    Represents a position taken in an archived queue.
+
+    Attributes:
+        queue_id (int): Foreign key referencing the archived queue.
+        user_id (str): Foreign key referencing the user.
+        position (int): The position of the user in the queue.
+        user (User): Relationship to the user.
+    """
+
+    __tablename__ = "queue_entries_archive"
+
+    queue_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "queues_archive.id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey(
+            "user.id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+    position: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    user: Mapped["User"] = relationship("User")
+
+
+class ArchivedQueueTags(IntIdPkMixin, Base):
+    """
+    Represents a tag of an archived queue, stored by name so that
+    it outlives the tag.
+
+    Attributes:
+        queue_id (int): Foreign key referencing the archived queue.
+        name (str): The tag name.
+    """
+
+    __tablename__ = "queue_tags_archive"
+
+    queue_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "queues_archive.id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+        index=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(15),
+        nullable=False,
+    )
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+"""
+Lightweight read models of queues, filled from column projections
+instead of ORM objects (no identity map, no unused columns).
+
+Their attribute names match the ORM models, so the serializers in
+`domains.queues.serializers` accept both.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class EntryUser:
+    """
+    The public part of a user holding a queue position.
+
+    Attributes:
+        first_name (str): The user's first name.
+        last_name (str): The user's last name.
+    """
+
+    first_name: str
+    last_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class EntryDetail:
+    """
+    A taken position of a queue.
+
+    Attributes:
+        position (int): The position in the queue.
+        user (EntryUser): The user holding it.
+    """
+
+    position: int
+    user: EntryUser
+
+
+@dataclass(frozen=True, slots=True)
+class TagName:
+    """
+    A tag of a queue.
+
+    Attributes:
+        name (str): The tag name.
+    """
+
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class QueueDetail:
+    """
+    A queue with its taken positions and tags.
+
+    Attributes:
+        id (int): The queue ID.
+        name (str): The queue name.
+        start_time (datetime): The scheduled start time.
+        max_slots (int): The number of positions.
+        entries (list[EntryDetail]): Taken positions, ordered by position.
+        queue_tags (list[TagName]): Tags, ordered by tag ID.
+    """
+
+    id: int
+    name: str
+    start_time: datetime
+    max_slots: int
+    entries: list[EntryDetail]
+    queue_tags: list[TagName]
@@ -1,12 +1,44 @@
-from typing import Any
-
-from sqlalchemy import and_, delete, select
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Sequence
+
+from sqlalchemy import (
+    Integer,
+    and_,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, with_expression
 
 from core.base.repository import BaseRepository
-from core.exceptions import DuplicateEntryError
-from domains.queues import Queue, QueueEntries, QueueTags
+from core.exceptions import (
+    DuplicateEntryError,
+    NotFoundError,
+    PositionOutOfRangeError,
+    PositionTakenError,
+    QueueFullError,
+)
+from domains.queues import (
+    ArchivedQueue,
+    ArchivedQueueEntries,
+    ArchivedQueueTags,
+    Queue,
+    QueueEntries,
+    QueueTags,
+    QueueTemplate,
+    QueueTemplateTags,
+)
+from domains.queues.models import MAX_POSITION
+from domains.queues.projections import EntryDetail, EntryUser, QueueDetail, TagName
+from domains.tags import Tags
+from domains.users import User
+from utils import get_condition_builder
 from utils.condition_builder import ConditionBuilder
 
 
@@ -20,6 +52,17 @@ class QueueRepository(BaseRepository[Queue]):
         condition_builder (ConditionBuilder): Utility for building query conditions.
     """
 
+    cursor_fields = ("start_time", "id")
+
+    # Correlated count of the queue's entries; evaluated only for the rows
+    # returned and answered from the (queue_id, position) unique index
+    taken_slots = (
+        select(func.count(QueueEntries.id))
+        .where(QueueEntries.queue_id == Queue.id)
+        .correlate(Queue)
+        .scalar_subquery()
+    )
+
     def __init__(
         self,
         session: AsyncSession,
@@ -57,22 +100,302 @@ class QueueRepository(BaseRepository[Queue]):
         result = await self.session.execute(query)
         return result.scalars().first()
 
+    async def get_detail(
+        self,
+        queue_id: int,
+    ) -> QueueDetail | None:
+        """
+        Retrieves a queue with its taken positions and tags, selecting only
+        the columns of the detail payload.
+
+        Two lean queries are run: the queue joined with its tag names, and
+        the entries joined with the names of their users. Rows are mapped
+        to dataclasses, so no ORM objects enter the session.
+
+        Args:
+            queue_id (int): The ID of the queue to retrieve.
+
+        Returns:
+            QueueDetail | None: The queue, or None if it does not exist.
+        """
+
+        return await self._get_detail(
+            queue_id,
+            Queue,
+            QueueEntries,
+            [
+                (QueueTags, QueueTags.queue_id == Queue.id),
+                (Tags, Tags.id == QueueTags.tag_id),
+            ],
+        )
+
     async def get_all(self) -> list[Queue]:
         """
-        Retrieves all queue records.
+        Retrieves all queue records with their tags and taken slot counts.
 
         Returns:
             list[Queue]: A list of all queue instances.
         """
 
-        query = select(Queue).options(
-            selectinload(Queue.queue_tags),
+        query = (
+            select(Queue)
+            .options(
+                selectinload(Queue.queue_tags),
+                with_expression(Queue.taken_slots, self.taken_slots),
+            )
+            .execution_options(populate_existing=True)
         )
 
         result = await self.session.execute(query)
 
         return list(result.scalars().all())
 
+    async def get_page(  # type: ignore[override]
+        self,
+        limit: int,
+        cursor: str | None = None,
+        name: str | None = None,
+        tag: str | None = None,
+        start_from: datetime | None = None,
+        start_to: datetime | None = None,
+        include_archived: bool = False,
+    ) -> tuple[list[Queue | ArchivedQueue], str | None]:
+        """
+        Retrieves one page of queues ordered by start time,
+        with their tags and taken slot counts.
+
+        Only live queues are read unless `include_archived` is set;
+        the page then merges live and archived queues.
+
+        Args:
+            limit (int): The maximum number of queues to return.
+            cursor (str | None): The cursor returned with the previous page.
+            name (str | None): Case-insensitive substring of the queue name.
+            tag (str | None): Name of a tag the queue must have.
+            start_from (datetime | None): Lower bound (inclusive) of start time.
+            start_to (datetime | None): Upper bound (exclusive) of start time.
+            include_archived (bool): Whether archived queues are listed too.
+
+        Returns:
+            tuple[list[Queue | ArchivedQueue], str | None]:
+            The queues and the next cursor.
+        """
+
+        filters: dict[str, Any] = {}
+        if name:
+            filters["name__ilike"] = f"%{name}%"
+        if start_from:
+            filters["start_time__gte"] = start_from
+        if start_to:
+            filters["start_time__lt"] = start_to
+
+        query = (
+            select(Queue)
+            .options(
+                selectinload(Queue.queue_tags),
+                with_expression(Queue.taken_slots, self.taken_slots),
+            )
+            # queues already in the session would keep an unloaded count
+            .execution_options(populate_existing=True)
+            .filter(*self.condition_builder.create_conditions(**filters))
+        )
+        if tag:
+            query = query.filter(Queue.queue_tags.any(name=tag))
+
+        if not include_archived:
+            return await self._paginate(query, limit, cursor)
+
+        archived_query = (
+            select(ArchivedQueue)
+            .options(selectinload(ArchivedQueue.queue_tags))
+            .execution_options(populate_existing=True)
+            .filter(
+                *get_condition_builder(ArchivedQueue)().create_conditions(**filters)
+            )
+        )
+        if tag:
+            archived_query = archived_query.filter(
+                ArchivedQueue.queue_tags.any(name=tag)
+            )
+
+        return await self._paginate(query, limit, cursor, archived_query)
+
+    async def get_archived_detail(
+        self,
+        queue_id: int,
+    ) -> QueueDetail | None:
+        """
+        Retrieves an archived queue with its taken positions and tags,
+        selecting only the columns of the detail payload (see `get_detail`).
+
+        Args:
+            queue_id (int): The ID the queue had while live.
+
+        Returns:
+            QueueDetail | None: The queue, or None if it is not archived.
+        """
+
+        return await self._get_detail(
+            queue_id,
+            ArchivedQueue,
+            ArchivedQueueEntries,
+            [(ArchivedQueueTags, ArchivedQueueTags.queue_id == ArchivedQueue.id)],
+        )
+
+    async def _get_detail(
+        self,
+        queue_id: int,
+        queue_model: type[Queue] | type[ArchivedQueue],
+        entries_model: type[QueueEntries] | type[ArchivedQueueEntries],
+        tag_joins: Sequence[tuple[Any, Any]],
+    ) -> QueueDetail | None:
+        """
+        Runs the two queries of a queue detail against live or archive
+        models and maps their rows, so both payloads have the same shape.
+
+        Args:
+            queue_id (int): The ID of the queue.
+            queue_model (type[Queue] | type[ArchivedQueue]): The queue model.
+            entries_model (type[QueueEntries] | type[ArchivedQueueEntries]):
+            The entries model.
+            tag_joins (Sequence[tuple[Any, Any]]): The outer joins (target,
+            on clause) from the queue to its tags; the last target has
+            the tag `name`.
+
+        Returns:
+            QueueDetail | None: The queue, or None if it does not exist.
+        """
+
+        tags = tag_joins[-1][0]
+        queue_query = select(
+            queue_model.name,
+            queue_model.start_time,
+            queue_model.max_slots,
+            tags.name,
+        )
+        for target, onclause in tag_joins:
+            queue_query = queue_query.outerjoin(target, onclause)
+        queue_rows = (
+            await self.session.execute(
+                queue_query.where(queue_model.id == queue_id).order_by(tags.id)
+            )
+        ).all()
+        if not queue_rows:
+            return None
+
+        entry_rows = await self.session.execute(
+            select(entries_model.position, User.first_name, User.last_name)
+            .join(User, User.id == entries_model.user_id)
+            .where(entries_model.queue_id == queue_id)
+            .order_by(entries_model.position)
+        )
+
+        name, start_time, max_slots, _ = queue_rows[0]
+        return QueueDetail(
+            id=queue_id,
+            name=name,
+            start_time=start_time,
+            max_slots=max_slots,
+            entries=[
+                EntryDetail(position, EntryUser(first_name, last_name))
+                for position, first_name, last_name in entry_rows
+            ],
+            queue_tags=[
+                TagName(tag_name) for *_, tag_name in queue_rows if tag_name is not None
+            ],
+        )
+
+    async def archive(
+        self,
+        before: datetime,
+        batch_size: int,
+    ) -> list[int]:
+        """
+        Moves up to `batch_size` queues that started before `before`,
+        with their entries and tag names, to the archive tables.
+
+        The batch is copied with INSERT ... SELECT (entries) and executemany
+        INSERTs (queues, tag names), deleted from the live tables and
+        committed as one transaction. The queues are locked with SKIP LOCKED,
+        so concurrent runs move disjoint batches.
+
+        Args:
+            before (datetime): Queues starting before it are archived.
+            batch_size (int): The maximum number of queues moved.
+
+        Returns:
+            list[int]: The IDs of the archived queues.
+        """
+
+        queues = (
+            await self.session.execute(
+                select(Queue.id, Queue.name, Queue.start_time, Queue.max_slots)
+                .where(Queue.start_time < before)
+                .order_by(Queue.start_time, Queue.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not queues:
+            await self.session.commit()
+            return []
+
+        queue_ids = [queue.id for queue in queues]
+        taken_slots = dict(
+            (
+                await self.session.execute(
+                    select(QueueEntries.queue_id, func.count(QueueEntries.id))
+                    .where(QueueEntries.queue_id.in_(queue_ids))
+                    .group_by(QueueEntries.queue_id)
+                )
+            ).all()
+        )
+        tag_rows = (
+            await self.session.execute(
+                select(QueueTags.queue_id, Tags.name)
+                .join(Tags, Tags.id == QueueTags.tag_id)
+                .where(QueueTags.queue_id.in_(queue_ids))
+                .order_by(QueueTags.queue_id, Tags.id)
+            )
+        ).all()
+
+        archived_at = datetime.now(timezone.utc)
+        await self.session.execute(
+            insert(ArchivedQueue),
+            [
+                {
+                    **queue._asdict(),
+                    "taken_slots": taken_slots.get(queue.id, 0),
+                    "archived_at": archived_at,
+                }
+                for queue in queues
+            ],
+        )
+        if tag_rows:
+            await self.session.execute(
+                insert(ArchivedQueueTags),
+                [{"queue_id": queue_id, "name": name} for queue_id, name in tag_rows],
+            )
+        entry_columns = ["id", "queue_id", "user_id", "position"]
+        await self.session.execute(
+            insert(ArchivedQueueEntries).from_select(
+                entry_columns,
+                select(
+                    *(getattr(QueueEntries, column) for column in entry_columns)
+                ).where(QueueEntries.queue_id.in_(queue_ids)),
+            )
+        )
+
+        # deleted explicitly rather than relying on ON DELETE CASCADE
+        for model in (QueueEntries, QueueTags):
+            await self.session.execute(
+                delete(model).where(model.queue_id.in_(queue_ids))
+            )
+        await self.session.execute(delete(Queue).where(Queue.id.in_(queue_ids)))
+
+        await self.session.commit()
+        return queue_ids
+
 
 class QueueEntriesRepository(BaseRepository[QueueEntries]):
     """
@@ -81,8 +404,22 @@ class QueueEntriesRepository(BaseRepository[QueueEntries]):
     Attributes:
         session (AsyncSession): The database session.
         condition_builder (ConditionBuilder): Utility for building query conditions.
+        free_slot_attempts (int): How many times a free slot reservation
+        is retried after losing a race to an explicit-position reservation.
+        free_slot_lock_namespace (int): First key of the per-queue
+        PostgreSQL advisory lock taken while assigning free slots.
+        usable_slots (ColumnElement[int]): The positions a queue can hand
+        out: `Queue.max_slots` capped at `MAX_POSITION`.
     """
 
+    free_slot_attempts = 3
+    free_slot_lock_namespace = 1
+
+    usable_slots = case(
+        (Queue.max_slots < MAX_POSITION, Queue.max_slots),
+        else_=MAX_POSITION,
+    )
+
     def __init__(
         self,
         session: AsyncSession,
@@ -128,7 +465,13 @@ class QueueEntriesRepository(BaseRepository[QueueEntries]):
         obj_data: dict[str, Any],
     ) -> QueueEntries:
         """
-        Creates a new queue entry in the database.
+        Reserves a queue position in a single statement.
+
+        The entry is inserted with `INSERT ... SELECT ... ON CONFLICT DO NOTHING
+        RETURNING`, selecting from the queue so that positions above
+        `usable_slots` are never inserted. Both unique constraints are
+        enforced by the database; only when nothing was inserted is a second
+        query run to find out why.
 
         Args:
             obj_data (Dict[str, Any]): The data for creating the queue entry.
@@ -137,27 +480,230 @@ class QueueEntriesRepository(BaseRepository[QueueEntries]):
             QueueEntries: The created queue entry.
 
         Raises:
-            DuplicateEntryError: If an entry with the same
-            user_id and queue_id already exists.
+            NotFoundError: If the queue does not exist.
+            PositionOutOfRangeError: If the position exceeds the queue's slots.
+            DuplicateEntryError: If the user already has an entry in the queue.
+            PositionTakenError: If the position is occupied by another user.
         """
 
-        filters = self.condition_builder.create_conditions(
-            user_id=obj_data.get("user_id"),
-            queue_id=obj_data.get("queue_id"),
+        queue_id = obj_data["queue_id"]
+        user_id = obj_data["user_id"]
+        position = obj_data["position"]
+
+        source = select(
+            Queue.id,
+            literal(user_id, QueueEntries.user_id.type),
+            literal(position, Integer),
+        ).where(
+            Queue.id == queue_id,
+            self.usable_slots >= position,
         )
-
-        queue_entry = await self.session.execute(
-            select(self.model).filter(*filters),
+        stmt = (
+            self._dialect_insert()
+            .from_select(["queue_id", "user_id", "position"], source)
+            .on_conflict_do_nothing()
+            .returning(self.model)
         )
-        if queue_entry.scalar_one_or_none():
-            raise DuplicateEntryError
 
-        obj = self.model(**obj_data)
-        self.session.add(obj)
-        await self.session.commit()
+        result = await self.session.execute(stmt)
+        obj = result.scalar_one_or_none()
+        if obj is None:
+            await self._raise_reservation_error(queue_id, user_id, position)
 
+        await self.session.commit()
         return obj
 
+    async def create_many(
+        self,
+        objs_data: Sequence[dict[str, Any]],
+    ) -> list[QueueEntries | Exception | None]:
+        """
+        Assigns many positions with multi-row inserts and commits them once.
+
+        The queues are read in the same transaction first: entries of
+        missing queues or above `usable_slots` are rejected without
+        being inserted, the others are inserted by `BaseRepository.create_many`.
+
+        Args:
+            objs_data (Sequence[dict[str, Any]]): The queue, user
+            and position of each entry.
+
+        Returns:
+            list[QueueEntries | Exception | None]: For each item, the created
+            entry, None if the user or the position is taken, `NotFoundError`
+            for a missing queue or `PositionOutOfRangeError` for a position
+            beyond its slots (or the `IntegrityError` that rejected it).
+        """
+
+        result = await self.session.execute(
+            select(Queue.id, self.usable_slots).where(
+                Queue.id.in_({obj_data["queue_id"] for obj_data in objs_data})
+            )
+        )
+        max_slots = dict(result.tuples().all())
+
+        objs: list[QueueEntries | Exception | None] = [None] * len(objs_data)
+        valid = []
+        for index, obj_data in enumerate(objs_data):
+            queue_slots = max_slots.get(obj_data["queue_id"])
+            if queue_slots is None:
+                objs[index] = NotFoundError()
+            elif obj_data["position"] > queue_slots:
+                objs[index] = PositionOutOfRangeError()
+            else:
+                valid.append(index)
+
+        created = await super().create_many([objs_data[i] for i in valid])
+        for index, obj in zip(valid, created):
+            objs[index] = obj
+        return objs
+
+    async def create_in_free_slot(
+        self,
+        queue_id: int,
+        user_id: Any,
+    ) -> QueueEntries:
+        """
+        Reserves the lowest free position of a queue (up to `usable_slots`).
+
+        Free positions are found with an anti-join against a series of slot
+        numbers and inserted with `ON CONFLICT DO NOTHING`. On PostgreSQL a
+        transaction-level advisory lock per queue serializes concurrent
+        assignments, so they queue up instead of conflicting; the table is
+        never locked. A conflict with an explicit-position reservation is
+        retried a few times.
+
+        Args:
+            queue_id (int): The queue to join.
+            user_id (Any): The user taking the slot.
+
+        Returns:
+            QueueEntries: The created queue entry with its assigned position.
+
+        Raises:
+            NotFoundError: If the queue does not exist.
+            DuplicateEntryError: If the user already has an entry in the queue.
+            QueueFullError: If all positions are taken.
+            PositionTakenError: If every attempt lost a race for a position.
+        """
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            await self.session.execute(
+                select(
+                    func.pg_advisory_xact_lock(
+                        self.free_slot_lock_namespace,
+                        queue_id,
+                    )
+                )
+            )
+
+        max_slots = (
+            select(self.usable_slots).where(Queue.id == queue_id).scalar_subquery()
+        )
+        slots = select(literal(1, Integer).label("position")).cte(
+            "slots",
+            recursive=True,
+        )
+        slots = slots.union_all(
+            select(slots.c.position + 1).where(slots.c.position < max_slots)
+        )
+        source = (
+            select(
+                Queue.id,
+                literal(user_id, QueueEntries.user_id.type),
+                slots.c.position,
+            )
+            .where(
+                Queue.id == queue_id,
+                slots.c.position <= self.usable_slots,
+                ~exists().where(
+                    QueueEntries.queue_id == queue_id,
+                    QueueEntries.position == slots.c.position,
+                ),
+            )
+            .order_by(slots.c.position)
+            .limit(1)
+        )
+        stmt = (
+            self._dialect_insert()
+            .from_select(["queue_id", "user_id", "position"], source)
+            .on_conflict_do_nothing()
+            .returning(self.model)
+        )
+
+        for _ in range(self.free_slot_attempts):
+            result = await self.session.execute(stmt)
+            obj = result.scalar_one_or_none()
+            if obj is not None:
+                await self.session.commit()
+                return obj
+
+            query = select(
+                self.usable_slots.label("max_slots"),
+                exists()
+                .where(
+                    QueueEntries.queue_id == queue_id,
+                    QueueEntries.user_id == user_id,
+                )
+                .label("user_has_entry"),
+                select(func.count())
+                .where(QueueEntries.queue_id == queue_id)
+                .scalar_subquery()
+                .label("taken_slots"),
+            ).where(Queue.id == queue_id)
+
+            row = (await self.session.execute(query)).one_or_none()
+            error: type[Exception] | None = None
+            if row is None:
+                error = NotFoundError
+            elif row.user_has_entry:
+                error = DuplicateEntryError
+            elif row.taken_slots >= row.max_slots:
+                error = QueueFullError
+
+            if error is not None:
+                # release the advisory lock right away
+                await self.session.rollback()
+                raise error
+
+        await self.session.rollback()
+        raise PositionTakenError
+
+    async def _raise_reservation_error(
+        self,
+        queue_id: int,
+        user_id: Any,
+        position: int,
+    ) -> None:
+        """
+        Determines why a reservation inserted nothing and raises the matching error.
+
+        Args:
+            queue_id (int): The queue of the reservation.
+            user_id (Any): The user of the reservation.
+            position (int): The requested position.
+        """
+
+        query = select(
+            self.usable_slots,
+            exists().where(
+                QueueEntries.queue_id == queue_id,
+                QueueEntries.user_id == user_id,
+            ),
+        ).where(Queue.id == queue_id)
+
+        row = (await self.session.execute(query)).one_or_none()
+        if row is None:
+            raise NotFoundError
+        max_slots, user_has_entry = row
+
+        if position > max_slots:
+            raise PositionOutOfRangeError
+        if user_has_entry:
+            raise DuplicateEntryError
+        # uq_queue_position fired (the conflicting row may already be gone)
+        raise PositionTakenError
+
 
 class QueueTagsRepository(BaseRepository[QueueTags]):
     """
@@ -178,3 +724,166 @@ class QueueTagsRepository(BaseRepository[QueueTags]):
             session,
             condition_builder,
         )
+
+
+class QueueTemplateRepository(BaseRepository[QueueTemplate]):
+    """
+    Repository for managing queue templates and creating their queues.
+
+    Attributes:
+        session (AsyncSession): The database session.
+        condition_builder (ConditionBuilder): Utility for building query conditions.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        condition_builder: ConditionBuilder,
+    ):
+        super().__init__(
+            QueueTemplate,
+            session,
+            condition_builder,
+        )
+
+    async def create(
+        self,
+        obj_data: dict[str, Any],
+    ) -> QueueTemplate:
+        """
+        Creates a template linked to the given tags.
+
+        Args:
+            obj_data (dict[str, Any]): Field values of the template
+            and the IDs of its tags (`tag_ids`).
+
+        Returns:
+            QueueTemplate: The created template with its tags.
+
+        Raises:
+            NotFoundError: If a tag does not exist.
+        """
+
+        tag_ids = set(obj_data.get("tag_ids", ()))
+        tags = list(
+            (await self.session.execute(select(Tags).where(Tags.id.in_(tag_ids))))
+            .scalars()
+            .all()
+        )
+        if len(tags) != len(tag_ids):
+            raise NotFoundError
+
+        # the caller's dict is left as is (it may be logged or retried)
+        fields = {key: value for key, value in obj_data.items() if key != "tag_ids"}
+        template = QueueTemplate(**fields, tags=tags)
+        self.session.add(template)
+        await self.session.commit()
+        return template
+
+    async def get_all(self) -> list[QueueTemplate]:
+        """
+        Retrieves all templates with their tags.
+
+        Returns:
+            list[QueueTemplate]: A list of all templates.
+        """
+
+        result = await self.session.execute(
+            select(QueueTemplate)
+            .options(selectinload(QueueTemplate.tags))
+            .order_by(QueueTemplate.id)
+        )
+        return list(result.scalars().all())
+
+    async def materialize(
+        self,
+        now: datetime,
+        until: datetime,
+    ) -> list[int]:
+        """
+        Creates the queues of all active templates that start up to `until`,
+        with their tags, and moves the templates past them.
+
+        Everything is written in one transaction: one INSERT for the queues
+        and one for their tag links (both executemany, sent as multi-row
+        INSERTs), and one batched UPDATE of the templates. Due templates are
+        locked with SKIP LOCKED, so concurrent runs never create a queue twice.
+        Occurrences that already started (e.g. while the job was not running)
+        are skipped, since a queue cannot start in the past.
+
+        Args:
+            now (datetime): The current time.
+            until (datetime): The end of the horizon queues are created for.
+
+        Returns:
+            list[int]: The IDs of the created queues.
+        """
+
+        templates = (
+            (
+                await self.session.execute(
+                    select(QueueTemplate)
+                    .where(
+                        QueueTemplate.active,
+                        QueueTemplate.next_start_time <= until,
+                    )
+                    .order_by(QueueTemplate.id)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if not templates:
+            await self.session.commit()
+            return []
+
+        tag_ids: defaultdict[int, list[int]] = defaultdict(list)
+        for template_id, tag_id in await self.session.execute(
+            select(QueueTemplateTags.template_id, QueueTemplateTags.tag_id).where(
+                QueueTemplateTags.template_id.in_([t.id for t in templates])
+            )
+        ):
+            tag_ids[template_id].append(tag_id)
+
+        queues_data: list[dict[str, Any]] = []
+        owners: list[int] = []
+        for template in templates:
+            start_time = _aware(template.next_start_time)
+            step = timedelta(days=template.interval_days)
+            while start_time <= until:
+                if start_time >= now:
+                    queues_data.append(
+                        {
+                            "name": template.name,
+                            "start_time": start_time,
+                            "max_slots": template.max_slots,
+                        }
+                    )
+                    owners.append(template.id)
+                start_time += step
+            template.next_start_time = start_time
+
+        queue_ids: list[int] = []
+        if queues_data:
+            result = await self.session.execute(
+                insert(Queue).returning(Queue.id, sort_by_parameter_order=True),
+                queues_data,
+            )
+            queue_ids = list(result.scalars().all())
+
+            links = [
+                {"queue_id": queue_id, "tag_id": tag_id}
+                for queue_id, template_id in zip(queue_ids, owners)
+                for tag_id in tag_ids[template_id]
+            ]
+            if links:
+                await self.session.execute(insert(QueueTags), links)
+
+        await self.session.commit()
+        return queue_ids
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite drops the offset of stored datetimes; they are stored in UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
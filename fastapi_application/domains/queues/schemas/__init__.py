@@ -1,4 +1,5 @@
 __all__ = [
+    "AssignQueueEntry",
     "CreateQueueEntry",
     "QueueEntry",
     "GetQueueEntryAndUser",
@@ -6,12 +7,22 @@ __all__ = [
     "PutQueue",
     "CreateQueue",
     "GetQueueWithEntries",
+    "GetQueuesPage",
+    "CreateQueueTemplate",
+    "GetQueueTemplate",
 ]
 
-from .queue_entries import CreateQueueEntry, GetQueueEntryAndUser, QueueEntry
+from .queue_entries import (
+    AssignQueueEntry,
+    CreateQueueEntry,
+    GetQueueEntryAndUser,
+    QueueEntry,
+)
+from .queue_templates import CreateQueueTemplate, GetQueueTemplate
 from .queues import (
     CreateQueue,
     GetQueue,
+    GetQueuesPage,
     GetQueueWithEntries,
     PutQueue,
 )
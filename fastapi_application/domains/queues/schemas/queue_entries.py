@@ -16,5 +16,13 @@ class GetQueueEntryAndUser(BaseModel):
 
 
 class CreateQueueEntry(BaseModel):
-    position: int
+    # None lets the server assign the lowest free position
+    position: int | None = None
     queue_id: int
+
+
+class AssignQueueEntry(BaseModel):
+    # a position assigned to a user by an admin
+    queue_id: int
+    user_id: UUID
+    position: int
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from domains.tags.schemas import GetTag
+
+
+class QueueTemplateBase(BaseModel):
+    name: str = Field(max_length=10)
+    max_slots: int = Field(30, ge=1, le=40)
+    interval_days: int = Field(7, ge=1)
+
+
+class CreateQueueTemplate(QueueTemplateBase):
+    # the start time of the first queue of the series
+    next_start_time: datetime
+    tag_ids: list[int] = []
+
+
+class GetQueueTemplate(QueueTemplateBase):
+    id: int
+    next_start_time: datetime
+    active: bool
+    tags: list[GetTag] = []
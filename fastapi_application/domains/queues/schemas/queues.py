@@ -1,7 +1,8 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
+from domains.queues.models import MAX_POSITION
 from domains.queues.schemas.queue_entries import GetQueueEntryAndUser
 from domains.tags.schemas import TagBase
 
@@ -21,6 +22,20 @@ class PutQueue(BaseModel):
 class GetQueue(QueueBase):
     id: int
     tags: list[TagBase] = Field(default_factory=list, alias="queue_tags")
+    taken_slots: int = 0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def free_slots(self) -> int | None:
+        if self.max_slots is None:
+            return None
+        # positions above MAX_POSITION cannot be taken
+        return min(self.max_slots, MAX_POSITION) - self.taken_slots
+
+
+class GetQueuesPage(BaseModel):
+    items: list[GetQueue] = []
+    next_cursor: str | None = None
 
 
 class GetQueueWithEntries(QueueBase):
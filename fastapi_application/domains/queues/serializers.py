@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Any, Iterable
+
+import orjson
+from pydantic_core import to_jsonable_python
+
+from domains.queues.models import MAX_POSITION
+
+"""
+Fast JSON serialization of the hot queue read responses.
+
+The functions map loaded queues straight to dicts and serialize them with
+orjson, skipping the validation of `GetQueuesPage` / `GetQueueWithEntries`
+that FastAPI or `model_validate` would otherwise run on every object.
+The output is byte-identical to the schemas' (same keys, key order and
+value formats); `tests/unit/test_queue_serializers.py` holds that contract,
+so a change to the schemas must be mirrored here.
+
+Functions:
+    dump_queues_page: Serializes a `GetQueuesPage` response.
+    dump_queue_with_entries: Serializes a `GetQueueWithEntries` response.
+"""
+
+
+def _datetime(value: datetime) -> str:
+    # pydantic's JSON format ("Z" for UTC, no offset for naive values)
+    return to_jsonable_python(value)
+
+
+def _tags(tags: Iterable[Any]) -> list[dict[str, Any]]:
+    return [{"name": tag.name} for tag in tags]
+
+
+def dump_queues_page(queues: Iterable[Any], next_cursor: str | None) -> bytes:
+    """
+    Serializes a page of queues as a `GetQueuesPage` payload.
+
+    Args:
+        queues (Iterable[Any]): Queues with their `queue_tags`
+        and `taken_slots` loaded.
+        next_cursor (str | None): The cursor of the next page.
+
+    Returns:
+        bytes: The JSON payload.
+    """
+    return orjson.dumps(
+        {
+            "items": [
+                {
+                    "name": queue.name,
+                    "start_time": _datetime(queue.start_time),
+                    "max_slots": queue.max_slots,
+                    "id": queue.id,
+                    "queue_tags": _tags(queue.queue_tags),
+                    "taken_slots": queue.taken_slots,
+                    "free_slots": (
+                        None
+                        if queue.max_slots is None
+                        else min(queue.max_slots, MAX_POSITION) - queue.taken_slots
+                    ),
+                }
+                for queue in queues
+            ],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def dump_queue_with_entries(queue: Any) -> bytes:
+    """
+    Serializes a queue as a `GetQueueWithEntries` payload.
+
+    Args:
+        queue (Any): A queue with its `entries` (and their `user`)
+        and `queue_tags` loaded.
+
+    Returns:
+        bytes: The JSON payload.
+    """
+    return orjson.dumps(
+        {
+            "name": queue.name,
+            "start_time": _datetime(queue.start_time),
+            "max_slots": queue.max_slots,
+            "entries": [
+                {
+                    "position": entry.position,
+                    "user": {
+                        "first_name": entry.user.first_name,
+                        "last_name": entry.user.last_name,
+                    },
+                }
+                for entry in queue.entries
+            ],
+            "queue_tags": _tags(queue.queue_tags),
+        }
+    )
@@ -1,9 +1,12 @@
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, Sequence
 
 from fastapi import HTTPException
 from starlette import status
 
 from core.base.services import BaseService
+from core.broadcast import queue_broadcaster
+from core.cache import queue_cache
 from domains.queues import (
     Queue,
     QueueEntries,
@@ -11,7 +14,10 @@ from domains.queues import (
     QueueRepository,
     QueueTags,
     QueueTagsRepository,
+    QueueTemplate,
+    QueueTemplateRepository,
 )
+from domains.queues.serializers import dump_queue_with_entries
 
 
 class QueueEntryService(BaseService[QueueEntries, QueueEntriesRepository]):
@@ -29,6 +35,160 @@ class QueueEntryService(BaseService[QueueEntries, QueueEntriesRepository]):
     ):
         super().__init__(repository)
 
+    @staticmethod
+    async def _entries_changed(
+        queue_id: int,
+        event: dict[str, Any],
+    ) -> None:
+        """
+        Invalidates the cached queue and notifies stream subscribers.
+
+        Args:
+            queue_id (int): The queue whose entries changed.
+            event (dict[str, Any]): The occupancy delta to publish.
+        """
+
+        await queue_cache.invalidate(queue_id)
+        await queue_broadcaster.publish(queue_id, {**event, "queue_id": queue_id})
+
+    async def create(
+        self,
+        obj_data: dict[str, Any],
+    ) -> QueueEntries:
+        """
+        Creates a queue entry, invalidates the cached queue
+        and publishes a `position_taken` event.
+
+        Args:
+            obj_data (dict[str, Any]): The data for creating the queue entry.
+
+        Returns:
+            QueueEntries: The created queue entry.
+        """
+
+        entry = await super().create(obj_data)
+        await self._entries_changed(
+            entry.queue_id,
+            {"type": "position_taken", "position": entry.position},
+        )
+        return entry
+
+    async def create_in_free_slot(
+        self,
+        queue_id: int,
+        user_id: Any,
+    ) -> QueueEntries:
+        """
+        Assigns the lowest free position of a queue to the user.
+
+        Args:
+            queue_id (int): The queue to join.
+            user_id (Any): The user taking the slot.
+
+        Returns:
+            QueueEntries: The created queue entry with its assigned position.
+        """
+
+        entry = await self.repository.create_in_free_slot(queue_id, user_id)
+        await self._entries_changed(
+            entry.queue_id,
+            {"type": "position_taken", "position": entry.position},
+        )
+        return entry
+
+    async def delete(
+        self,
+        filters: dict[str, Any],
+    ) -> bool:
+        """
+        Deletes a queue entry, invalidates the cached queue
+        and publishes a `position_freed` event.
+
+        Args:
+            filters (dict[str, Any]): Filtering criteria for deletion.
+
+        Returns:
+            bool: True if the entry was deleted.
+
+        Raises:
+            HTTPException: If the entry is not found.
+        """
+
+        deleted_obj = await self.repository.delete(**filters)
+        if not deleted_obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Not Found",
+            )
+
+        await self._entries_changed(
+            deleted_obj.queue_id,
+            {"type": "position_freed", "position": deleted_obj.position},
+        )
+        return True
+
+    async def create_many(
+        self,
+        objs_data: Sequence[dict[str, Any]],
+    ) -> list[QueueEntries | Exception | None]:
+        """
+        Assigns many positions, invalidates the cached queues
+        and publishes a `position_taken` event per entry.
+
+        Args:
+            objs_data (Sequence[dict[str, Any]]): The queue, user
+            and position of each entry.
+
+        Returns:
+            list[QueueEntries | Exception | None]: For each item, the created
+            entry, None for a taken user or position, or the rejection error.
+        """
+
+        entries = await self.repository.create_many(objs_data)
+        await self._entries_changed_many(
+            [entry for entry in entries if isinstance(entry, QueueEntries)],
+            "position_taken",
+        )
+        return entries
+
+    async def delete_many(
+        self,
+        obj_ids: Sequence[int],
+    ) -> list[bool]:
+        """
+        Deletes many entries, invalidates the cached queues
+        and publishes a `position_freed` event per entry.
+
+        Args:
+            obj_ids (Sequence[int]): The IDs of the entries.
+
+        Returns:
+            list[bool]: For each ID, whether an entry was deleted.
+        """
+
+        deleted_objs = await self.repository.delete_many(obj_ids)
+        await self._entries_changed_many(deleted_objs, "position_freed")
+
+        deleted_ids = {obj.id for obj in deleted_objs}
+        return [obj_id in deleted_ids for obj_id in obj_ids]
+
+    @staticmethod
+    async def _entries_changed_many(
+        entries: Sequence[QueueEntries],
+        event_type: str,
+    ) -> None:
+        for queue_id in {entry.queue_id for entry in entries}:
+            await queue_cache.invalidate(queue_id)
+        for entry in entries:
+            await queue_broadcaster.publish(
+                entry.queue_id,
+                {
+                    "type": event_type,
+                    "position": entry.position,
+                    "queue_id": entry.queue_id,
+                },
+            )
+
     async def delete_all(
         self,
         filters: dict[str, Any],
@@ -48,6 +208,10 @@ class QueueEntryService(BaseService[QueueEntries, QueueEntriesRepository]):
 
         deleted_obj = await self.repository.delete_all(filters)
         if deleted_obj:
+            await self._entries_changed(
+                deleted_obj.queue_id,
+                {"type": "positions_cleared"},
+            )
             return True
 
         raise HTTPException(
@@ -64,7 +228,94 @@ class QueueTagService(BaseService[QueueTags, QueueTagsRepository]):
         repository (QueueTagsRepository): The repository handling queue tag operations.
     """
 
-    pass
+    async def create(
+        self,
+        obj_data: dict[str, Any],
+    ) -> QueueTags:
+        """
+        Links a tag to a queue and invalidates the cached queue.
+
+        Args:
+            obj_data (dict[str, Any]): The queue and tag identifiers.
+
+        Returns:
+            QueueTags: The created link.
+        """
+
+        queue_tag = await super().create(obj_data)
+        await queue_cache.invalidate(queue_tag.queue_id)
+        return queue_tag
+
+    async def delete(
+        self,
+        filters: dict[str, Any],
+    ) -> bool:
+        """
+        Unlinks a tag from a queue and invalidates the cached queue.
+
+        Args:
+            filters (dict[str, Any]): Filtering criteria for deletion.
+
+        Returns:
+            bool: True if the link was deleted.
+
+        Raises:
+            HTTPException: If the link is not found.
+        """
+
+        deleted_obj = await self.repository.delete(**filters)
+        if not deleted_obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Not Found",
+            )
+
+        await queue_cache.invalidate(deleted_obj.queue_id)
+        return True
+
+    async def create_many(
+        self,
+        objs_data: Sequence[dict[str, Any]],
+    ) -> list[QueueTags | Exception | None]:
+        """
+        Links many tags to queues and invalidates the cached queues.
+
+        Args:
+            objs_data (Sequence[dict[str, Any]]): The queue and tag identifiers.
+
+        Returns:
+            list[QueueTags | Exception | None]: The created links; None for
+            each link that already exists, the error for each link to
+            a missing queue or tag.
+        """
+
+        queue_tags = await super().create_many(objs_data)
+        for queue_id in {
+            obj.queue_id for obj in queue_tags if isinstance(obj, QueueTags)
+        }:
+            await queue_cache.invalidate(queue_id)
+        return queue_tags
+
+    async def delete_many(
+        self,
+        obj_ids: Sequence[int],
+    ) -> list[bool]:
+        """
+        Unlinks many tags from queues and invalidates the cached queues.
+
+        Args:
+            obj_ids (Sequence[int]): The IDs of the links.
+
+        Returns:
+            list[bool]: For each ID, whether a link was deleted.
+        """
+
+        deleted_objs = await self.repository.delete_many(obj_ids)
+        for queue_id in {obj.queue_id for obj in deleted_objs}:
+            await queue_cache.invalidate(queue_id)
+
+        deleted_ids = {obj.id for obj in deleted_objs}
+        return [obj_id in deleted_ids for obj_id in obj_ids]
 
 
 class QueueService(BaseService[Queue, QueueRepository]):
@@ -75,4 +326,176 @@ class QueueService(BaseService[Queue, QueueRepository]):
         repository (QueueRepository): The repository handling queue operations.
     """
 
-    pass
+    @staticmethod
+    async def _queue_closed(
+        queue_id: int,
+        reason: str,
+    ) -> None:
+        """
+        Invalidates the cached queue and tells stream subscribers
+        that the queue is gone, which ends their streams.
+
+        Args:
+            queue_id (int): The deleted or archived queue.
+            reason (str): Why the queue closed (`deleted` or `archived`).
+        """
+
+        await queue_cache.invalidate(queue_id)
+        await queue_broadcaster.publish(
+            queue_id,
+            {"type": "queue_closed", "reason": reason, "queue_id": queue_id},
+        )
+
+    async def get_with_entries(
+        self,
+        queue_id: int,
+        include_archived: bool = False,
+    ) -> bytes:
+        """
+        Returns the queue with its entries and tags as serialized JSON,
+        served from the response cache when possible.
+
+        Args:
+            queue_id (int): The ID of the queue.
+            include_archived (bool, optional): Whether an archived queue
+            is returned too (never cached). Defaults - False.
+
+        Returns:
+            bytes: The `GetQueueWithEntries` payload.
+
+        Raises:
+            HTTPException: If the queue is not found.
+        """
+
+        if include_archived:
+            archived = await self.repository.get_archived_detail(queue_id)
+            if archived is not None:
+                return dump_queue_with_entries(archived)
+
+        async def load() -> bytes:
+            queue = await self.repository.get_detail(queue_id)
+            if queue is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Object not found",
+                )
+            return dump_queue_with_entries(queue)
+
+        return await queue_cache.get_or_set(queue_id, load)
+
+    async def patch(
+        self,
+        filters: dict[str, Any],
+        **values: Any,
+    ) -> Queue:
+        """
+        Updates a queue and invalidates its cached payload.
+
+        Args:
+            filters (dict[str, Any]): Criteria identifying the queue.
+            **values (Any): Fields to update.
+
+        Returns:
+            Queue: The updated queue.
+        """
+
+        patched_obj = await super().patch(filters, **values)
+        await queue_cache.invalidate(patched_obj.id)
+        return patched_obj
+
+    async def delete(
+        self,
+        filters: dict[str, Any],
+    ) -> bool:
+        """
+        Deletes a queue, invalidates its cached payload
+        and closes its event streams.
+
+        Args:
+            filters (dict[str, Any]): Criteria identifying the queue (`id`).
+
+        Returns:
+            bool: True if the queue was deleted.
+        """
+
+        deleted = await super().delete(filters)
+        await self._queue_closed(filters["id"], "deleted")
+        return deleted
+
+    async def delete_many(
+        self,
+        obj_ids: Sequence[int],
+    ) -> list[bool]:
+        """
+        Deletes many queues, invalidates their cached payloads
+        and closes their event streams.
+
+        Args:
+            obj_ids (Sequence[int]): The IDs of the queues.
+
+        Returns:
+            list[bool]: For each ID, whether a queue was deleted.
+        """
+
+        deleted = await super().delete_many(obj_ids)
+        for obj_id, was_deleted in zip(obj_ids, deleted):
+            if was_deleted:
+                await self._queue_closed(obj_id, "deleted")
+        return deleted
+
+    async def archive(
+        self,
+        retention_days: int,
+        batch_size: int,
+    ) -> int:
+        """
+        Moves the queues that started more than `retention_days` days ago
+        to the archive, one batch (and transaction) at a time,
+        invalidates their cached payloads and closes their event streams.
+
+        Args:
+            retention_days (int): How long queues stay live after their start.
+            batch_size (int): The number of queues moved per transaction.
+
+        Returns:
+            int: The number of archived queues.
+        """
+
+        before = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        archived = 0
+        while True:
+            queue_ids = await self.repository.archive(before, batch_size)
+            for queue_id in queue_ids:
+                await self._queue_closed(queue_id, "archived")
+            archived += len(queue_ids)
+            if len(queue_ids) < batch_size:
+                return archived
+
+
+class QueueTemplateService(BaseService[QueueTemplate, QueueTemplateRepository]):
+    """
+    Service layer for recurring queue templates.
+
+    Attributes:
+        repository (QueueTemplateRepository): The repository handling templates.
+    """
+
+    async def materialize(
+        self,
+        horizon_days: int,
+    ) -> list[int]:
+        """
+        Creates the queues of all active templates that start
+        within the next `horizon_days` days.
+
+        Args:
+            horizon_days (int): How far ahead queues are created.
+
+        Returns:
+            list[int]: The IDs of the created queues.
+        """
+
+        now = datetime.now(timezone.utc)
+        return await self.repository.materialize(
+            now, now + timedelta(days=horizon_days)
+        )
@@ -1,4 +1,8 @@
+from typing import Any
+
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import and_
 
 from core.base.repository import BaseRepository
 from domains.tags import Tags
@@ -24,3 +28,46 @@ class TagsRepository(BaseRepository[Tags]):
             session,
             condition_builder,
         )
+
+    async def get_queue_ids(self, **conditions: Any) -> list[int]:
+        """
+        Retrieves the IDs of the queues linked to the matching tags.
+
+        Args:
+            **conditions (Any): Filter conditions of the tags.
+
+        Returns:
+            list[int]: The distinct queue IDs.
+        """
+
+        links = Tags.queues.property.secondary
+        result = await self.session.execute(
+            select(links.c.queue_id)
+            .where(links.c.tag_id.in_(self._tag_ids(**conditions)))
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def unlink_queues(self, **conditions: Any) -> list[int]:
+        """
+        Deletes the queue links of the matching tags, without committing,
+        so that the tag delete that follows removes no links unseen.
+
+        Args:
+            **conditions (Any): Filter conditions of the tags.
+
+        Returns:
+            list[int]: The distinct IDs of the queues that lost a tag.
+        """
+
+        links = Tags.queues.property.secondary
+        result = await self.session.execute(
+            delete(links)
+            .where(links.c.tag_id.in_(self._tag_ids(**conditions)))
+            .returning(links.c.queue_id)
+        )
+        return list(set(result.scalars().all()))
+
+    def _tag_ids(self, **conditions: Any) -> Any:
+        query_conditions = self.condition_builder.create_conditions(**conditions)
+        return select(Tags.id).where(and_(*query_conditions))
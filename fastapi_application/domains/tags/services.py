@@ -1,4 +1,7 @@
+from typing import Any, Sequence
+
 from core.base.services import BaseService
+from core.cache import queue_cache
 from domains.tags import Tags, TagsRepository
 
 
@@ -6,8 +9,78 @@ class TagsService(BaseService[Tags, TagsRepository]):
     """
     Service layer for handling business logic related to tags.
 
+    Cached queue details list the names of their tags, so renaming or
+    deleting a tag invalidates every cached queue linked to it.
+
     Attributes:
         repository (TagsRepository): The repository handling tag operations.
     """
 
-    pass
+    async def delete(
+        self,
+        filters: dict[str, Any],
+    ) -> bool:
+        """
+        Deletes a tag with its queue links and invalidates the cached queues.
+
+        Args:
+            filters (dict[str, Any]): Filtering criteria for deletion.
+
+        Returns:
+            bool: True if the tag was deleted.
+
+        Raises:
+            HTTPException: If the tag is not found.
+        """
+
+        queue_ids = await self.repository.unlink_queues(**filters)
+        deleted = await super().delete(filters)
+        await self._invalidate_queues(queue_ids)
+        return deleted
+
+    async def delete_many(
+        self,
+        obj_ids: Sequence[int],
+    ) -> list[bool]:
+        """
+        Deletes many tags with their queue links in one transaction
+        and invalidates the cached queues.
+
+        Args:
+            obj_ids (Sequence[int]): The IDs of the tags.
+
+        Returns:
+            list[bool]: For each ID, whether a tag was deleted.
+        """
+
+        queue_ids = await self.repository.unlink_queues(id__in=list(obj_ids))
+        deleted = await super().delete_many(obj_ids)
+        await self._invalidate_queues(queue_ids)
+        return deleted
+
+    async def patch(
+        self,
+        filters: dict[str, Any],
+        **values: Any,
+    ) -> dict[str, Any]:
+        """
+        Updates a tag and invalidates the cached queues linked to it.
+
+        Args:
+            filters (dict[str, Any]): Criteria identifying the tag.
+            **values (Any): The fields to update.
+
+        Returns:
+            dict[str, Any]: The updated tag data.
+
+        Raises:
+            HTTPException: If the tag is not found.
+        """
+
+        patched = await super().patch(filters, **values)
+        await self._invalidate_queues(await self.repository.get_queue_ids(**filters))
+        return patched
+
+    async def _invalidate_queues(self, queue_ids: Sequence[int]) -> None:
+        for queue_id in queue_ids:
+            await queue_cache.invalidate(queue_id)
@@ -6,6 +6,7 @@ __all__ = [
     "UserCreate",
     "UserForEntry",
     "ManageUserPermissions",
+    "RefreshTokenRequest",
     "UserService",
 ]
 
@@ -13,6 +14,7 @@ from .models import User
 from .repositories import UserRepository
 from .schemas import (
     ManageUserPermissions,
+    RefreshTokenRequest,
     UserCreate,
     UserForEntry,
     UserRead,
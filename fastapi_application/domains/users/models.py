@@ -37,6 +37,7 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
 
         return {
             "id": self.id,
+            "email": self.email,
             "first_name": self.first_name,
             "last_name": self.last_name,
         }
@@ -31,3 +31,7 @@ class ManageUserPermissions(BaseModel):
     is_active: Optional[bool] = None
     is_superuser: Optional[bool] = None
     is_verified: Optional[bool] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
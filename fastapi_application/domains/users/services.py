@@ -1,4 +1,9 @@
+from typing import Any
+
+from core.auth.revocation import revocation_list
 from core.base.services import BaseService
+from core.cache import user_cache
+from core.config import settings
 from domains.users import User, UserRepository
 
 
@@ -10,4 +15,30 @@ class UserService(BaseService[User, UserRepository]):
         repository (UserRepository): The repository handling user operations.
     """
 
-    pass
+    async def patch(
+        self,
+        filters: dict[str, Any],
+        **values: Any,
+    ) -> User:
+        """
+        Updates a user, drops their cached sessions and revokes
+        their access tokens, so permission changes apply to the next request.
+
+        Args:
+            filters (dict[str, Any]): Criteria for identifying the user
+            (e.g., {"email": "user@example.com"}).
+            **values (Any): Key-value pairs specifying fields to update.
+
+        Returns:
+            User: The updated user.
+
+        Raises:
+            HTTPException: If the user is not found.
+        """
+
+        user = await super().patch(filters, **values)
+        await user_cache.invalidate_user(user.id)
+        await revocation_list.revoke_user(
+            user.id, settings.access_token.lifetime_seconds
+        )
+        return user
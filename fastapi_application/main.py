@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -5,18 +6,38 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
+from tasks import task_publisher
 
 from api import router as api_router
+from core.auth import revocation_list
+from core.broadcast import queue_broadcaster
+from core.cache import queue_cache, user_cache
 from core.config import settings
 from core.db_helper import db_helper
+from core.db_routing import register_read_your_writes
+from core.pubsub import redis_client
 from utils.handle_exceptions import register_exception_handlers
+from utils.log_buffer import log_buffer
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # startapp
+    await queue_cache.start()
+    await user_cache.start()
+    await revocation_list.start()
+    await queue_broadcaster.start()
+    task_publisher.start()
+    await log_buffer.start()
     yield
     # shutdown
+    await log_buffer.stop()
+    await asyncio.to_thread(task_publisher.stop)
+    await queue_broadcaster.stop()
+    await revocation_list.stop()
+    await user_cache.stop()
+    await queue_cache.stop()
+    await redis_client.aclose()
     await db_helper.dispose()
 
 
@@ -25,6 +46,7 @@ main_app = FastAPI(
     lifespan=lifespan,
 )
 register_exception_handlers(main_app)
+register_read_your_writes(main_app)
 
 main_app.add_middleware(
     CORSMiddleware,
@@ -1,6 +1,17 @@
 __all__ = [
+    "archive_queues",
+    "materialize_queue_templates",
     "process_error",
     "process_log",
+    "process_log_batch",
+    "task_publisher",
 ]
 
-from .tasks import process_error, process_log
+from .publisher import task_publisher
+from .tasks import (
+    archive_queues,
+    materialize_queue_templates,
+    process_error,
+    process_log,
+    process_log_batch,
+)
@@ -22,5 +22,20 @@ celery_app.conf.accept_content = ["json"]
 
 celery_app.conf.task_routes = {
     "tasks.process_log": {"queue": "logs"},
+    "tasks.process_log_batch": {"queue": "logs"},
     "tasks.process_error": {"queue": "errors"},
+    "tasks.materialize_queue_templates": {"queue": "schedules"},
+    "tasks.archive_queues": {"queue": "schedules"},
+}
+
+# run by `celery -A tasks.celery_app beat` (a single instance)
+celery_app.conf.beat_schedule = {
+    "materialize-queue-templates": {
+        "task": "tasks.materialize_queue_templates",
+        "schedule": settings.queue_templates.materialize_interval_seconds,
+    },
+    "archive-queues": {
+        "task": "tasks.archive_queues",
+        "schedule": settings.archive.interval_seconds,
+    },
 }
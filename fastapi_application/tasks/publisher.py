@@ -0,0 +1,235 @@
+import logging
+import queue
+import threading
+from typing import Any, Literal
+
+from celery import Task
+
+from core.config import settings
+from tasks.celery_app import celery_app
+from tasks.spool import Spool
+
+log = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_newest", "drop_oldest", "spill"]
+
+_STOP = object()
+
+
+class TaskPublisher:
+    """
+    Sends Celery tasks to the broker from a dedicated thread.
+
+    `apply_async` is synchronous and stalls for as long as the broker does,
+    so callers on the event loop only put messages into a bounded queue.
+    When the queue is full, `submit` never waits: depending on the policy
+    the new message (`drop_newest`) or the oldest queued one (`drop_oldest`)
+    is discarded, and `submit` tells the caller so it can keep the data,
+    or the new message is written to the spool (`spill`).
+
+    With a spool, messages the broker rejected are written to disk instead
+    of being lost, and a second thread replays them every `replay_interval`.
+
+    Attributes:
+        overflow_policy (OverflowPolicy): What to do when the queue is full.
+        shutdown_timeout (float): How long `stop` waits for queued messages.
+        spool (Spool | None): Where undeliverable messages are kept.
+        replay_interval (float): How often the spool is replayed.
+        dropped (int): Number of messages discarded because the queue was full.
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        overflow_policy: OverflowPolicy = "drop_newest",
+        shutdown_timeout: float = 5.0,
+        spool: Spool | None = None,
+        replay_interval: float = 10.0,
+    ):
+        """
+        Initializes the publisher.
+
+        Args:
+            queue_size (int): Maximum number of messages waiting to be sent.
+            overflow_policy (OverflowPolicy, optional): What to discard
+            when the queue is full. Defaults - "drop_newest".
+            shutdown_timeout (float, optional): How long `stop` waits
+            for queued messages (in seconds). Defaults - 5.0.
+            spool (Spool | None, optional): Where undeliverable messages
+            are kept. Defaults - None (they are logged and lost).
+            replay_interval (float, optional): How often the spool
+            is replayed (in seconds). Defaults - 10.0.
+        """
+        if overflow_policy == "spill" and spool is None:
+            raise ValueError("The 'spill' overflow policy requires a spool")
+
+        self.overflow_policy = overflow_policy
+        self.shutdown_timeout = shutdown_timeout
+        self.spool = spool
+        self.replay_interval = replay_interval
+        self._queue: queue.Queue[Any] = queue.Queue(queue_size)
+        self._thread: threading.Thread | None = None
+        self._replayer: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self.dropped = 0
+
+    def submit(self, task: Task, args: list[Any]) -> bool:
+        """
+        Queues a task message without blocking the caller.
+
+        Args:
+            task (Task): The Celery task to send.
+            args (list[Any]): Positional arguments of the task.
+
+        Returns:
+            bool: False if the message was not accepted because the queue
+            is full (`drop_newest` policy), True otherwise.
+        """
+        try:
+            self._queue.put_nowait((task, args))
+            return True
+        except queue.Full:
+            pass
+
+        if self.overflow_policy == "spill" and self._spill(task, args):
+            return True
+
+        if self.overflow_policy == "drop_newest":
+            self._drop()
+            return False
+
+        try:
+            self._queue.get_nowait()
+            self._drop()
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait((task, args))
+        except queue.Full:
+            self._drop()
+            return False
+        return True
+
+    def pending(self) -> int:
+        """
+        Returns the number of messages waiting to be sent.
+        """
+        return self._queue.qsize()
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            log.warning("Publisher queue is full, %d messages dropped", self.dropped)
+
+    def _spill(self, task: Task, args: list[Any]) -> bool:
+        if self.spool is None:
+            return False
+        try:
+            self.spool.append(task.name, args)
+            return True
+        except Exception as e:
+            log.exception("Failed to spool %s: %s", task.name, e)
+            return False
+
+    def _send(self, task: Task, args: list[Any]) -> None:
+        try:
+            task.apply_async(args=args)
+        except Exception as e:
+            if self._spill(task, args):
+                log.warning("Broker unavailable, %s spooled: %s", task.name, e)
+            else:
+                log.exception("Failed to send %s: %s", task.name, e)
+
+    @staticmethod
+    def _send_spooled(task_name: str, args: list[Any]) -> None:
+        celery_app.tasks[task_name].apply_async(args=args)
+
+    def replay(self) -> int:
+        """
+        Sends spooled messages to the broker.
+
+        Returns:
+            int: Number of messages sent.
+        """
+        if self.spool is None:
+            return 0
+        sent = self.spool.replay(self._send_spooled)
+        if sent:
+            log.info("Replayed %d spooled messages", sent)
+        return sent
+
+    def _replay_periodically(self) -> None:
+        while not self._stopping.wait(self.replay_interval):
+            try:
+                self.replay()
+            except Exception:
+                log.exception("Spool replay failed")
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._send(*item)
+
+    def start(self) -> None:
+        """
+        Starts the sending thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="task-publisher",
+                daemon=True,
+            )
+            self._thread.start()
+
+        if self.spool is not None and self._replayer is None:
+            self._stopping.clear()
+            self._replayer = threading.Thread(
+                target=self._replay_periodically,
+                name="task-publisher-replayer",
+                daemon=True,
+            )
+            self._replayer.start()
+
+    def stop(self) -> None:
+        """
+        Sends the queued messages and stops the sending threads.
+
+        Messages still queued after `shutdown_timeout` are lost;
+        spooled messages stay on disk for the next replay.
+        """
+        if self._replayer is not None:
+            self._stopping.set()
+            self._replayer.join(self.shutdown_timeout)
+            self._replayer = None
+
+        if self._thread is not None:
+            try:
+                self._queue.put(_STOP, timeout=self.shutdown_timeout)
+            except queue.Full:
+                log.warning("Publisher queue did not drain, %d lost", self.pending())
+            self._thread.join(self.shutdown_timeout)
+            self._thread = None
+
+        if self.spool is not None:
+            # lets any process replay what this one has spooled
+            self.spool.close()
+
+
+task_publisher = TaskPublisher(
+    queue_size=settings.publisher.queue_size,
+    overflow_policy=settings.publisher.overflow_policy,
+    shutdown_timeout=settings.publisher.shutdown_timeout_seconds,
+    spool=(
+        Spool(
+            path=settings.spool.path,
+            max_segment_bytes=settings.spool.max_segment_bytes,
+            fsync=settings.spool.fsync,
+        )
+        if settings.spool.enabled
+        else None
+    ),
+    replay_interval=settings.spool.replay_interval_seconds,
+)
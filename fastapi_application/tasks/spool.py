@@ -0,0 +1,214 @@
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
+
+from kombu.utils.json import dumps, loads
+
+log = logging.getLogger(__name__)
+
+# record header: payload length and crc32 of the payload
+HEADER = struct.Struct(">II")
+
+OPEN_SUFFIX = ".open"
+SEALED_SUFFIX = ".seg"
+REPLAYING_SUFFIX = ".replaying"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _parse_segment(path: Path) -> tuple[str, int | None, str]:
+    """
+    Splits a segment name into its base (`<time>-<writer pid>`), the pid of
+    the process that owns it and its suffix.
+
+    An `.open` segment is owned by its writer,
+    a `<base>.<pid>.replaying` segment by the replaying process.
+    """
+    base, *rest = path.name.split(".")
+    suffix = f".{rest[-1]}" if rest else ""
+    try:
+        if suffix == REPLAYING_SUFFIX:
+            return base, int(rest[0]), suffix
+        return base, int(base.rsplit("-", 1)[-1]), suffix
+    except (ValueError, IndexError):
+        return base, None, suffix
+
+
+class Spool:
+    """
+    An append-only, segment-file spool for task messages that could not
+    be sent to the broker.
+
+    Every process appends to its own segment (`<time>-<pid>.open`), so
+    gunicorn workers never share a file. Segments are sealed (`.seg`)
+    when they grow past `max_segment_bytes` or before a replay. Any process
+    may replay sealed segments, and segments left open or half-replayed
+    by a dead process, by atomically renaming them to `.replaying`.
+    Each record carries a crc32, so a record torn by a crash is skipped.
+
+    Attributes:
+        path (Path): The spool directory, shared by all workers of a host.
+        max_segment_bytes (int): Size after which a segment is sealed.
+        fsync (bool): Whether every record is fsynced (survives power loss,
+        not only process crashes).
+    """
+
+    def __init__(self, path: str | Path, max_segment_bytes: int, fsync: bool = False):
+        """
+        Initializes the spool. The directory is created on first use.
+
+        Args:
+            path (str | Path): The spool directory.
+            max_segment_bytes (int): Size after which a segment is sealed.
+            fsync (bool, optional): Whether every record is fsynced.
+            Defaults - False.
+        """
+        self.path = Path(path)
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        self._file_path: Path | None = None
+
+    def append(self, task_name: str, args: list[Any]) -> None:
+        """
+        Writes a task message to the current segment.
+
+        Args:
+            task_name (str): The registered name of the Celery task.
+            args (list[Any]): Positional arguments of the task.
+        """
+        payload = dumps({"task": task_name, "args": args}).encode()
+        record = HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            file = self._open_segment()
+            file.write(record)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+            if file.tell() >= self.max_segment_bytes:
+                self._seal()
+
+    def replay(self, send: Callable[[str, list[Any]], None]) -> int:
+        """
+        Sends spooled messages until the spool is empty or sending fails.
+
+        Messages not sent because of a failure are kept for the next replay.
+
+        Args:
+            send (Callable[[str, list[Any]], None]): Sends one message;
+            it must raise if the message was not accepted.
+
+        Returns:
+            int: Number of messages sent.
+        """
+        with self._lock:
+            self._seal()
+
+        sent = 0
+        for segment in self._claim_segments():
+            records = list(self._read(segment))
+            for i, record in enumerate(records):
+                try:
+                    send(record["task"], record["args"])
+                except Exception as e:
+                    log.warning("Spool replay paused: %s", e)
+                    self._requeue(records[i:])
+                    segment.unlink()
+                    return sent
+                sent += 1
+            segment.unlink()
+        return sent
+
+    def close(self) -> None:
+        """
+        Seals the current segment so that it can be replayed by any process.
+        """
+        with self._lock:
+            self._seal()
+
+    def _open_segment(self) -> BinaryIO:
+        if self._file is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            name = f"{time.time_ns()}-{os.getpid()}{OPEN_SUFFIX}"
+            self._file_path = self.path / name
+            self._file = open(self._file_path, "ab")
+        return self._file
+
+    def _seal(self) -> None:
+        if self._file is None or self._file_path is None:
+            return
+        self._file.close()
+        if self._file_path.stat().st_size:
+            self._file_path.rename(self._file_path.with_suffix(SEALED_SUFFIX))
+        else:
+            self._file_path.unlink()
+        self._file = None
+        self._file_path = None
+
+    def _requeue(self, records: list[dict[str, Any]]) -> None:
+        with self._lock:
+            for record in records:
+                payload = dumps(record).encode()
+                file = self._open_segment()
+                file.write(HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            self._seal()
+
+    def _claim_segments(self) -> Iterator[Path]:
+        """
+        Yields segments this process now owns, renamed to `.replaying`.
+        """
+        if not self.path.is_dir():
+            return
+
+        pid = os.getpid()
+        for segment in sorted(self.path.iterdir()):
+            base, owner, suffix = _parse_segment(segment)
+            if suffix in (OPEN_SUFFIX, REPLAYING_SUFFIX):
+                # left behind by a process that died (or by an earlier
+                # process with our pid), but never our current segment
+                if owner is None or (owner != pid and _pid_alive(owner)):
+                    continue
+                if segment == self._file_path:
+                    continue
+            elif suffix != SEALED_SUFFIX:
+                continue
+
+            claimed = self.path / f"{base}.{pid}{REPLAYING_SUFFIX}"
+            try:
+                segment.rename(claimed)
+            except FileNotFoundError:
+                # claimed by another process
+                continue
+            yield claimed
+
+    @staticmethod
+    def _read(segment: Path) -> Iterator[dict[str, Any]]:
+        data = segment.read_bytes()
+        offset = 0
+        while offset + HEADER.size <= len(data):
+            length, crc = HEADER.unpack_from(data, offset)
+            payload = data[offset + HEADER.size : offset + HEADER.size + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            yield loads(payload)
+            offset += HEADER.size + length
+
+        if offset != len(data):
+            log.warning(
+                "Skipped %d torn bytes at the end of %s", len(data) - offset, segment
+            )
@@ -1,12 +1,23 @@
-import asyncio
 import logging
+from collections import defaultdict
 from typing import Any, SupportsBytes
 
 from celery import Task
 
-from core.mongodb.connection import get_mongo_manager
+from core.config import settings
+from core.db_helper import db_helper
 from core.mongodb.schemas import ActionLog
+from domains.queues import (
+    Queue,
+    QueueRepository,
+    QueueService,
+    QueueTemplate,
+    QueueTemplateRepository,
+    QueueTemplateService,
+)
 from tasks.celery_app import celery_app
+from tasks.worker import get_worker_context, run_in_worker
+from utils import get_condition_builder
 
 log = logging.getLogger(__name__)
 
@@ -24,7 +35,7 @@ async def async_process_log(log_data: dict[str, Any]) -> None:
         raise
 
     log_entry = ActionLog(**log_data)
-    mongo_manager = get_mongo_manager()
+    mongo_manager = get_worker_context().mongo
     collection = mongo_manager.get_collection(collection_name)
     await collection.insert_one(log_entry.model_dump())
 
@@ -43,19 +54,62 @@ def process_log(
     """
     log.info("start consuming log")
     try:
-        asyncio.run(async_process_log(log_data))
+        run_in_worker(async_process_log(log_data))
     except Exception as exc:
         log.exception("Error processing log_data: %s", log_data)
         raise self.retry(exc=exc, countdown=10)
 
 
+async def async_process_log_batch(batch: list[dict[str, Any]]) -> None:
+    """
+    Save a batch of log entries in MongoDB with one `insert_many` per collection.
+
+    Entries without a 'collection_name' are skipped and reported.
+    """
+    entries_by_collection: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for log_data in batch:
+        # extra keys are ignored by ActionLog, the batch is kept intact for retries
+        collection_name = log_data.get("collection_name")
+        if collection_name is None:
+            log.error("Missing 'collection_name' in log_data: %s", log_data)
+            continue
+        entries_by_collection[collection_name].append(
+            ActionLog(**log_data).model_dump()
+        )
+
+    mongo_manager = get_worker_context().mongo
+    for collection_name, entries in entries_by_collection.items():
+        collection = mongo_manager.get_collection(collection_name)  # type: ignore[arg-type]
+        await collection.insert_many(entries, ordered=False)
+
+
+@celery_app.task(
+    bind=True,
+    name="tasks.process_log_batch",
+    max_retries=3,
+)
+def process_log_batch(
+    self: Task,
+    batch: list[dict[str, SupportsBytes]],
+) -> None:
+    """
+    Celery task to process a batch of log entries.
+    """
+    log.info("start consuming %d logs", len(batch))
+    try:
+        run_in_worker(async_process_log_batch(batch))
+    except Exception as exc:
+        log.exception("Error processing a batch of %d logs", len(batch))
+        raise self.retry(exc=exc, countdown=10)
+
+
 async def async_process_error_log(
     log_data: dict[str, Any],
 ) -> None:
     """
     Process and save an error log in MongoDB.
     """
-    mongo_manager = get_mongo_manager()
+    mongo_manager = get_worker_context().mongo
     collection = mongo_manager.get_collection("errors")
     await collection.insert_one(log_data)
 
@@ -73,7 +127,71 @@ def process_error(
     Celery task to process an error log.
     """
     try:
-        asyncio.run(async_process_error_log(log_data))
+        run_in_worker(async_process_error_log(log_data))
     except Exception as exc:
         log.exception("Error processing error log_data: %s", log_data)
         raise self.retry(exc=exc, countdown=10)
+
+
+async def async_materialize_queue_templates(horizon_days: int) -> list[int]:
+    """
+    Create the upcoming queues of all recurring templates.
+    """
+    async with db_helper.session_factory() as session:
+        repository = QueueTemplateRepository(
+            session, get_condition_builder(QueueTemplate)()
+        )
+        return await QueueTemplateService(repository).materialize(horizon_days)
+
+
+@celery_app.task(
+    bind=True,
+    name="tasks.materialize_queue_templates",
+    max_retries=3,
+)
+def materialize_queue_templates(self: Task) -> int:
+    """
+    Celery beat task creating the upcoming queues of recurring templates.
+    """
+    try:
+        queue_ids = run_in_worker(
+            async_materialize_queue_templates(settings.queue_templates.horizon_days)
+        )
+    except Exception as exc:
+        log.exception("Error materializing queue templates")
+        raise self.retry(exc=exc, countdown=60)
+
+    log.info("created %d queues from templates", len(queue_ids))
+    return len(queue_ids)
+
+
+async def async_archive_queues(retention_days: int, batch_size: int) -> int:
+    """
+    Move the queues past their retention to the archive tables.
+    """
+    async with db_helper.session_factory() as session:
+        repository = QueueRepository(session, get_condition_builder(Queue)())
+        return await QueueService(repository).archive(retention_days, batch_size)
+
+
+@celery_app.task(
+    bind=True,
+    name="tasks.archive_queues",
+    max_retries=3,
+)
+def archive_queues(self: Task) -> int:
+    """
+    Celery beat task archiving past queues.
+    """
+    try:
+        archived = run_in_worker(
+            async_archive_queues(
+                settings.archive.retention_days, settings.archive.batch_size
+            )
+        )
+    except Exception as exc:
+        log.exception("Error archiving queues")
+        raise self.retry(exc=exc, countdown=60)
+
+    log.info("archived %d queues", archived)
+    return archived
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from core.mongodb.connection import MongoConnectionManager, get_mongo_manager
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerContext:
+    """
+    Resources shared by all tasks executed in one worker process:
+    a single event loop and a single MongoDB client (and its connection pool).
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): The event loop the tasks run on.
+        mongo (MongoConnectionManager): The MongoDB connection manager.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.mongo: MongoConnectionManager = get_mongo_manager()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Runs a coroutine to completion on the worker event loop.
+
+        Args:
+            coro (Coroutine): The coroutine to run.
+
+        Returns:
+            T: The result of the coroutine.
+        """
+        return self.loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """
+        Closes the MongoDB client and the event loop.
+        """
+        self.mongo.client.close()
+        self.loop.close()
+
+
+# the context is per thread, so thread-based pools get one loop per thread
+_local = threading.local()
+
+
+def get_worker_context() -> WorkerContext:
+    """
+    Returns the context of the current worker process.
+
+    The context is normally created by the `worker_process_init` hook,
+    and lazily for pools that do not fire it (solo, threads) or eager calls.
+
+    Returns:
+        WorkerContext: The context of the current worker.
+    """
+    context: WorkerContext | None = getattr(_local, "context", None)
+    if context is None:
+        context = _local.context = WorkerContext()
+    return context
+
+
+def run_in_worker(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs a coroutine on the persistent event loop of the current worker.
+
+    Args:
+        coro (Coroutine): The coroutine to run.
+
+    Returns:
+        T: The result of the coroutine.
+    """
+    return get_worker_context().run(coro)
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs: Any) -> None:
+    """
+    Creates the worker context when a pool process starts.
+    """
+    get_worker_context()
+    log.info("worker process context initialized")
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs: Any) -> None:
+    """
+    Releases the worker context when a pool process exits.
+    """
+    context: WorkerContext | None = getattr(_local, "context", None)
+    if context is not None:
+        context.close()
+        _local.context = None
@@ -1,20 +1,41 @@
+from functools import cache
 from typing import TYPE_CHECKING, Any, Callable, List, Type
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import ColumnElement
 
 if TYPE_CHECKING:
     from core.types import TModels
 
+# Filter operators, used as a `__<operator>` suffix of the field name.
+# Every operator binds its value as a parameter, so statements differing
+# only in values share one entry of SQLAlchemy's compiled cache.
+OPERATORS: dict[str, Callable[[Any, Any], ColumnElement[bool]]] = {
+    "eq": lambda column, value: column == value,
+    "in": lambda column, value: column.in_(value),
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "ilike": lambda column, value: column.ilike(value),
+    "isnull": lambda column, value: column.is_(None) if value else column.isnot(None),
+}
+
 
 class ConditionBuilder:
     """
     A utility class for dynamically generating filtering and loading conditions
     for SQLAlchemy queries.
 
+    The builder is stateless: column and relationship lookups are resolved
+    once per model, and every call returns new conditions, so one instance
+    is shared by all requests.
+
     Attributes:
         model (Type[TModels]): The SQLAlchemy model associated with condition builder.
-        filters (List[Any]): List of filter conditions for the query.
-        options (List[Any]): List of loading options for relationships.
+        columns (dict[str, Any]): Column attributes of the model by name.
+        relations (dict[str, Any]): Relationship attributes of the model by name.
     """
 
     def __init__(self, model: Type["TModels"]):
@@ -26,32 +47,47 @@ class ConditionBuilder:
              The SQLAlchemy model for which conditions will be built.
         """
         self.model = model
-        self.filters: List[Any] = []
-        self.options: List[Any] = []
+        mapper = inspect(model)
+        self.columns: dict[str, Any] = {
+            attr.key: getattr(model, attr.key) for attr in mapper.column_attrs
+        }
+        self.relations: dict[str, Any] = {
+            name: getattr(model, name) for name in mapper.relationships.keys()
+        }
 
     def create_conditions(self, **conditions: Any) -> List[Any]:
         """
         Generates filtering conditions based on the provided keyword arguments.
 
+        A key is a field name, optionally followed by an operator:
+        `name`, `id__in`, `start_time__gte`, `start_time__lt`,
+        `name__ilike`, `deleted_at__isnull`.
+
         Args:
             **conditions (Any): Key-value pairs where the key is the model's field name
-            and the value is the filtering value.
+            (with an optional operator) and the value is the filtering value.
 
         Returns:
             List[Any]: A list of SQLAlchemy filter conditions.
 
         Raises:
             AttributeError: If the model does not contain the specified attribute.
+            ValueError: If the operator is not supported.
         """
 
+        filters = []
         for key, value in conditions.items():
-            column = getattr(self.model, key, None)
+            field, _, operator = key.partition("__")
+            column = self.columns.get(field)
             if column is None:
                 raise AttributeError(
-                    f"Model '{self.model.__name__}' has no attribute '{key}'"
+                    f"Model '{self.model.__name__}' has no attribute '{field}'"
                 )
-            self.filters.append(column == value)
-        return self.filters
+            build = OPERATORS.get(operator or "eq")
+            if build is None:
+                raise ValueError(f"Unsupported filter operator '{operator}'")
+            filters.append(build(column, value))
+        return filters
 
     def create_options(self, *relation_names: str) -> List[Any]:
         """
@@ -66,21 +102,26 @@ class ConditionBuilder:
         Raises:
             AttributeError: If the model does not contain the specified relationship.
         """
+        options = []
         for name in relation_names:
-            relation = getattr(self.model, name, None)
+            relation = self.relations.get(name)
             if relation is None:
                 raise AttributeError(
                     f"Model '{self.model.__name__}' has no relation '{name}'"
                 )
-            self.options.append(selectinload(relation))
-        return self.options
+            options.append(selectinload(relation))
+        return options
 
 
+@cache
 def get_condition_builder(
     model_type: Type["TModels"],
 ) -> Callable[..., ConditionBuilder]:
     """
-    Provides a factory function to create a `ConditionBuilder` instance for a model.
+    Provides a factory function returning the `ConditionBuilder` of a model.
+
+    The builder is created once, when the factory is requested (at import
+    time of the dependency graph), and shared by every request.
 
     Args:
         model_type (Type[TModels]):
@@ -88,16 +129,18 @@ def get_condition_builder(
 
     Returns:
         Callable[..., ConditionBuilder]:
-         A function that, when called, returns a `ConditionBuilder` instance.
+         A function that, when called, returns the model's `ConditionBuilder`.
     """
 
+    builder = ConditionBuilder(model_type)
+
     def create_condition_builder() -> ConditionBuilder:
         """
-        Creates and returns a `ConditionBuilder` instance for the specified model.
+        Returns the shared `ConditionBuilder` instance for the specified model.
 
         Returns:
-            ConditionBuilder: A new instance of `ConditionBuilder` for the given model.
+            ConditionBuilder: The condition builder for the given model.
         """
-        return ConditionBuilder(model_type)
+        return builder
 
     return create_condition_builder
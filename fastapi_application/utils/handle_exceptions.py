@@ -4,9 +4,15 @@ from datetime import datetime, timezone
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import DBAPIError, IntegrityError
-from tasks import process_error
+from tasks import process_error, task_publisher
 
-from core.exceptions import DuplicateEntryError
+from core.exceptions import (
+    DuplicateEntryError,
+    NotFoundError,
+    PositionOutOfRangeError,
+    PositionTakenError,
+    QueueFullError,
+)
 
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
@@ -19,7 +25,8 @@ def register_exception_handlers(app: FastAPI) -> None:
     This function defines exception handlers for common errors, including:
     - Validation errors
     - Database integrity errors
-    - Duplicate entry errors
+    - Duplicate entry and queue position errors
+    - Missing objects
     - HTTP exceptions
     - General system and database errors
 
@@ -93,6 +100,70 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(PositionTakenError)
+    async def position_taken_error_handler(
+        request: Request,
+        exc: PositionTakenError,
+    ) -> JSONResponse:
+        """
+        Handles attempts to take a queue position occupied by another user
+        """
+        return JSONResponse(
+            status_code=409,  # 409 Conflict
+            content={
+                "error": "Position Taken",
+                "message": "This position is already taken",
+            },
+        )
+
+    @app.exception_handler(PositionOutOfRangeError)
+    async def position_out_of_range_error_handler(
+        request: Request,
+        exc: PositionOutOfRangeError,
+    ) -> JSONResponse:
+        """
+        Handles attempts to take a position above the queue's slot count
+        """
+        return JSONResponse(
+            status_code=409,  # 409 Conflict
+            content={
+                "error": "Position Out Of Range",
+                "message": "Position exceeds the number of slots in the queue",
+            },
+        )
+
+    @app.exception_handler(QueueFullError)
+    async def queue_full_error_handler(
+        request: Request,
+        exc: QueueFullError,
+    ) -> JSONResponse:
+        """
+        Handles attempts to join a queue without free positions
+        """
+        return JSONResponse(
+            status_code=409,  # 409 Conflict
+            content={
+                "error": "Queue Full",
+                "message": "There are no free positions in the queue",
+            },
+        )
+
+    @app.exception_handler(NotFoundError)
+    async def not_found_error_handler(
+        request: Request,
+        exc: NotFoundError,
+    ) -> JSONResponse:
+        """
+        Handles references to objects that do not exist
+        """
+        return JSONResponse(
+            status_code=404,  # 404 Not Found
+            content={
+                "error": "Not Found",
+                "message": "Requested resource does not exist",
+            },
+        )
+
     @app.exception_handler(DBAPIError)
     async def dbapi_error_handler(
         request: Request,
@@ -142,7 +213,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         logger.error(error_info)
         error_data = {"error": error_info, "timestamp": datetime.now(timezone.utc)}
 
-        process_error.apply_async(args=[error_data])
+        task_publisher.submit(process_error, [error_data])
 
         return JSONResponse(
             status_code=500,
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any
+
+from tasks import process_log_batch, task_publisher
+
+from core.config import settings
+
+log = logging.getLogger(__name__)
+
+
+class LogBuffer:
+    """
+    Collects action logs in memory and sends them to the broker in batches.
+
+    A batch is sent when `batch_size` logs are buffered or when the oldest
+    buffered log has waited `flush_interval` seconds, whichever comes first,
+    so each Celery message carries many logs instead of one.
+
+    Attributes:
+        batch_size (int): Number of logs that triggers an immediate flush.
+        flush_interval (float): Maximum time a log waits in the buffer.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_size: int):
+        """
+        Initializes the buffer.
+
+        Args:
+            batch_size (int): Number of logs that triggers an immediate flush.
+            flush_interval (float): Maximum time a log waits (in seconds).
+            max_size (int): Maximum number of buffered logs;
+            the oldest logs are dropped once it is reached.
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._entries: deque[dict[str, Any]] = deque(maxlen=max_size)
+        self._dropped = 0
+        self._batch_ready: asyncio.Event | None = None
+        self._flusher: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, data: dict[str, Any]) -> None:
+        """
+        Buffers a log entry without blocking the caller.
+
+        Args:
+            data (dict[str, Any]): The log entry.
+        """
+        if len(self._entries) == self._entries.maxlen:
+            self._dropped += 1
+        self._entries.append(data)
+        if self._batch_ready is not None and len(self._entries) >= self.batch_size:
+            self._batch_ready.set()
+
+    def flush(self) -> None:
+        """
+        Hands all buffered logs over to the task publisher.
+
+        If the publisher queue is full, the remaining logs stay buffered
+        until the next flush.
+        """
+        if self._dropped:
+            log.warning("Log buffer overflow, dropped %d logs", self._dropped)
+            self._dropped = 0
+
+        while self._entries:
+            batch = [
+                self._entries.popleft()
+                for _ in range(min(self.batch_size, len(self._entries)))
+            ]
+            if not task_publisher.submit(process_log_batch, [batch]):
+                self._entries.extendleft(reversed(batch))
+                return
+
+    async def start(self) -> None:
+        """
+        Starts flushing the buffer in the background.
+        """
+        if self._flusher is None:
+            # created here to bind it to the running event loop
+            self._batch_ready = asyncio.Event()
+            self._flusher = asyncio.create_task(self._run(self._batch_ready))
+
+    async def stop(self) -> None:
+        """
+        Stops the background flusher and sends the remaining logs.
+        """
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+            self._batch_ready = None
+        self.flush()
+
+    async def _run(self, batch_ready: asyncio.Event) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(batch_ready.wait(), self.flush_interval)
+            except TimeoutError:
+                pass
+            batch_ready.clear()
+            self.flush()
+
+
+log_buffer = LogBuffer(
+    batch_size=settings.log_buffer.batch_size,
+    flush_interval=settings.log_buffer.flush_interval_seconds,
+    max_size=settings.log_buffer.max_size,
+)
@@ -1,9 +1,9 @@
-import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timezone
 from functools import wraps
 from typing import Any, Callable
+from uuid import UUID
 
-from tasks import process_log
+from utils.log_buffer import log_buffer
 
 
 def get_log_params(
@@ -32,6 +32,34 @@ def get_log_params(
     }
 
 
+def to_log_value(value: Any) -> Any:
+    """
+    Converts a logged value into one the json-only broker and MongoDB accept.
+
+    Models (and the `User`, see `User.model_dump`) are dumped, containers
+    are converted item by item and UUIDs become strings; any other object
+    is logged as its string form, so one entry cannot fail a whole batch.
+
+    Args:
+        value (Any): A logged parameter or a part of it.
+
+    Returns:
+        Any: The JSON-safe value.
+    """
+    if hasattr(value, "model_dump"):
+        value = value.model_dump()
+
+    if value is None or isinstance(value, (str, int, float, datetime, date, time)):
+        return value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, dict):
+        return {str(name): to_log_value(item) for name, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [to_log_value(item) for item in value]
+    return str(value)
+
+
 def log_action(
     action: str,
     collection_name: str,
@@ -42,6 +70,7 @@ def log_action(
 
     Logs the action, parameters of the endpoint, status, and timestamp.
     If an error occurs, the error is logged too.
+    Logs are buffered and sent to the broker in batches (see `LogBuffer`).
 
     Args:
         action (str):
@@ -71,7 +100,7 @@ def log_action(
 
             status = "success"
             error = None
-            logged_args = get_log_params(log_params, **kwargs)
+            logged_args = to_log_value(get_log_params(log_params, **kwargs))
 
             try:
                 return await func(*args, **kwargs)
@@ -92,12 +121,7 @@ def log_action(
                 }
                 if error:
                     data.update({"error": error})
-                try:
-                    process_log.apply_async(args=[data])
-                except Exception as e:
-                    # must crete a method that saves log to postgres if rabbitmq is down
-                    log = logging.getLogger("process_log")
-                    log.exception("error occurred while executing process_log %s", e)
+                log_buffer.add(data)
 
         return wrapper
 
@@ -0,0 +1,68 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Sequence
+
+import orjson
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes keyset values of the last returned row into an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): Values of the ordering columns, in order.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode()
+
+
+def decode_cursor(
+    cursor: str,
+    columns: Sequence[InstrumentedAttribute[Any]],
+) -> list[Any]:
+    """
+    Decodes a cursor produced by `encode_cursor` back into typed column values.
+
+    Args:
+        cursor (str): The cursor received from the client.
+        columns (Sequence[InstrumentedAttribute]): The ordering columns
+        the cursor was built for.
+
+    Returns:
+        list[Any]: Values converted to the python types of the columns.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the columns.
+    """
+
+    try:
+        raw_values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, orjson.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(raw_values, list) or len(raw_values) != len(columns):
+        raise ValueError("Invalid cursor")
+
+    values = []
+    for column, value in zip(columns, raw_values):
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            values.append(value)
+            continue
+
+        try:
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                value = python_type(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        values.append(value)
+
+    return values
@@ -0,0 +1,51 @@
+import asyncio
+import importlib.util
+from typing import Any, Awaitable, Callable
+
+import pytest
+import pytest_asyncio
+from _pytest.nodes import Item
+
+# Micro-benchmarks of the repository and serialization layers (pytest-benchmark).
+# They are skipped in regular test runs; `benchmarks/micro.py` runs them,
+# stores baselines and compares against them.
+
+
+def pytest_runtest_setup(item: Item) -> None:
+    """
+    Skips benchmarks unless pytest-benchmark is installed
+    and the run was started with `--benchmark-only`.
+    """
+    if importlib.util.find_spec("pytest_benchmark") is None:
+        pytest.skip("pytest-benchmark is not installed")
+    if not item.config.getoption("benchmark_only", default=False):
+        pytest.skip("benchmarks run with --benchmark-only (see benchmarks/micro.py)")
+
+
+@pytest_asyncio.fixture
+async def async_benchmark(benchmark: Any) -> Callable[..., Awaitable[Any]]:
+    """
+    Benchmarks a coroutine function on the event loop of the test.
+
+    `benchmark` is synchronous, so it runs in a worker thread and submits
+    every round to the test's loop, where the session and its connection
+    live (asyncpg connections are bound to the loop that opened them).
+    The thread hand-off adds a constant cost to each round.
+
+    Returns:
+        Callable[..., Awaitable[Any]]: Awaits `benchmark` of the given
+        coroutine function and arguments, returning the last result.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def run(
+        func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        def call() -> Any:
+            return asyncio.run_coroutine_threadsafe(
+                func(*args, **kwargs), loop
+            ).result()
+
+        return await asyncio.to_thread(benchmark, call)
+
+    return run
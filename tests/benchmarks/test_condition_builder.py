@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from domains.queues import Queue
+from utils import get_condition_builder
+
+START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"id": 1},
+        {
+            "name__ilike": "%queue%",
+            "start_time__gte": START,
+            "start_time__lt": START + timedelta(days=7),
+        },
+        {"id__in": list(range(1000))},
+    ],
+    ids=["eq", "listing-filters", "in-1000"],
+)
+def test_create_conditions(benchmark: Any, conditions: dict[str, Any]) -> None:
+    """
+    Measures building the WHERE clauses of a repository query.
+    """
+    builder = get_condition_builder(Queue)()
+
+    filters = benchmark(builder.create_conditions, **conditions)
+
+    assert len(filters) == len(conditions)
+
+
+def test_create_options(benchmark: Any) -> None:
+    """
+    Measures building the eager loading options of a repository query.
+    """
+    builder = get_condition_builder(Queue)()
+
+    options = benchmark(builder.create_options, "entries", "queue_tags")
+
+    assert len(options) == 2
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from domains.queues import CreateQueue
+from domains.users import UserRead
+from utils.logger import get_log_params
+
+# The keyword arguments of a typical logged endpoint call
+KWARGS = {
+    "queue": CreateQueue(
+        name="queue",
+        start_time=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        max_slots=30,
+    ),
+    "user": UserRead(
+        id=uuid4(),
+        email="user@example.com",
+        first_name="Test",
+        last_name="User",
+    ),
+    "queue_id": 1,
+    "session": object(),
+}
+
+
+@pytest.mark.parametrize(
+    "allowed_params",
+    [None, ("queue", "user")],
+    ids=["all", "allowed"],
+)
+def test_get_log_params(
+    benchmark: Any,
+    allowed_params: tuple[str, ...] | None,
+) -> None:
+    """
+    Measures filtering and dumping the parameters of a logged call.
+    """
+    params = benchmark(get_log_params, allowed_params, **KWARGS)
+
+    assert params["queue"]["name"] == "queue"
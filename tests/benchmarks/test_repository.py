@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.base import BaseRepository
+from domains.queues import Queue, QueueEntries, QueueRepository, QueueTags
+from domains.tags import Tags
+from domains.users import User
+from utils import get_condition_builder
+
+# Runs against the test database of tests/conftest.py
+# (APP_CONFIG__TEST_DB__URL: in-memory SQLite or a Postgres database)
+
+START = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=30)
+QUEUES = 200
+ENTRIES_PER_QUEUE = 10
+
+AsyncBenchmark = Callable[..., Awaitable[Any]]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_session(test_session: AsyncSession) -> AsyncSession:
+    """
+    Seeds 200 queues with two tags and 10 entries each.
+
+    Yields:
+        AsyncSession: The session of the seeded database.
+    """
+    user_ids = [uuid4() for _ in range(ENTRIES_PER_QUEUE)]
+    await test_session.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "email": f"user-{i}@example.com",
+                "hashed_password": "x",
+                "first_name": f"first-{i}",
+                "last_name": "last",
+            }
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+    await test_session.execute(
+        insert(Queue),
+        [
+            {"id": i, "name": f"q-{i}", "start_time": START + timedelta(hours=i)}
+            for i in range(1, QUEUES + 1)
+        ],
+    )
+    await test_session.execute(
+        insert(Tags), [{"id": i, "name": f"tag-{i}"} for i in range(1, 21)]
+    )
+    await test_session.execute(
+        insert(QueueTags),
+        [
+            {"queue_id": queue_id, "tag_id": (queue_id + k) % 20 + 1}
+            for queue_id in range(1, QUEUES + 1)
+            for k in (0, 10)
+        ],
+    )
+    await test_session.execute(
+        insert(QueueEntries),
+        [
+            {"queue_id": queue_id, "user_id": user_id, "position": position}
+            for queue_id in range(1, QUEUES + 1)
+            for position, user_id in enumerate(user_ids, start=1)
+        ],
+    )
+    await test_session.commit()
+    return test_session
+
+
+async def test_base_get_by_id(
+    async_benchmark: AsyncBenchmark,
+    seeded_session: AsyncSession,
+) -> None:
+    """
+    Measures `BaseRepository.get_by_id` of a record not in the identity map.
+    """
+    repository = BaseRepository(Tags, seeded_session, get_condition_builder(Tags)())
+
+    async def get() -> Tags | None:
+        seeded_session.expunge_all()
+        return await repository.get_by_id(7)
+
+    tag = await async_benchmark(get)
+
+    assert tag.name == "tag-7"
+
+
+async def test_base_create(
+    async_benchmark: AsyncBenchmark,
+    test_session: AsyncSession,
+) -> None:
+    """
+    Measures `BaseRepository.create` of one record.
+    """
+    repository = BaseRepository(Tags, test_session, get_condition_builder(Tags)())
+    names = (f"tag-{i}" for i in count())
+
+    tag = await async_benchmark(lambda: repository.create({"name": next(names)}))
+
+    assert tag.id is not None
+
+
+async def test_base_create_many(
+    async_benchmark: AsyncBenchmark,
+    test_session: AsyncSession,
+) -> None:
+    """
+    Measures `BaseRepository.create_many` of 100 records.
+    """
+    repository = BaseRepository(Tags, test_session, get_condition_builder(Tags)())
+    names = (f"tag-{i}" for i in count())
+
+    async def create_many() -> list[Tags | None]:
+        return await repository.create_many([{"name": next(names)} for _ in range(100)])
+
+    tags = await async_benchmark(create_many)
+
+    assert all(tag is not None for tag in tags)
+
+
+async def test_queue_page(
+    async_benchmark: AsyncBenchmark,
+    seeded_session: AsyncSession,
+) -> None:
+    """
+    Measures reading a listing page with tags and taken slot counts.
+    """
+    repository = QueueRepository(seeded_session, get_condition_builder(Queue)())
+
+    async def get_page() -> tuple[list[Any], str | None]:
+        seeded_session.expunge_all()
+        return await repository.get_page(
+            20,
+            start_from=START + timedelta(days=1),
+            start_to=START + timedelta(days=5),
+        )
+
+    queues, cursor = await async_benchmark(get_page)
+
+    assert len(queues) == 20
+    assert cursor is not None
+
+
+async def test_queue_detail(
+    async_benchmark: AsyncBenchmark,
+    seeded_session: AsyncSession,
+) -> None:
+    """
+    Measures reading a queue with its entries and tags as a projection.
+    """
+    repository = QueueRepository(seeded_session, get_condition_builder(Queue)())
+
+    queue = await async_benchmark(repository.get_detail, 7)
+
+    assert len(queue.entries) == ENTRIES_PER_QUEUE
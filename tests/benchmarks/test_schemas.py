@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from domains.queues import (
+    CreateQueue,
+    GetQueuesPage,
+    GetQueueWithEntries,
+    Queue,
+    QueueEntries,
+)
+from domains.queues.serializers import dump_queue_with_entries, dump_queues_page
+from domains.tags import Tags
+from domains.users import User
+
+START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def make_queue(queue_id: int, entries: int) -> Queue:
+    queue = Queue(
+        id=queue_id,
+        name=f"queue-{queue_id}",
+        start_time=START + timedelta(hours=queue_id),
+        max_slots=30,
+    )
+    queue.queue_tags = [Tags(name=f"tag-{i}") for i in range(2)]
+    queue.entries = [
+        QueueEntries(
+            position=position,
+            user=User(first_name=f"first-{position}", last_name="last"),
+        )
+        for position in range(1, entries + 1)
+    ]
+    queue.taken_slots = entries
+    return queue
+
+
+# A listing page of the default size and a busy queue
+PAGE = [make_queue(i, 10) for i in range(1, 21)]
+DETAIL = make_queue(1, 30)
+
+
+def test_create_queue_validation(benchmark: Any) -> None:
+    """
+    Measures validating a create request body.
+    """
+    data = {"name": "queue", "start_time": "2030-01-01T10:00:00Z", "max_slots": 30}
+
+    queue = benchmark(CreateQueue.model_validate, data)
+
+    assert queue.max_slots == 30
+
+
+def test_queues_page_schema(benchmark: Any) -> None:
+    """
+    Measures the `GetQueuesPage` validation and dump that
+    `response_model` runs for a listing page.
+    """
+
+    def dump() -> dict[str, Any]:
+        page = GetQueuesPage.model_validate(
+            {"items": PAGE, "next_cursor": None}, from_attributes=True
+        )
+        return page.model_dump(mode="json", by_alias=True)
+
+    payload = benchmark(dump)
+
+    assert len(payload["items"]) == len(PAGE)
+
+
+def test_queues_page_serializer(benchmark: Any) -> None:
+    """
+    Measures the fast serializer of a listing page.
+    """
+    payload = benchmark(dump_queues_page, PAGE, None)
+
+    assert payload.startswith(b'{"items":')
+
+
+def test_queue_with_entries_schema(benchmark: Any) -> None:
+    """
+    Measures the `GetQueueWithEntries` validation and dump of a queue detail.
+    """
+
+    def dump() -> dict[str, Any]:
+        queue = GetQueueWithEntries.model_validate(DETAIL, from_attributes=True)
+        return queue.model_dump(mode="json", by_alias=True)
+
+    payload = benchmark(dump)
+
+    assert len(payload["entries"]) == len(DETAIL.entries)
+
+
+def test_queue_with_entries_serializer(benchmark: Any) -> None:
+    """
+    Measures the fast serializer of a queue detail.
+    """
+    payload = benchmark(dump_queue_with_entries, DETAIL)
+
+    assert payload.startswith(b'{"name":')
@@ -11,6 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from api.dependencies import current_super_user, current_user
 from core import db_helper, settings
 from core.base import Base
+from core.broadcast import queue_broadcaster
+from core.cache import queue_cache, user_cache
 from domains.queues import Queue, QueueEntries
 from domains.users import User
 from main import main_app
@@ -53,9 +55,26 @@ async def test_session() -> AsyncGenerator[AsyncSession]:
         yield session
 
 
+@pytest_asyncio.fixture(scope="function", autouse=True)
+def disable_redis_features(monkeypatch: MonkeyPatch) -> None:
+    """
+    Keeps tests independent of Redis.
+
+    - Disables the queue response cache so tests always read the test database.
+    - Keeps queue events within the process instead of Redis pub/sub.
+    - Disables the authenticated user cache.
+    """
+    monkeypatch.setattr(queue_cache, "enabled", False)
+    monkeypatch.setattr(user_cache, "enabled", False)
+    monkeypatch.setattr(queue_broadcaster, "enabled", False)
+
+
 @pytest_asyncio.fixture(scope="function", autouse=True)
 def client(
-    test_session: AsyncSession, test_user: User, test_super_user: User
+    test_session: AsyncSession,
+    test_user: User,
+    test_super_user: User,
+    disable_redis_features: None,
 ) -> Generator[TestClient]:
     """
     Creates a FastAPI TestClient with dependency overrides for testing.
@@ -69,6 +88,7 @@ def client(
         test_session (AsyncSession): The test database session.
         test_user (User): A test regular user.
         test_super_user (User): A test superuser.
+        disable_redis_features (None): Ensures Redis is not used from startup on.
 
     Yields:
         TestClient: The test client instance.
@@ -91,6 +111,7 @@ def client(
 
     # Apply dependency overrides
     main_app.dependency_overrides[db_helper.session_getter] = override_get_db
+    main_app.dependency_overrides[db_helper.read_session_getter] = override_get_db
     main_app.dependency_overrides[current_user] = mock_current_user
     main_app.dependency_overrides[current_super_user] = mock_current_super_user
 
@@ -121,14 +142,19 @@ def patch_celery_apply_async(monkeypatch: MonkeyPatch) -> tuple[MagicMock, Magic
         monkeypatch.setattr(process_error, "apply_async", mock_error_apply_async)
 
         return mock_log_apply_async, mock_error_apply_async
-    from tasks.tasks import process_error, process_log
+    from tasks.tasks import process_error, process_log, process_log_batch
+
+    from utils.log_buffer import log_buffer
 
     # Create separate mocks for each task's `apply_async` method
     mock_log_apply_async = MagicMock()
     mock_error_apply_async = MagicMock()
 
-    # Replace the `apply_async` methods with the mock objects
-    monkeypatch.setattr(process_log, "apply_async", mock_log_apply_async)
+    # Replace the `apply_async` methods with the mock objects;
+    # action logs are captured when they enter the batching buffer
+    monkeypatch.setattr(log_buffer, "add", mock_log_apply_async)
+    monkeypatch.setattr(process_log, "apply_async", MagicMock())
+    monkeypatch.setattr(process_log_batch, "apply_async", MagicMock())
     monkeypatch.setattr(process_error, "apply_async", mock_error_apply_async)
 
     return mock_log_apply_async, mock_error_apply_async
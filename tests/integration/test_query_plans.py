@@ -0,0 +1,268 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, event, insert, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import settings
+from domains.queues import (
+    Queue,
+    QueueEntries,
+    QueueEntriesRepository,
+    QueueRepository,
+    QueueTags,
+)
+from domains.tags import Tags, TagsRepository
+from domains.users import User
+from utils import get_condition_builder
+
+# The plans are those of the test database (APP_CONFIG__TEST_DB__URL):
+# SQLite's EXPLAIN QUERY PLAN by default, or Postgres' EXPLAIN when it
+# points to a Postgres database, where the indexes matter in production.
+DIALECT = make_url(settings.test_db.url).get_backend_name()
+
+START = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=30)
+USER_IDS = [uuid4() for _ in range(200)]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_session(test_session: AsyncSession) -> AsyncSession:
+    """
+    Seeds 200 users, 500 queues, 50 tags, 1000 tag links and 5000 entries,
+    and collects planner statistics.
+
+    Yields:
+        AsyncSession: The session of the seeded database.
+    """
+    await test_session.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "email": f"user-{i}@example.com",
+                "hashed_password": "x",
+                "first_name": f"first-{i}",
+                "last_name": "last",
+            }
+            for i, user_id in enumerate(USER_IDS)
+        ],
+    )
+    await test_session.execute(
+        insert(Queue),
+        [
+            {"id": i, "name": f"q-{i}", "start_time": START + timedelta(hours=i)}
+            for i in range(1, 501)
+        ],
+    )
+    await test_session.execute(
+        insert(Tags), [{"id": i, "name": f"tag-{i}"} for i in range(1, 51)]
+    )
+    await test_session.execute(
+        insert(QueueTags),
+        [
+            {"queue_id": queue_id, "tag_id": (queue_id + k) % 50 + 1}
+            for queue_id in range(1, 501)
+            for k in (0, 25)
+        ],
+    )
+    await test_session.execute(
+        insert(QueueEntries),
+        [
+            {
+                "queue_id": queue_id,
+                "user_id": USER_IDS[(queue_id + position) % len(USER_IDS)],
+                "position": position,
+            }
+            for queue_id in range(1, 501)
+            for position in range(1, 11)
+        ],
+    )
+    await test_session.commit()
+    await test_session.execute(text("ANALYZE"))
+    await test_session.commit()
+    return test_session
+
+
+async def query_plans(
+    session: AsyncSession,
+    run: Callable[[], Awaitable[Any]],
+) -> list[tuple[str, str]]:
+    """
+    Runs repository code and returns every statement it executed
+    with the query plan of the test database.
+
+    On Postgres sequential scans are disabled while explaining: the seeded
+    tables are small enough for the planner to prefer them, and the tests
+    check that the indexes can serve the statements at all.
+    """
+    statements: list[tuple[str, Any]] = []
+    sync_engine = session.bind.sync_engine  # type: ignore[union-attr]
+
+    def capture(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        if (
+            statement.lstrip()
+            .upper()
+            .startswith(("SELECT", "INSERT", "UPDATE", "DELETE"))
+        ):
+            statements.append((statement, parameters))
+
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await run()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    connection = await session.connection()
+    if DIALECT == "postgresql":
+        await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    for statement, parameters in statements:
+        if DIALECT == "postgresql":
+            rows = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plan = " | ".join(row[0] for row in rows)
+        else:
+            rows = await connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            plan = " | ".join(row[-1] for row in rows)
+        plans.append((statement, plan))
+    await session.rollback()
+    return plans
+
+
+def assert_uses_index(plan: str, table: str, index: str | None = None) -> None:
+    """
+    Asserts that a plan reads a table through an index (a given one, if set).
+    """
+    if DIALECT == "postgresql":
+        assert f"Seq Scan on {table}" not in plan
+        if index is not None:
+            assert f"using {index} on {table}" in plan
+    else:
+        steps = [
+            step
+            for step in plan.split(" | ")
+            if re.match(rf"(SCAN|SEARCH) {re.escape(table)}\b", step)
+        ]
+        assert steps
+        assert all("INDEX" in step or "PRIMARY KEY" in step for step in steps)
+        if index is not None:
+            assert any(f"INDEX {index}" in step for step in steps)
+
+
+def assert_not_sorted(plan: str) -> None:
+    """
+    Asserts that a plan returns rows in index order, without sorting them.
+    """
+    assert ("Sort" if DIALECT == "postgresql" else "TEMP B-TREE") not in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {
+            "start_from": START + timedelta(days=3),
+            "start_to": START + timedelta(days=5),
+        },
+    ],
+)
+async def test_queue_listing_uses_start_time_index(
+    seeded_session: AsyncSession,
+    filters: dict[str, datetime],
+) -> None:
+    """
+    Tests that the listing page is read in index order, without sorting
+    the queues table or scanning the entries.
+    """
+    repository = QueueRepository(seeded_session, get_condition_builder(Queue)())
+
+    async def run() -> None:
+        _, cursor = await repository.get_page(20, **filters)
+        await repository.get_page(20, cursor, **filters)
+
+    plans = await query_plans(seeded_session, run)
+    page_plans = [plan for statement, plan in plans if "queue_tags" not in statement]
+
+    assert len(page_plans) == 2
+    for plan in page_plans:
+        assert_uses_index(plan, "queues", "ix_queues_start_time_id")
+        assert_not_sorted(plan)
+        # the taken slot count is looked up per queue, not aggregated
+        assert_uses_index(plan, "queue_entries")
+
+
+@pytest.mark.asyncio
+async def test_queue_detail_uses_indexes(seeded_session: AsyncSession) -> None:
+    """
+    Tests that the queue detail looks up the queue, its tags and its
+    entries by key, and reads the entries in position order.
+    """
+    repository = QueueRepository(seeded_session, get_condition_builder(Queue)())
+
+    plans = await query_plans(seeded_session, lambda: repository.get_detail(7))
+
+    queue_plan, entries_plan = [plan for _, plan in plans]
+    assert_uses_index(queue_plan, "queues")
+    assert_uses_index(queue_plan, "queue_tags")
+    assert_uses_index(entries_plan, "queue_entries")
+    # Postgres quotes the reserved table name in its plans
+    assert_uses_index(entries_plan, '"user"' if DIALECT == "postgresql" else "user")
+    assert_not_sorted(entries_plan)
+
+
+@pytest.mark.asyncio
+async def test_reservation_uses_indexes(seeded_session: AsyncSession) -> None:
+    """
+    Tests that reserving a position reads the queue by its key.
+    """
+    repository = QueueEntriesRepository(
+        seeded_session, get_condition_builder(QueueEntries)()
+    )
+
+    async def run() -> None:
+        await repository.create({"queue_id": 7, "user_id": USER_IDS[0], "position": 11})
+
+    (plan,) = [plan for _, plan in await query_plans(seeded_session, run)]
+
+    assert_uses_index(plan, "queues")
+
+
+@pytest.mark.asyncio
+async def test_tag_unlinking_uses_tag_index(seeded_session: AsyncSession) -> None:
+    """
+    Tests that unlinking the queues of a tag (done before deleting it)
+    searches the tag index instead of scanning the links.
+    """
+    repository = TagsRepository(seeded_session, get_condition_builder(Tags)())
+
+    plans = await query_plans(seeded_session, lambda: repository.unlink_queues(id=7))
+
+    (plan,) = [plan for _, plan in plans]
+    assert_uses_index(plan, "queue_tags", "ix_queue_tags_tag_id")
+
+
+@pytest.mark.asyncio
+async def test_user_cascade_uses_user_index(seeded_session: AsyncSession) -> None:
+    """
+    Tests that the lookup the database runs for the `ON DELETE CASCADE`
+    of a user's entries searches the user index. No repository emits it,
+    so the statement is built from the foreign key.
+    """
+    (foreign_key,) = QueueEntries.__table__.c.user_id.foreign_keys
+    statement = delete(QueueEntries).where(
+        foreign_key.parent == USER_IDS[0],
+    )
+
+    async def run() -> None:
+        await seeded_session.execute(statement)
+
+    (plan,) = [plan for _, plan in await query_plans(seeded_session, run)]
+
+    assert_uses_index(plan, "queue_entries", "ix_queue_entries_user_id")
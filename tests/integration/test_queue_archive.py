@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domains.queues import (
+    ArchivedQueue,
+    ArchivedQueueEntries,
+    Queue,
+    QueueEntries,
+    QueueRepository,
+    QueueTags,
+)
+from domains.tags import Tags
+from domains.users import User
+from utils import get_condition_builder
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def queues(test_session: AsyncSession) -> list[Queue]:
+    """
+    Creates 4 queues a day apart; the first two have a tag,
+    the first one has 2 entries.
+
+    Yields:
+        list[Queue]: The queues, ordered by start time.
+    """
+    tag = Tags(name="lab")
+    users = [
+        User(
+            id=uuid4(),
+            email=f"user{i}@example.com",
+            hashed_password="hash",
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+        )
+        for i in range(2)
+    ]
+    queues = [
+        Queue(
+            name=f"q-{i}",
+            start_time=NOW + timedelta(days=i + 1),
+            max_slots=10,
+            queue_tags=[tag] if i < 2 else [],
+        )
+        for i in range(4)
+    ]
+    queues[0].entries = [
+        QueueEntries(user=user, position=position)
+        for position, user in enumerate(users, start=1)
+    ]
+    test_session.add_all(queues)
+    await test_session.commit()
+    return queues
+
+
+async def archive(session: AsyncSession, days: float) -> list[int]:
+    """
+    Archives, one queue per transaction, the queues starting
+    within `days` days.
+    """
+    repository = QueueRepository(session, get_condition_builder(Queue)())
+    archived: list[int] = []
+    while queue_ids := await repository.archive(NOW + timedelta(days=days), 1):
+        archived += queue_ids
+    return archived
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_past_queues(
+    client: TestClient,
+    test_session: AsyncSession,
+    queues: list[Queue],
+) -> None:
+    """
+    Tests that archived queues, their entries and tag links leave the live
+    tables, and that their detail payload is kept in the archive.
+    """
+    first_id = queues[0].id
+    detail = client.get(f"/api_v1/queues/{first_id}").content
+
+    assert await archive(test_session, 2.5) == [queues[0].id, queues[1].id]
+
+    assert (await test_session.scalar(select(func.count(Queue.id)))) == 2
+    assert (await test_session.scalar(select(func.count(QueueEntries.id)))) == 0
+    assert (await test_session.scalar(select(func.count(QueueTags.id)))) == 0
+    assert (await test_session.scalar(select(func.count(ArchivedQueueEntries.id)))) == 2
+    archived = await test_session.get(ArchivedQueue, first_id)
+    assert archived is not None and archived.taken_slots == 2
+
+    assert client.get(f"/api_v1/queues/{first_id}").status_code == 404
+    response = client.get(
+        f"/api_v1/queues/{first_id}", params={"include_archived": True}
+    )
+    assert response.status_code == 200
+    assert response.content == detail
+
+
+@pytest.mark.asyncio
+async def test_listing_include_archived(
+    client: TestClient,
+    test_session: AsyncSession,
+    queues: list[Queue],
+) -> None:
+    """
+    Tests that listings only show live queues by default, and that
+    `include_archived` pages through live and archived queues in order.
+    """
+    expected = client.get("/api_v1/queues").json()["items"]
+    await archive(test_session, 2.5)
+
+    live = client.get("/api_v1/queues").json()["items"]
+    assert [item["name"] for item in live] == ["q-2", "q-3"]
+
+    items, cursor = [], None
+    while True:
+        params = {"include_archived": True, "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api_v1/queues", params=params).json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert items == expected
+
+    tagged = client.get(
+        "/api_v1/queues", params={"include_archived": True, "tag": "lab"}
+    ).json()["items"]
+    assert [item["name"] for item in tagged] == ["q-0", "q-1"]
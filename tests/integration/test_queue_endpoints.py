@@ -1,12 +1,21 @@
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import MagicMock
+from uuid import uuid4
 
+import orjson
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domains.queues import Queue
+from api.v1.routers.queue_events import stream_events
+from core.broadcast import queue_broadcaster
+from domains.queues import Queue, QueueEntries, QueueRepository, QueueService, QueueTags
+from domains.queues.serializers import dump_queue_with_entries
+from domains.tags import Tags
+from domains.users import User
+from utils import get_condition_builder
 
 
 @pytest.mark.asyncio
@@ -245,3 +254,397 @@ async def test_delete_queue(
         # Ensure the queue was actually deleted from the database
         deleted_queue = await test_session.get(Queue, queue_id)
         assert deleted_queue is None
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_queues(test_session: AsyncSession) -> list[Queue]:
+    """
+    Creates 5 test queues one day apart, every second one tagged "lab".
+
+    Yields:
+        list[Queue]: The test queue instances ordered by start time.
+    """
+    lab = Tags(name="lab")
+    start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=30)
+    queues = [
+        Queue(
+            name=f"queue-{i}",
+            start_time=start + timedelta(days=i),
+            max_slots=30,
+            queue_tags=[lab] if i % 2 == 0 else [],
+        )
+        for i in range(5)
+    ]
+    test_session.add_all(queues)
+    await test_session.commit()
+    return queues
+
+
+@pytest.mark.asyncio
+async def test_get_queues_paginates_with_cursor(
+    client: TestClient,
+    test_queues: list[Queue],
+) -> None:
+    """
+    Test that queue listing walks through all queues page by page.
+
+    This test verifies:
+    - That pages respect the limit and are ordered by start time.
+    - That the last page has no next cursor.
+    """
+
+    names = []
+    cursor = None
+    pages = 0
+
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api_v1/queues", params=params)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert len(data["items"]) <= 2
+        names.extend(item["name"] for item in data["items"])
+        pages += 1
+
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert names == [queue.name for queue in test_queues]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params, expected_names",
+    [
+        # Case 1: Filter by tag name
+        ({"tag": "lab"}, ["queue-0", "queue-2", "queue-4"]),
+        # Case 2: Filter by substring of the name
+        ({"name": "UE-3"}, ["queue-3"]),
+        # Case 3: Filter by start time window
+        ({"start_from": 1, "start_to": 3}, ["queue-1", "queue-2"]),
+        # Case 4: Combined filters
+        ({"tag": "lab", "start_from": 1}, ["queue-2", "queue-4"]),
+    ],
+)
+async def test_get_queues_filters(
+    client: TestClient,
+    test_queues: list[Queue],
+    params: dict[str, str | int],
+    expected_names: list[str],
+) -> None:
+    """
+    Test the queue listing filters.
+
+    Args:
+        client (TestClient): The FastAPI test client.
+        test_queues (list[Queue]): The test queues fixture.
+        params (dict): Query parameters; time bounds are queue indexes.
+        expected_names (list[str]): Names of the queues expected in the response.
+    """
+
+    for bound in ("start_from", "start_to"):
+        if bound in params:
+            params[bound] = test_queues[params[bound]].start_time.isoformat()
+
+    response = client.get("/api_v1/queues", params=params)
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == expected_names
+
+
+@pytest.mark.asyncio
+async def test_get_queues_invalid_cursor(client: TestClient) -> None:
+    """
+    Test that a malformed cursor is rejected with 400.
+    """
+
+    response = client.get("/api_v1/queues", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "queue_id, expected_status",
+    [
+        (None, 200),  # Case 1: Existing queue
+        (999, 404),  # Case 2: Non-existent queue
+    ],
+)
+async def test_get_queue_with_entries(
+    client: TestClient,
+    test_queue: Queue,
+    queue_id: int | None,
+    expected_status: int,
+) -> None:
+    """
+    Test the queue detail API endpoint.
+
+    Args:
+        client (TestClient): The FastAPI test client.
+        test_queue (Queue): The test queue fixture.
+        queue_id (int | None): The queue ID to fetch, None for the test queue.
+        expected_status (int): Expected HTTP response status.
+    """
+
+    if queue_id is None:
+        queue_id = test_queue.id
+
+    response = client.get(f"/api_v1/queues/{queue_id}")
+
+    assert response.status_code == expected_status
+
+    if expected_status == 200:
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["name"] == test_queue.name
+        assert data["max_slots"] == test_queue.max_slots
+        assert data["entries"] == []
+        assert data["queue_tags"] == []
+
+
+@pytest.mark.asyncio
+async def test_queue_detail_projection_matches_orm(
+    test_session: AsyncSession,
+    test_queue: Queue,
+) -> None:
+    """
+    Tests that the projection read path yields the payload of the ORM graph
+    without loading ORM objects into the session.
+    """
+
+    users = [
+        User(
+            id=uuid4(),
+            email=f"user{i}@example.com",
+            hashed_password="hash",
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+        )
+        for i in range(3)
+    ]
+    tags = [Tags(name="b-tag"), Tags(name="a-tag")]
+    test_session.add_all([*users, *tags])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            QueueEntries(queue_id=test_queue.id, user_id=user.id, position=position)
+            for user, position in zip(users, (7, 2, 5))
+        ]
+        + [QueueTags(queue_id=test_queue.id, tag_id=tag.id) for tag in tags]
+    )
+    await test_session.commit()
+    test_session.expunge_all()
+
+    repository = QueueRepository(test_session, get_condition_builder(Queue)())
+    detail = await repository.get_detail(test_queue.id)
+
+    assert len(test_session.identity_map) == 0
+    assert detail is not None
+    assert [entry.position for entry in detail.entries] == [2, 5, 7]
+
+    queue = await repository.get_by_id(test_queue.id)
+    queue.entries.sort(key=lambda entry: entry.position)
+    queue.queue_tags.sort(key=lambda tag: tag.id)
+    assert dump_queue_with_entries(detail) == dump_queue_with_entries(queue)
+    assert await repository.get_detail(999) is None
+
+
+@pytest.mark.asyncio
+async def test_get_queues_reports_occupancy(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queues: list[Queue],
+) -> None:
+    """
+    Test that the listing carries taken and free slot counts per queue.
+    """
+
+    test_session.add_all(
+        [
+            QueueEntries(queue_id=test_queues[1].id, user_id=str(uuid4()), position=p)
+            for p in (1, 4, 9)
+        ]
+    )
+    await test_session.commit()
+
+    response = client.get("/api_v1/queues")
+
+    assert response.status_code == 200
+    occupancy = {
+        item["name"]: (item["taken_slots"], item["free_slots"])
+        for item in response.json()["items"]
+    }
+    assert occupancy["queue-1"] == (3, 27)
+    assert occupancy["queue-0"] == (0, 30)
+
+
+@pytest.mark.asyncio
+async def test_free_slots_stop_at_max_position(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queues: list[Queue],
+) -> None:
+    """
+    Test that a queue with more slots than positions (40) and all 30
+    positions taken is listed as full, as free slot assignment reports.
+    """
+    queue = test_queues[0]
+    queue.max_slots = 40
+    test_session.add_all(
+        [
+            QueueEntries(queue_id=queue.id, user_id=str(uuid4()), position=p)
+            for p in range(1, 31)
+        ]
+    )
+    await test_session.commit()
+
+    response = client.get("/api_v1/queues")
+    item = next(i for i in response.json()["items"] if i["id"] == queue.id)
+    assert (item["max_slots"], item["taken_slots"], item["free_slots"]) == (40, 30, 0)
+
+    response = client.post("/api_v1/queue", json={"queue_id": queue.id})
+    assert response.status_code == 409
+    assert response.json()["error"] == "Queue Full"
+
+
+@pytest.mark.asyncio
+async def test_create_queues_bulk(
+    client: TestClient,
+    test_session: AsyncSession,
+) -> None:
+    """
+    Tests that bulk queue creation creates the valid queues and reports
+    the ones violating a check constraint (422) at their index.
+    """
+    start_time = (datetime.now(timezone.utc) + timedelta(days=10)).isoformat()
+    queues = [
+        {"name": f"bulk-{i}", "start_time": start_time, "max_slots": 20}
+        for i in range(5)
+    ]
+    queues[3]["max_slots"] = 50
+
+    response = client.post("/api_v1/queues/bulk", json=queues)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 201, 201, 422, 201]
+    assert results[3]["id"] is None
+
+    created = (
+        (await test_session.execute(select(Queue).order_by(Queue.id))).scalars().all()
+    )
+    assert [queue.name for queue in created] == [
+        "bulk-0",
+        "bulk-1",
+        "bulk-2",
+        "bulk-4",
+    ]
+    assert [result["id"] for result in results if result["id"]] == [
+        queue.id for queue in created
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_queues_bulk_limits(client: TestClient) -> None:
+    """
+    Tests that bulk requests must hold between 1 and 1000 items.
+    """
+    queue = {"name": "bulk", "start_time": "3030-02-03T11:30:19Z"}
+
+    assert client.post("/api_v1/queues/bulk", json=[]).status_code == 422
+    assert client.post("/api_v1/queues/bulk", json=[queue] * 1001).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_delete_queues_bulk(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue: Queue,
+) -> None:
+    """
+    Tests that bulk queue deletion deletes the existing queues
+    and reports unknown IDs (404).
+    """
+    response = client.post(
+        "/api_v1/queues/bulk/delete", json={"ids": [404, test_queue.id]}
+    )
+
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [404, 204]
+    test_session.expunge_all()
+    assert await test_session.get(Queue, test_queue.id) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "operation, reason",
+    [("delete", "deleted"), ("bulk-delete", "deleted"), ("archive", "archived")],
+)
+async def test_closing_queue_ends_event_streams(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue: Queue,
+    operation: str,
+    reason: str,
+) -> None:
+    """
+    Tests that deleting or archiving a queue publishes `queue_closed`
+    and ends the event streams of the queue.
+    """
+    stream = stream_events(queue_broadcaster.subscribe(test_queue.id), b"{}")
+    await anext(stream)
+
+    if operation == "delete":
+        client.delete(f"/api_v1/queues/{test_queue.id}")
+    elif operation == "bulk-delete":
+        client.post("/api_v1/queues/bulk/delete", json={"ids": [test_queue.id]})
+    else:
+        repository = QueueRepository(test_session, get_condition_builder(Queue)())
+        assert await QueueService(repository).archive(-400, 10) == 1
+
+    event = await anext(stream)
+    assert orjson.loads(event.removeprefix(b"data: ")) == {
+        "type": "queue_closed",
+        "reason": reason,
+        "queue_id": test_queue.id,
+    }
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert not queue_broadcaster._subscribers
+
+
+@pytest.mark.asyncio
+async def test_queue_tags_bulk(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue: Queue,
+) -> None:
+    """
+    Tests bulk linking and unlinking of tags: links that already exist
+    or repeat an earlier link of the batch are reported as conflicts.
+    """
+    tags = [Tags(name=f"tag-{i}") for i in range(3)]
+    test_session.add_all(tags)
+    await test_session.commit()
+
+    links = [{"queue_id": test_queue.id, "tag_id": tag.id} for tag in tags]
+    client.post("/api_v1/queue_tag", json=links[0])
+
+    response = client.post("/api_v1/queue_tag/bulk", json=links + [links[1]])
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [409, 201, 201, 409]
+
+    link_ids = [results[1]["id"], results[2]["id"]]
+    response = client.post("/api_v1/queue_tag/bulk/delete", json={"ids": link_ids})
+
+    assert [result["status"] for result in response.json()["results"]] == [204, 204]
+    remaining = (await test_session.execute(select(QueueTags.tag_id))).scalars().all()
+    assert remaining == [tags[0].id]
@@ -1,12 +1,19 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
+from uuid import uuid4
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
 
-from domains.queues import Queue
-from domains.queues.models import QueueEntries
+from core.broadcast import queue_broadcaster
+from core.exceptions import QueueFullError
+from domains.queues import Queue, QueueEntriesRepository
+from domains.queues.models import MAX_POSITION, QueueEntries
+from utils import get_condition_builder
 
 
 @pytest.mark.asyncio
@@ -129,3 +136,252 @@ async def test_delete_queue_entry(
         # Ensure the entry was actually deleted from the database
         deleted_obj = await test_session.get(QueueEntries, test_queue_entry.id)
         assert deleted_obj is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "queue_entry_data, result_code, error",
+    [
+        # Case 1: Position is already taken by another user
+        ({"position": 3, "queue_id": 1}, 409, "Position Taken"),
+        # Case 2: Position is valid but above the queue's max_slots (26)
+        ({"position": 27, "queue_id": 1}, 409, "Position Out Of Range"),
+        # Case 3: The user already has an entry in the queue
+        ({"position": 5, "queue_id": 1}, 409, "Duplicate Entry (IntegrityError)"),
+        # Case 4: The queue does not exist
+        ({"position": 5, "queue_id": 999}, 404, "Not Found"),
+    ],
+)
+async def test_create_queue_entry_conflicts(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue_entry: QueueEntries,
+    queue_entry_data: dict[str, int],
+    result_code: int,
+    error: str,
+) -> None:
+    """
+    Test that rejected reservations report which rule was violated.
+
+    Args:
+        client (TestClient): The FastAPI test client.
+        test_session (AsyncSession): The database session.
+        test_queue_entry (QueueEntries): Entry of the current user at position 1.
+        queue_entry_data (dict): Data for the queue entry request.
+        result_code (int): Expected HTTP response status.
+        error (str): Expected error name in the response.
+    """
+    test_session.add(QueueEntries(position=3, queue_id=1, user_id=str(uuid4())))
+    await test_session.commit()
+
+    if error != "Duplicate Entry (IntegrityError)":
+        await test_session.delete(test_queue_entry)
+        await test_session.commit()
+
+    response = client.post("/api_v1/queue", json=queue_entry_data)
+
+    assert response.status_code == result_code
+    assert response.json()["error"] == error
+
+
+@pytest.mark.asyncio
+async def test_create_queue_entry_in_free_slot(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue: Queue,
+) -> None:
+    """
+    Test that omitting the position assigns the lowest free one.
+
+    Positions 1 and 2 are taken by other users, 3 is free.
+    """
+    for position in (1, 2, 4):
+        test_session.add(
+            QueueEntries(position=position, queue_id=1, user_id=str(uuid4()))
+        )
+    await test_session.commit()
+
+    response = client.post("/api_v1/queue", json={"queue_id": test_queue.id})
+
+    assert response.status_code == 201
+    assert response.json() == {"position": 3, "queue_id": test_queue.id}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "taken_positions, queue_id, result_code, error",
+    [
+        # Case 1: Every position up to max_slots (26) is taken
+        (range(1, 27), 1, 409, "Queue Full"),
+        # Case 2: The queue does not exist
+        ((), 999, 404, "Not Found"),
+    ],
+)
+async def test_create_queue_entry_in_free_slot_errors(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue: Queue,
+    taken_positions: range | tuple[int, ...],
+    queue_id: int,
+    result_code: int,
+    error: str,
+) -> None:
+    """
+    Test the errors of free slot assignment.
+
+    Args:
+        client (TestClient): The FastAPI test client.
+        test_session (AsyncSession): The database session.
+        test_queue (Queue): The test queue fixture.
+        taken_positions (range | tuple[int, ...]): Positions taken by other users.
+        queue_id (int): The queue to join.
+        result_code (int): Expected HTTP response status.
+        error (str): Expected error name in the response.
+    """
+    for position in taken_positions:
+        test_session.add(
+            QueueEntries(position=position, queue_id=1, user_id=str(uuid4()))
+        )
+    await test_session.commit()
+
+    response = client.post("/api_v1/queue", json={"queue_id": queue_id})
+
+    assert response.status_code == result_code
+    assert response.json()["error"] == error
+
+
+@pytest.mark.asyncio
+async def test_create_queue_entry_in_free_slot_duplicate(
+    client: TestClient,
+    test_queue_entry: QueueEntries,
+) -> None:
+    """
+    Test that a user who already has an entry cannot take a second free slot.
+    """
+    response = client.post("/api_v1/queue", json={"queue_id": 1})
+
+    assert response.status_code == 409
+    assert response.json()["error"] == "Duplicate Entry (IntegrityError)"
+
+
+@pytest.mark.asyncio
+async def test_create_queue_entries_in_free_slots_concurrently(
+    test_session: AsyncSession,
+) -> None:
+    """
+    Test that concurrent free slot assignments on separate sessions
+    take distinct positions, up to `MAX_POSITION` even when the queue
+    has more slots.
+    """
+    queue = Queue(
+        id=2,
+        name="big-queue",
+        start_time=datetime.now(timezone.utc) + timedelta(days=1),
+        max_slots=40,
+    )
+    test_session.add(queue)
+    for position in range(1, MAX_POSITION - 2):
+        test_session.add(
+            QueueEntries(position=position, queue_id=queue.id, user_id=str(uuid4()))
+        )
+    await test_session.commit()
+
+    sessions = async_sessionmaker(bind=test_session.bind, expire_on_commit=False)
+
+    async def take_free_slot() -> QueueEntries:
+        async with sessions() as session:
+            repository = QueueEntriesRepository(
+                session, get_condition_builder(QueueEntries)()
+            )
+            return await repository.create_in_free_slot(queue.id, str(uuid4()))
+
+    results = await asyncio.gather(
+        *(take_free_slot() for _ in range(5)), return_exceptions=True
+    )
+
+    entries = [result for result in results if isinstance(result, QueueEntries)]
+    assert sorted(entry.position for entry in entries) == [28, 29, 30]
+    assert all(
+        isinstance(result, QueueFullError)
+        for result in results
+        if not isinstance(result, QueueEntries)
+    )
+
+
+@pytest.mark.asyncio
+async def test_queue_entry_changes_are_published(
+    client: TestClient,
+    test_queue: Queue,
+) -> None:
+    """
+    Test that taking and freeing a position publishes occupancy deltas.
+    """
+    subscription = queue_broadcaster.subscribe(test_queue.id)
+
+    try:
+        client.post("/api_v1/queue", json={"queue_id": test_queue.id, "position": 4})
+        client.delete(f"/api_v1/queue/{test_queue.id}")
+
+        events = [orjson.loads(await subscription.get(0.1)) for _ in range(2)]
+    finally:
+        queue_broadcaster.unsubscribe(subscription)
+
+    assert events == [
+        {"type": "position_taken", "position": 4, "queue_id": test_queue.id},
+        {"type": "position_freed", "position": 4, "queue_id": test_queue.id},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_queue_entries_bulk(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_queue: Queue,
+) -> None:
+    """
+    Test that a bulk assignment reports the outcome of each entry.
+
+    Entries of a missing queue are not found (404), positions above
+    max_slots (26) are invalid (422), and a taken user or position
+    is a conflict (409).
+    """
+    user_ids = [str(uuid4()) for _ in range(3)]
+    entries = [
+        {"queue_id": test_queue.id, "user_id": user_ids[0], "position": 1},
+        {"queue_id": 999, "user_id": user_ids[1], "position": 2},
+        {"queue_id": test_queue.id, "user_id": user_ids[1], "position": 27},
+        {"queue_id": test_queue.id, "user_id": user_ids[2], "position": 1},
+        {"queue_id": test_queue.id, "user_id": user_ids[0], "position": 3},
+        {"queue_id": test_queue.id, "user_id": user_ids[1], "position": 2},
+    ]
+
+    response = client.post("/api_v1/queue/bulk", json=entries)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 404, 422, 409, 409, 201]
+
+    query = select(QueueEntries.user_id, QueueEntries.position).filter(
+        QueueEntries.queue_id == test_queue.id
+    )
+    stored = {
+        (str(user_id), position)
+        for user_id, position in (await test_session.execute(query)).all()
+    }
+    assert stored == {(user_ids[0], 1), (user_ids[1], 2)}
+
+
+@pytest.mark.asyncio
+async def test_delete_queue_entries_bulk(
+    client: TestClient,
+    test_queue_entry: QueueEntries,
+) -> None:
+    """
+    Test that a bulk deletion reports deleted (204) and missing (404) entries.
+    """
+    response = client.post(
+        "/api_v1/queue/bulk/delete", json={"ids": [test_queue_entry.id, 999]}
+    )
+
+    assert response.status_code == 200
+    assert [result["status"] for result in response.json()["results"]] == [204, 404]
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domains.queues import (
+    Queue,
+    QueueTags,
+    QueueTemplate,
+    QueueTemplateRepository,
+    QueueTemplateService,
+)
+from domains.tags import Tags
+from utils import get_condition_builder
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def tags(test_session: AsyncSession) -> list[Tags]:
+    """
+    Creates 2 test tags.
+
+    Yields:
+        list[Tags]: The test tags.
+    """
+    tags = [Tags(name="lab"), Tags(name="math")]
+    test_session.add_all(tags)
+    await test_session.commit()
+    return tags
+
+
+@pytest_asyncio.fixture(scope="function")
+def service(test_session: AsyncSession) -> QueueTemplateService:
+    """
+    Provides a template service bound to the test session.
+    """
+    return QueueTemplateService(
+        QueueTemplateRepository(test_session, get_condition_builder(QueueTemplate)())
+    )
+
+
+@pytest.mark.asyncio
+async def test_materialize_creates_upcoming_queues(
+    test_session: AsyncSession,
+    service: QueueTemplateService,
+    tags: list[Tags],
+) -> None:
+    """
+    Tests that the queues of the horizon are created once with the template's
+    tags, that occurrences already started are skipped and that inactive
+    templates are ignored.
+    """
+    weekly = await service.create(
+        {
+            "name": "weekly",
+            "max_slots": 12,
+            "next_start_time": NOW - timedelta(days=2),
+            "tag_ids": [tag.id for tag in tags],
+        }
+    )
+    await service.create(
+        {
+            "name": "paused",
+            "next_start_time": NOW + timedelta(days=1),
+            "active": False,
+        }
+    )
+
+    queue_ids = await service.materialize(horizon_days=28)
+
+    queues = (
+        (await test_session.execute(select(Queue).order_by(Queue.start_time)))
+        .scalars()
+        .all()
+    )
+    assert [queue.id for queue in queues] == queue_ids
+    assert [queue.name for queue in queues] == ["weekly"] * 4
+    assert {queue.max_slots for queue in queues} == {12}
+    assert [queue.start_time.replace(tzinfo=timezone.utc) for queue in queues] == [
+        NOW + timedelta(days=days) for days in (5, 12, 19, 26)
+    ]
+
+    links = (await test_session.execute(select(QueueTags))).scalars().all()
+    assert sorted((link.queue_id, link.tag_id) for link in links) == sorted(
+        (queue_id, tag.id) for queue_id in queue_ids for tag in tags
+    )
+
+    await test_session.refresh(weekly)
+    assert weekly.next_start_time.replace(tzinfo=timezone.utc) == NOW + timedelta(
+        days=33
+    )
+    assert await service.materialize(horizon_days=28) == []
+
+
+@pytest.mark.asyncio
+async def test_create_keeps_caller_data(
+    service: QueueTemplateService,
+    tags: list[Tags],
+) -> None:
+    """
+    Tests that creating a template leaves the passed data untouched,
+    so it can still be logged or retried with its tags.
+    """
+    data = {
+        "name": "weekly",
+        "next_start_time": NOW + timedelta(days=1),
+        "tag_ids": [tag.id for tag in tags],
+    }
+    expected = dict(data)
+
+    template = await service.create(data)
+
+    assert data == expected
+    assert sorted(tag.id for tag in template.tags) == sorted(data["tag_ids"])
+
+
+@pytest.mark.asyncio
+async def test_queue_template_endpoints(
+    client: TestClient,
+    tags: list[Tags],
+) -> None:
+    """
+    Tests creating and listing templates, and that unknown tags
+    are rejected (404).
+    """
+    template = {
+        "name": "weekly",
+        "next_start_time": (NOW + timedelta(days=1)).isoformat(),
+        "tag_ids": [tags[1].id],
+    }
+
+    response = client.post("/api_v1/queue_templates", json=template)
+
+    assert response.status_code == 201
+    assert response.json()["tags"] == [{"name": "math", "id": tags[1].id}]
+    assert response.json()["interval_days"] == 7
+
+    response = client.post(
+        "/api_v1/queue_templates", json={**template, "tag_ids": [999]}
+    )
+    assert response.status_code == 404
+
+    response = client.get("/api_v1/queue_templates")
+    assert [template["name"] for template in response.json()] == ["weekly"]
@@ -1,9 +1,15 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
 import pytest
 import pytest_asyncio
+from _pytest.monkeypatch import MonkeyPatch
 from fastapi.testclient import TestClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import queue_cache
+from domains.queues import Queue, QueueTags
 from domains.tags import Tags
 
 
@@ -180,3 +186,106 @@ async def test_delete_tag(
         # Ensure the tag was actually deleted from the database
         deleted_tag = await test_session.get(Tags, tag_id)
         assert deleted_tag is None
+
+
+@pytest.mark.asyncio
+async def test_create_tags_bulk(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_tag: Tags,
+) -> None:
+    """
+    Test the bulk tag creation API endpoint.
+
+    This test verifies:
+    - That every tag gets a result at its index.
+    - That new tags are created (201) and duplicates of existing tags
+      or of an earlier tag of the batch are reported as conflicts (409).
+    """
+
+    response = client.post(
+        "/api_v1/tags/bulk",
+        json=[
+            {"name": "bulk-1"},
+            {"name": "test-tag-2"},
+            {"name": "bulk-2"},
+            {"name": "bulk-1"},
+        ],
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 409, 201, 409]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+
+    for result, name in zip(results[::2], ["bulk-1", "bulk-2"]):
+        tag = await test_session.get(Tags, result["id"])
+        assert tag is not None and tag.name == name
+
+
+@pytest.mark.asyncio
+async def test_delete_tags_bulk(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_tag: Tags,
+) -> None:
+    """
+    Test the bulk tag deletion API endpoint.
+
+    This test verifies:
+    - That existing tags are deleted (204) and unknown IDs reported (404).
+    - That an empty ID list is rejected (422).
+    """
+
+    response = client.post("/api_v1/tags/bulk/delete", json={"ids": [test_tag.id, 999]})
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"index": 0, "status": 204, "id": test_tag.id},
+        {"index": 1, "status": 404, "id": 999},
+    ]
+    test_session.expunge_all()
+    assert await test_session.get(Tags, test_tag.id) is None
+
+    assert client.post("/api_v1/tags/bulk/delete", json={"ids": []}).status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operation", ["patch", "delete", "bulk-delete"])
+async def test_tag_changes_invalidate_linked_queues(
+    client: TestClient,
+    test_session: AsyncSession,
+    test_tag: Tags,
+    monkeypatch: MonkeyPatch,
+    operation: str,
+) -> None:
+    """
+    Test that renaming or deleting a tag invalidates the cached details
+    of every queue listing it, and that deletes remove its queue links.
+    """
+    start_time = datetime.now(timezone.utc) + timedelta(days=1)
+    queues = [Queue(name=f"queue-{i}", start_time=start_time) for i in range(2)]
+    test_session.add_all(queues)
+    await test_session.flush()
+    test_session.add_all(
+        QueueTags(queue_id=queue.id, tag_id=test_tag.id) for queue in queues
+    )
+    await test_session.commit()
+    invalidate = AsyncMock()
+    monkeypatch.setattr(queue_cache, "invalidate", invalidate)
+
+    if operation == "patch":
+        response = client.patch(f"/api_v1/tags/{test_tag.id}", json={"name": "renamed"})
+    elif operation == "delete":
+        response = client.delete(f"/api_v1/tags/{test_tag.id}")
+    else:
+        response = client.post("/api_v1/tags/bulk/delete", json={"ids": [test_tag.id]})
+
+    assert response.status_code < 300
+    assert sorted(call.args[0] for call in invalidate.await_args_list) == sorted(
+        queue.id for queue in queues
+    )
+    links = await test_session.scalar(
+        select(func.count()).select_from(QueueTags).filter_by(tag_id=test_tag.id)
+    )
+    assert links == (2 if operation == "patch" else 0)
@@ -1,5 +1,5 @@
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import pytest_asyncio
@@ -26,6 +26,7 @@ def mock_repository() -> AsyncMock:
     repo.get_by_id = AsyncMock()
     repo.get_all = AsyncMock()
     repo.delete = AsyncMock()
+    repo.delete_many = AsyncMock()
     repo.patch = AsyncMock()
     return repo
 
@@ -103,3 +104,20 @@ async def test_patch_not_found(
 
     mock_repository.patch.assert_awaited_once_with(filters, **update_values)
     assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_many(
+    base_service,
+    mock_repository,
+) -> None:
+    """
+    Tests that `delete_many` reports, in the order of the given IDs,
+    which objects were deleted.
+    """
+    mock_repository.delete_many.return_value = [Mock(id=3), Mock(id=1)]
+
+    result = await base_service.delete_many([1, 2, 3, 1])
+
+    mock_repository.delete_many.assert_awaited_once_with([1, 2, 3, 1])
+    assert result == [True, False, True, True]
@@ -0,0 +1,111 @@
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+import pytest_asyncio
+from redis.exceptions import ConnectionError
+
+from api.v1.routers.queue_events import stream_events
+from core.broadcast import Broadcaster
+
+
+@pytest_asyncio.fixture
+def broadcaster() -> Broadcaster:
+    """
+    Provides a broadcaster that only dispatches within the process.
+    """
+    return Broadcaster(
+        redis_client=AsyncMock(),
+        prefix="test",
+        subscriber_queue_size=2,
+        enabled=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_reaches_subscribers_of_key(broadcaster: Broadcaster) -> None:
+    """
+    Tests that events reach only the subscribers of their key.
+    """
+    first = broadcaster.subscribe(1)
+    second = broadcaster.subscribe(1)
+    other = broadcaster.subscribe(2)
+
+    await broadcaster.publish(1, {"type": "position_taken", "position": 3})
+
+    expected = orjson.dumps({"type": "position_taken", "position": 3})
+    assert await first.get(0.1) == expected
+    assert await second.get(0.1) == expected
+    assert await other.get(0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync(broadcaster: Broadcaster) -> None:
+    """
+    Tests that overflowing a subscriber's buffer replaces it with a resync event.
+    """
+    subscription = broadcaster.subscribe(1)
+
+    for position in range(3):
+        await broadcaster.publish(1, {"type": "position_taken", "position": position})
+
+    assert orjson.loads(await subscription.get(0.1)) == {"type": "resync"}
+    assert await subscription.get(0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_delivery(broadcaster: Broadcaster) -> None:
+    """
+    Tests that an unsubscribed subscriber no longer receives events.
+    """
+    subscription = broadcaster.subscribe(1)
+    broadcaster.unsubscribe(subscription)
+
+    await broadcaster.publish(1, {"type": "position_freed", "position": 1})
+
+    assert await subscription.get(0.01) is None
+    assert not broadcaster._subscribers
+
+
+@pytest.mark.asyncio
+async def test_publish_errors_are_not_raised(broadcaster: Broadcaster) -> None:
+    """
+    Tests that a Redis failure never fails the write path.
+    """
+    broadcaster.enabled = True
+    broadcaster.redis.publish.side_effect = ConnectionError("redis down")
+
+    await broadcaster.publish(1, {"type": "position_freed", "position": 1})
+
+    broadcaster.redis.publish.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_events_formats_sse(
+    broadcaster: Broadcaster,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Tests the SSE stream: snapshot first, then deltas, then keep-alives.
+    """
+    monkeypatch.setattr(
+        "api.v1.routers.queue_events.queue_broadcaster",
+        broadcaster,
+    )
+    monkeypatch.setattr(
+        "api.v1.routers.queue_events.settings.broadcast.heartbeat_seconds",
+        0.01,
+    )
+    subscription = broadcaster.subscribe(1)
+    stream = stream_events(subscription, b'{"name":"q"}')
+
+    assert await anext(stream) == (
+        b'data: {"type":"snapshot","queue":{"name":"q"}}\n\n'
+    )
+
+    await broadcaster.publish(1, {"type": "position_taken", "position": 2})
+    assert await anext(stream) == (b'data: {"type":"position_taken","position":2}\n\n')
+    assert await anext(stream) == b": keep-alive\n\n"
+
+    await stream.aclose()
+    assert not broadcaster._subscribers
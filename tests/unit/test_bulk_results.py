@@ -0,0 +1,58 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from core.base import BulkResults
+from core.exceptions import NotFoundError, PositionOutOfRangeError, PositionTakenError
+
+
+def integrity_error(orig: object) -> IntegrityError:
+    return IntegrityError("INSERT ...", {}, orig)  # type: ignore[arg-type]
+
+
+def sqlite_error(name: str) -> sqlite3.IntegrityError:
+    error = sqlite3.IntegrityError("constraint failed")
+    error.sqlite_errorname = name
+    return error
+
+
+@pytest.mark.parametrize(
+    "error, expected_status",
+    [
+        # skipped by ON CONFLICT DO NOTHING
+        (None, 409),
+        # asyncpg errors carry the SQLSTATE
+        (integrity_error(SimpleNamespace(sqlstate="23505")), 409),
+        (integrity_error(SimpleNamespace(sqlstate="23503")), 404),
+        (integrity_error(SimpleNamespace(sqlstate="23514")), 422),
+        (integrity_error(SimpleNamespace(sqlstate="23502")), 422),
+        # sqlite3 errors carry the extended result code
+        (integrity_error(sqlite_error("SQLITE_CONSTRAINT_FOREIGNKEY")), 404),
+        (integrity_error(sqlite_error("SQLITE_CONSTRAINT_CHECK")), 422),
+        (integrity_error(sqlite_error("SQLITE_CONSTRAINT_UNIQUE")), 409),
+        # rejected before inserting
+        (NotFoundError(), 404),
+        (PositionOutOfRangeError(), 422),
+        (PositionTakenError(), 409),
+    ],
+)
+def test_created_maps_rejections_to_statuses(
+    error: Exception | None,
+    expected_status: int,
+) -> None:
+    """
+    Tests that a duplicate is a conflict, while a missing referenced object
+    and an invalid value are reported as such.
+    """
+    created = SimpleNamespace(id=7)
+
+    results = BulkResults.created([created, error]).results
+
+    assert (results[0].status, results[0].id) == (201, 7)
+    assert (results[1].index, results[1].status, results[1].id) == (
+        1,
+        expected_status,
+        None,
+    )
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from domains.queues import Queue
+from utils.condition_builder import ConditionBuilder, get_condition_builder
+
+
+@pytest.fixture
+def builder() -> ConditionBuilder:
+    return get_condition_builder(Queue)()
+
+
+def compile_where(builder: ConditionBuilder, **conditions: object) -> str:
+    stmt = select(Queue.id).filter(*builder.create_conditions(**conditions))
+    return str(stmt.compile(dialect=postgresql.dialect())).split("WHERE ", 1)[1]
+
+
+def test_builder_is_shared_and_stateless(builder: ConditionBuilder) -> None:
+    """
+    Tests that one builder per model is reused without accumulating filters.
+    """
+    assert get_condition_builder(Queue)() is builder
+    assert len(builder.create_conditions(id=1)) == 1
+    assert len(builder.create_conditions(id=2)) == 1
+
+
+@pytest.mark.parametrize(
+    ("conditions", "expected"),
+    [
+        ({"id": 1}, "queues.id = %(id_1)s"),
+        ({"id__in": [1, 2]}, "queues.id IN (__[POSTCOMPILE_id_1])"),
+        ({"start_time__gte": datetime(2025, 1, 1)}, "queues.start_time >= "),
+        ({"start_time__lt": datetime(2025, 1, 1)}, "queues.start_time < "),
+        ({"name__ilike": "%a%"}, "queues.name ILIKE "),
+        ({"name__isnull": True}, "queues.name IS NULL"),
+        ({"name__isnull": False}, "queues.name IS NOT NULL"),
+    ],
+)
+def test_operators(
+    builder: ConditionBuilder,
+    conditions: dict[str, object],
+    expected: str,
+) -> None:
+    """
+    Tests the SQL generated for each filter operator.
+    """
+    assert compile_where(builder, **conditions).startswith(expected)
+
+
+def test_same_filter_shape_shares_cache_key(builder: ConditionBuilder) -> None:
+    """
+    Tests that statements differing only in values hit the same compiled
+    cache entry, while a different filter shape does not.
+    """
+
+    def cache_key(**conditions: object) -> object:
+        stmt = select(Queue).filter(*builder.create_conditions(**conditions))
+        return stmt._generate_cache_key().key  # type: ignore[union-attr]
+
+    assert cache_key(id__in=[1, 2], name__ilike="%a%") == cache_key(
+        id__in=[3, 4, 5], name__ilike="%b%"
+    )
+    assert cache_key(id__in=[1]) != cache_key(id__gte=1)
+
+
+def test_unknown_field_and_operator(builder: ConditionBuilder) -> None:
+    """
+    Tests that unknown fields and operators are rejected.
+    """
+    with pytest.raises(AttributeError):
+        builder.create_conditions(unknown=1)
+    with pytest.raises(ValueError):
+        builder.create_conditions(id__regex="1")
+    with pytest.raises(AttributeError):
+        builder.create_options("unknown")
@@ -0,0 +1,233 @@
+import time
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import jwt
+import pytest
+import pytest_asyncio
+from _pytest.monkeypatch import MonkeyPatch
+
+from core.auth import strategy as strategy_module
+from core.auth.revocation import BloomFilter, RevocationList
+from core.auth.strategy import JWTAccessStrategy
+from domains.users import User
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self) -> None:
+        for name, args, kwargs in self.calls:
+            await getattr(self.redis, name)(*args, **kwargs)
+
+
+class FakeRedis:
+    """A minimal in-memory stand-in for the Redis commands used by auth."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.reads = 0
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> None:
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+
+    async def mget(self, *keys: str) -> list[bytes | None]:
+        self.reads += 1
+        return [self.data.get(key) for key in keys]
+
+    async def getdel(self, key: str) -> bytes | None:
+        return self.data.pop(key, None)
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        pass
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest_asyncio.fixture
+def redis_client() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest_asyncio.fixture
+def revocations(redis_client: FakeRedis, monkeypatch: MonkeyPatch) -> RevocationList:
+    """
+    Provides a connected revocation list used by the strategy.
+    """
+    revocations = RevocationList(
+        redis_client=redis_client,  # type: ignore[arg-type]
+        prefix="test:revoked",
+        channel="test:revoked",
+        bloom_bits=1024,
+        bloom_hashes=3,
+        rebuild_seconds=60,
+    )
+    revocations._subscribed = True
+    monkeypatch.setattr(strategy_module, "revocation_list", revocations)
+    return revocations
+
+
+@pytest_asyncio.fixture
+def strategy(redis_client: FakeRedis, revocations: RevocationList) -> JWTAccessStrategy:
+    return JWTAccessStrategy(
+        redis_client,  # type: ignore[arg-type]
+        "secret",
+        lifetime_seconds=60,
+        refresh_lifetime_seconds=3600,
+    )
+
+
+@pytest.fixture
+def user_manager() -> MagicMock:
+    user_manager = MagicMock()
+    user_manager.parse_id.side_effect = UUID
+    return user_manager
+
+
+def make_user() -> User:
+    return User(
+        id=uuid4(),
+        email="user@example.com",
+        first_name="Test",
+        last_name="User",
+        is_active=True,
+        is_superuser=False,
+        is_verified=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_access_token_is_verified_without_io(
+    strategy: JWTAccessStrategy,
+    redis_client: FakeRedis,
+    user_manager: MagicMock,
+) -> None:
+    """
+    Tests that a valid token yields its user from the claims alone.
+    """
+    user = make_user()
+    access_token, _ = await strategy.write_tokens(user)
+
+    token_user = await strategy.read_token(access_token, user_manager)
+
+    assert token_user is not None
+    assert token_user.id == user.id
+    assert token_user.email == user.email
+    assert (token_user.is_active, token_user.is_superuser) == (True, False)
+    assert redis_client.reads == 0
+    user_manager.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_forged_and_expired_tokens_are_rejected(
+    strategy: JWTAccessStrategy,
+    user_manager: MagicMock,
+) -> None:
+    """
+    Tests that tokens with a wrong signature or past expiry are rejected.
+    """
+    user = make_user()
+    forged = await JWTAccessStrategy(
+        FakeRedis(), "other", lifetime_seconds=60, refresh_lifetime_seconds=60  # type: ignore[arg-type]
+    ).write_token(user)
+    expired = jwt.encode(
+        {"sub": str(user.id), "aud": strategy.audience, "exp": time.time() - 1},
+        "secret",
+    )
+
+    assert await strategy.read_token(forged, user_manager) is None
+    assert await strategy.read_token(expired, user_manager) is None
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_token_and_refresh_token(
+    strategy: JWTAccessStrategy,
+    user_manager: MagicMock,
+) -> None:
+    """
+    Tests that a logged-out token is rejected and its refresh token is gone.
+    """
+    user = make_user()
+    access_token, refresh_token = await strategy.write_tokens(user)
+
+    await strategy.destroy_token(access_token, user)
+
+    assert await strategy.read_token(access_token, user_manager) is None
+    assert await strategy.consume_refresh_token(refresh_token) is None
+
+
+@pytest.mark.asyncio
+async def test_user_revocation_rejects_older_tokens(
+    strategy: JWTAccessStrategy,
+    revocations: RevocationList,
+    user_manager: MagicMock,
+) -> None:
+    """
+    Tests that revoking a user rejects their existing tokens but not new ones.
+    """
+    user = make_user()
+    old_token = await strategy.write_token(user)
+
+    await revocations.revoke_user(user.id, 60)
+    new_token = await strategy.write_token(user)
+
+    assert await strategy.read_token(old_token, user_manager) is None
+    assert await strategy.read_token(new_token, user_manager) is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_single_use(strategy: JWTAccessStrategy) -> None:
+    """
+    Tests that a refresh token resolves to its user exactly once.
+    """
+    user = make_user()
+    _, refresh_token = await strategy.write_tokens(user)
+
+    assert await strategy.consume_refresh_token(refresh_token) == str(user.id)
+    assert await strategy.consume_refresh_token(refresh_token) is None
+
+
+@pytest.mark.asyncio
+async def test_disconnected_revocation_list_checks_redis(
+    strategy: JWTAccessStrategy,
+    revocations: RevocationList,
+    redis_client: FakeRedis,
+    user_manager: MagicMock,
+) -> None:
+    """
+    Tests that revocations are confirmed in Redis while pub/sub is down.
+    """
+    revocations._subscribed = False
+    token = await strategy.write_token(make_user())
+
+    assert await strategy.read_token(token, user_manager) is not None
+    assert redis_client.reads == 1
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    """
+    Tests that every added member is reported as present.
+    """
+    bloom = BloomFilter(size_bits=4096, hashes=5)
+    members = [f"token:{uuid4().hex}" for _ in range(200)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    assert sum(f"token:{uuid4().hex}" in bloom for _ in range(200)) < 20
@@ -1,11 +1,12 @@
-import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
+from uuid import uuid4
 
 import pytest
-from _pytest.logging import LogCaptureFixture
-from _pytest.monkeypatch import MonkeyPatch
+from kombu.utils.json import dumps, loads
 
+from domains.queues import CreateQueue
+from domains.users import User
 from utils.logger import log_action
 
 
@@ -17,7 +18,7 @@ async def test_log_action_success(
     Test log_action when the wrapped function succeeds.
 
     Verifies that when the function returns normally,
-    the log data is sent via process_log.apply_async.
+    the log data is added to the log buffer.
     """
     # Unpack the patched Celery mocks.
     mock_log_apply_async, _ = patch_celery_apply_async
@@ -30,13 +31,13 @@ async def test_log_action_success(
     result = await dummy(a=1, b=2)
     assert result == 3
 
-    # Ensure apply_async was called exactly once.
+    # Ensure the log was buffered exactly once.
     mock_log_apply_async.assert_called_once()
 
     # Extract call arguments from the mock.
-    # The decorator calls: process_log.apply_async(args=[log_data])
+    # The decorator calls: log_buffer.add(log_data)
     args, kwargs = mock_log_apply_async.call_args
-    data = kwargs["args"][0]
+    data = args[0]
 
     # Verify that the log data is as expected.
     assert data["action"] == "TEST_ACTION"
@@ -69,10 +70,10 @@ async def test_log_action_failure(
         await dummy_fail(x=10, y=20)
     assert "fail test" in str(excinfo.value)
 
-    # Ensure apply_async was called exactly once.
+    # Ensure the log was buffered exactly once.
     mock_log_apply_async.assert_called_once()
     args, kwargs = mock_log_apply_async.call_args
-    data = kwargs["args"][0]
+    data = args[0]
 
     # Verify that the log data includes the error details.
     assert data["action"] == "FAIL_ACTION"
@@ -86,33 +87,44 @@ async def test_log_action_failure(
 
 
 @pytest.mark.asyncio
-async def test_apply_async_exception(
-    patch_celery_apply_async: tuple[MagicMock, MagicMock],
-    monkeypatch: MonkeyPatch,
-    caplog: LogCaptureFixture,
+async def test_log_action_entry_is_json_safe(
+    patch_celery_apply_async: tuple[MagicMock, MagicMock]
 ) -> None:
     """
-    Test log_action when process_log.apply_async raises an exception.
-
-    Verifies that if apply_async fails, the error is caught and logged,
-    but the wrapped function still returns its value.
+    Test that a logged `User`, model and arbitrary object reach the buffer
+    as values the json-only broker can encode (a batch of them included).
     """
     mock_log_apply_async, _ = patch_celery_apply_async
-
-    # Configure the mock to raise a RuntimeError when called.
-    mock_log_apply_async.side_effect = RuntimeError("Celery down")
-
-    # Set log capture for the 'process_log' logger at ERROR level.
-    caplog.set_level(logging.ERROR, logger="process_log")
-
-    @log_action("EXC_ACTION", "exc_collection")
-    async def dummy(a: int) -> int:
-        return a
-
-    # Call the decorated function.
-    result = await dummy(a=42)
-    assert result == 42
-
-    # Check that a log record with "Celery down" is present.
-    found = any("Celery down" in record.message for record in caplog.records)
-    assert found
+    user = User(
+        id=uuid4(),
+        email="user@example.com",
+        hashed_password="secret",
+        first_name="Test",
+        last_name="User",
+    )
+    queue = CreateQueue(
+        name="queue",
+        start_time=datetime(2030, 1, 1, tzinfo=timezone.utc),
+    )
+
+    @log_action("POST", "queues")
+    async def create_queue(queue: CreateQueue, user: User, session: object) -> None:
+        pass
+
+    await create_queue(queue=queue, user=user, session=object())
+
+    args, _ = mock_log_apply_async.call_args
+    data = args[0]
+    assert data["parameters"]["user"] == {
+        "id": str(user.id),
+        "email": "user@example.com",
+        "first_name": "Test",
+        "last_name": "User",
+    }
+
+    # `process_log_batch` is sent with a batch of entries as its argument
+    decoded = loads(dumps([[data, data]]))
+    assert decoded[0][0]["parameters"]["user"]["email"] == "user@example.com"
+    assert decoded[0][0]["parameters"]["queue"]["name"] == "queue"
+    assert isinstance(decoded[0][0]["parameters"]["session"], str)
+    assert "secret" not in dumps(data)
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+from tasks import task_publisher
+
+from utils.log_buffer import LogBuffer
+
+
+@pytest.fixture
+def mock_submit(monkeypatch: MonkeyPatch) -> MagicMock:
+    """
+    Mocks `task_publisher.submit`.
+    """
+    mock_submit = MagicMock(return_value=True)
+    monkeypatch.setattr(task_publisher, "submit", mock_submit)
+    return mock_submit
+
+
+def sent_batches(mock_submit: MagicMock) -> list[list[dict]]:
+    return [call.args[1][0] for call in mock_submit.call_args_list]
+
+
+def test_flush_splits_logs_into_batches(mock_submit: MagicMock) -> None:
+    """
+    Tests that one message is sent per `batch_size` logs.
+    """
+    buffer = LogBuffer(batch_size=2, flush_interval=60, max_size=100)
+    for i in range(5):
+        buffer.add({"n": i})
+
+    buffer.flush()
+
+    assert sent_batches(mock_submit) == [
+        [{"n": 0}, {"n": 1}],
+        [{"n": 2}, {"n": 3}],
+        [{"n": 4}],
+    ]
+    assert len(buffer) == 0
+
+
+def test_overflow_drops_oldest_logs(
+    mock_submit: MagicMock,
+    caplog: LogCaptureFixture,
+) -> None:
+    """
+    Tests that the buffer is bounded and reports dropped logs.
+    """
+    caplog.set_level(logging.WARNING, logger="utils.log_buffer")
+    buffer = LogBuffer(batch_size=10, flush_interval=60, max_size=2)
+    for i in range(3):
+        buffer.add({"n": i})
+
+    buffer.flush()
+
+    assert sent_batches(mock_submit) == [[{"n": 1}, {"n": 2}]]
+    assert "dropped 1 logs" in caplog.text
+
+
+def test_full_publisher_keeps_logs_buffered(mock_submit: MagicMock) -> None:
+    """
+    Tests backpressure: logs not accepted by the publisher stay in the buffer.
+    """
+    mock_submit.side_effect = [True, False]
+    buffer = LogBuffer(batch_size=2, flush_interval=60, max_size=100)
+    for i in range(5):
+        buffer.add({"n": i})
+
+    buffer.flush()
+
+    assert mock_submit.call_count == 2
+    assert list(buffer._entries) == [{"n": 2}, {"n": 3}, {"n": 4}]
+
+
+@pytest.mark.asyncio
+async def test_background_flush_by_size_and_time(
+    mock_submit: MagicMock,
+) -> None:
+    """
+    Tests that a full batch is sent right away, a partial one after
+    the flush interval, and the rest on stop.
+    """
+    buffer = LogBuffer(batch_size=2, flush_interval=0.05, max_size=100)
+    await buffer.start()
+
+    buffer.add({"n": 0})
+    buffer.add({"n": 1})
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert sent_batches(mock_submit) == [[{"n": 0}, {"n": 1}]]
+
+    buffer.add({"n": 2})
+    await asyncio.sleep(0.1)
+    assert sent_batches(mock_submit)[-1] == [{"n": 2}]
+
+    buffer.add({"n": 3})
+    await buffer.stop()
+    assert sent_batches(mock_submit)[-1] == [{"n": 3}]
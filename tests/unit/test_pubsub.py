@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from core import pubsub
+from core.pubsub import listen
+
+
+class FakePubSub:
+    """A pub/sub connection that delivers scripted messages, then fails or hangs."""
+
+    def __init__(self, messages: list[dict[str, Any]], fail: bool) -> None:
+        self.messages = messages
+        self.fail = fail
+        self.subscribed: list[tuple[str, str]] = []
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.subscribed.append(("subscribe", channel))
+
+    async def psubscribe(self, pattern: str) -> None:
+        self.subscribed.append(("psubscribe", pattern))
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        for message in self.messages:
+            yield message
+        if self.fail:
+            raise ConnectionError("connection lost")
+        await asyncio.Event().wait()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_listen_resubscribes_after_connection_loss(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Tests that messages are passed on, and that a lost subscription is
+    closed, reported and reopened after a backoff.
+    """
+    connections = [
+        FakePubSub(
+            [
+                {"type": "psubscribe", "channel": b"q:*", "data": 1},
+                {"type": "pmessage", "channel": b"q:1", "data": b"first"},
+            ],
+            fail=True,
+        ),
+        FakePubSub(
+            [{"type": "pmessage", "channel": b"q:2", "data": b"second"}],
+            fail=False,
+        ),
+    ]
+    redis_client = AsyncMock()
+    redis_client.pubsub = lambda: connections[len(calls["subscribe"])]
+    sleep = AsyncMock()
+    monkeypatch.setattr(pubsub.asyncio, "sleep", sleep)
+
+    calls: dict[str, list[Any]] = {"subscribe": [], "unsubscribe": []}
+    received: list[tuple[bytes, bytes]] = []
+    done = asyncio.Event()
+
+    def on_message(channel: bytes, data: bytes) -> None:
+        received.append((channel, data))
+        if len(received) == 2:
+            done.set()
+
+    async def on_subscribe() -> None:
+        calls["subscribe"].append(len(received))
+
+    task = asyncio.create_task(
+        listen(
+            redis_client,
+            "q:*",
+            on_message,
+            name="Test channel",
+            pattern=True,
+            on_subscribe=on_subscribe,
+            on_unsubscribe=lambda: calls["unsubscribe"].append(len(received)),
+        )
+    )
+    await asyncio.wait_for(done.wait(), 1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert received == [(b"q:1", b"first"), (b"q:2", b"second")]
+    assert calls == {"subscribe": [0, 1], "unsubscribe": [1, 2]}
+    assert [connection.subscribed for connection in connections] == [
+        [("psubscribe", "q:*")]
+    ] * 2
+    assert all(connection.closed for connection in connections)
+    sleep.assert_awaited_once_with(1.0)
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from domains.queues import GetQueuesPage, GetQueueWithEntries, Queue, QueueEntries
+from domains.queues.serializers import dump_queue_with_entries, dump_queues_page
+from domains.tags import Tags
+from domains.users import User
+
+START_TIMES = [
+    datetime(2030, 1, 1, 10, 0),
+    datetime(2030, 1, 1, 10, 0, tzinfo=timezone.utc),
+    datetime(2030, 1, 1, 10, 0, 0, 123456, tzinfo=timezone(timedelta(hours=3))),
+]
+NAMES = ["queue", "Очередь", 'q"\\/\x01\t']
+
+
+def make_queue(queue_id: int, start_time: datetime, name: str) -> Queue:
+    # odd queues have more slots than positions (free_slots is capped)
+    max_slots = 40 if queue_id % 2 else 30
+    queue = Queue(id=queue_id, name=name, start_time=start_time, max_slots=max_slots)
+    queue.queue_tags = [Tags(name=f"tag-{i}-{name}") for i in range(queue_id % 3)]
+    queue.entries = [
+        QueueEntries(
+            position=position,
+            user=User(first_name=f"{name}-{position}", last_name="Фамилия"),
+        )
+        for position in range(1, queue_id % 4 + 1)
+    ]
+    queue.taken_slots = len(queue.entries)
+    return queue
+
+
+QUEUES = [
+    make_queue(i, start_time, name)
+    for i, (start_time, name) in enumerate(
+        [(start_time, name) for start_time in START_TIMES for name in NAMES], start=1
+    )
+]
+
+
+@pytest.mark.parametrize("next_cursor", [None, "eyJpZCI6IDF9"])
+@pytest.mark.parametrize("queues", [[], QUEUES])
+def test_queues_page_matches_response_model(
+    queues: list[Queue],
+    next_cursor: str | None,
+) -> None:
+    """
+    Tests that the fast page payload is byte-identical to FastAPI's
+    `response_model=GetQueuesPage` serialization through ORJSONResponse.
+    """
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get("/queues", response_model=GetQueuesPage)
+    async def get_queues():
+        return {"items": queues, "next_cursor": next_cursor}
+
+    with TestClient(app) as client:
+        expected = client.get("/queues").content
+
+    assert dump_queues_page(queues, next_cursor) == expected
+
+
+@pytest.mark.parametrize("queue", QUEUES, ids=lambda queue: str(queue.id))
+def test_queue_with_entries_matches_schema(queue: Queue) -> None:
+    """
+    Tests that the fast detail payload is byte-identical to the
+    `GetQueueWithEntries` dump it replaces.
+    """
+    expected = orjson.dumps(
+        GetQueueWithEntries.model_validate(queue, from_attributes=True).model_dump(
+            mode="json", by_alias=True
+        )
+    )
+
+    assert dump_queue_with_entries(queue) == expected
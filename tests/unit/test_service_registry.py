@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.factories import get_service_by_model
+from core.registry import model_registry
+from core.session_context import current_read_session, current_session
+from domains.tags import Tags
+
+
+def test_services_are_shared() -> None:
+    """
+    Tests that one service per model and session kind is created.
+    """
+    service = model_registry.get_service(Tags)
+
+    assert model_registry.get_service(Tags) is service
+    assert model_registry.get_service(Tags, read_only=True) is not service
+    assert service.repository.session_var is current_session
+    assert (
+        model_registry.get_repository(Tags, read_only=True).session_var
+        is current_read_session
+    )
+
+
+@pytest.mark.asyncio
+async def test_each_request_sees_its_own_session() -> None:
+    """
+    Tests that concurrent requests bind their sessions independently.
+    """
+    bind_service = get_service_by_model(Tags)
+
+    async def request(session: MagicMock) -> MagicMock:
+        service = await bind_service(session)
+        await asyncio.sleep(0)
+        return service.repository.session
+
+    sessions = [MagicMock(), MagicMock()]
+    assert await asyncio.gather(*map(request, sessions)) == sessions
+
+
+@pytest.mark.asyncio
+async def test_unbound_repository_raises() -> None:
+    """
+    Tests that a shared repository used outside a request fails loudly.
+    """
+
+    async def outside_request() -> None:
+        model_registry.get_repository(Tags, read_only=True).session
+
+    with pytest.raises(RuntimeError, match="current_read_session"):
+        await asyncio.create_task(outside_request())
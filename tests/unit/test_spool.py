@@ -0,0 +1,120 @@
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from tasks.publisher import TaskPublisher
+from tasks.spool import Spool
+
+
+@pytest.fixture
+def spool(tmp_path: Path) -> Spool:
+    return Spool(tmp_path, max_segment_bytes=1024 * 1024)
+
+
+class Recorder:
+    """Collects replayed messages and optionally fails after some of them."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.sent: list[tuple[str, list[Any]]] = []
+        self.fail_after = fail_after
+
+    def __call__(self, task_name: str, args: list[Any]) -> None:
+        if self.fail_after is not None and len(self.sent) >= self.fail_after:
+            raise ConnectionError("broker down")
+        self.sent.append((task_name, args))
+
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_replay_round_trip_preserves_types(spool: Spool, tmp_path: Path) -> None:
+    """
+    Tests that spooled messages are replayed in order with their types intact.
+    """
+    timestamp = datetime.now(timezone.utc)
+    spool.append("tasks.process_error", [{"error": "a", "timestamp": timestamp}])
+    spool.append("tasks.process_error", [{"error": "b", "timestamp": timestamp}])
+
+    recorder = Recorder()
+    assert spool.replay(recorder) == 2
+
+    assert recorder.sent == [
+        ("tasks.process_error", [{"error": "a", "timestamp": timestamp}]),
+        ("tasks.process_error", [{"error": "b", "timestamp": timestamp}]),
+    ]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_replay_keeps_unsent_messages(spool: Spool) -> None:
+    """
+    Tests that a broker failure during replay keeps the rest for later.
+    """
+    for i in range(3):
+        spool.append("tasks.test", [i])
+
+    assert spool.replay(Recorder(fail_after=1)) == 1
+
+    recorder = Recorder()
+    assert spool.replay(recorder) == 2
+    assert recorder.sent == [("tasks.test", [1]), ("tasks.test", [2])]
+
+
+def test_torn_record_is_skipped(spool: Spool) -> None:
+    """
+    Tests recovery from a record half-written by a crash.
+    """
+    spool.append("tasks.test", [1])
+    assert spool._file_path is not None
+    with open(spool._file_path, "ab") as f:
+        f.write(b"\x00\x00\x01\x00garbage")
+
+    recorder = Recorder()
+    assert spool.replay(recorder) == 1
+    assert recorder.sent == [("tasks.test", [1])]
+
+
+def test_segments_of_dead_processes_are_recovered(tmp_path: Path) -> None:
+    """
+    Tests that segments left open by a crashed worker are replayed,
+    while segments of live workers are left alone.
+    """
+    crashed = Spool(tmp_path, max_segment_bytes=1024 * 1024)
+    crashed.append("tasks.test", ["crashed"])
+    assert crashed._file_path is not None
+    crashed._file_path.rename(tmp_path / f"1-{dead_pid()}.open")
+
+    live = Spool(tmp_path, max_segment_bytes=1024 * 1024)
+    live.append("tasks.test", ["live"])
+    assert live._file_path is not None
+    live._file_path.rename(tmp_path / f"2-{os.getppid()}.open")
+
+    recorder = Recorder()
+    assert Spool(tmp_path, max_segment_bytes=1024).replay(recorder) == 1
+    assert recorder.sent == [("tasks.test", ["crashed"])]
+    assert [p.name for p in tmp_path.iterdir()] == [f"2-{os.getppid()}.open"]
+
+
+def test_publisher_spools_rejected_messages(spool: Spool) -> None:
+    """
+    Tests that messages the broker rejected are spooled instead of lost.
+    """
+    task = MagicMock()
+    task.name = "tasks.test"
+    task.apply_async.side_effect = ConnectionError("broker down")
+    publisher = TaskPublisher(queue_size=10, spool=spool, replay_interval=60)
+
+    publisher.submit(task, [1])
+    publisher.start()
+    publisher.stop()
+
+    recorder = Recorder()
+    assert spool.replay(recorder) == 1
+    assert recorder.sent == [("tasks.test", [1])]
@@ -0,0 +1,69 @@
+import logging
+import threading
+from unittest.mock import MagicMock
+
+from _pytest.logging import LogCaptureFixture
+from tasks.publisher import TaskPublisher
+
+
+def make_task(name: str = "tasks.test") -> MagicMock:
+    task = MagicMock()
+    task.name = name
+    return task
+
+
+def test_submit_never_blocks_on_a_slow_broker() -> None:
+    """
+    Tests that a stalled broker only fills the queue and never blocks callers.
+    """
+    broker_released = threading.Event()
+    slow_task = make_task()
+    slow_task.apply_async.side_effect = lambda **kwargs: broker_released.wait(5)
+    publisher = TaskPublisher(queue_size=2)
+    publisher.start()
+
+    accepted = [publisher.submit(slow_task, [i]) for i in range(10)]
+
+    assert accepted.count(True) <= 3
+    assert accepted[-1] is False
+    assert publisher.dropped == accepted.count(False)
+
+    broker_released.set()
+    publisher.stop()
+
+
+def test_drop_oldest_policy_keeps_newest_messages() -> None:
+    """
+    Tests that `drop_oldest` discards queued messages in favour of new ones.
+    """
+    task = make_task()
+    publisher = TaskPublisher(queue_size=2, overflow_policy="drop_oldest")
+
+    assert all(publisher.submit(task, [i]) for i in range(4))
+    assert publisher.dropped == 2
+
+    publisher.start()
+    publisher.stop()
+
+    sent = [call.kwargs["args"] for call in task.apply_async.call_args_list]
+    assert sent == [[2], [3]]
+
+
+def test_stop_drains_queue_and_logs_broker_errors(caplog: LogCaptureFixture) -> None:
+    """
+    Tests that queued messages are sent on stop and broker errors are logged.
+    """
+    caplog.set_level(logging.ERROR, logger="tasks.publisher")
+    task = make_task()
+    failing_task = make_task("tasks.failing")
+    failing_task.apply_async.side_effect = RuntimeError("Celery down")
+    publisher = TaskPublisher(queue_size=10)
+
+    publisher.submit(failing_task, [0])
+    publisher.submit(task, [1])
+    publisher.start()
+    publisher.stop()
+
+    task.apply_async.assert_called_once_with(args=[1])
+    assert "Celery down" in caplog.text
+    assert publisher.pending() == 0
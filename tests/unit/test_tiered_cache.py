@@ -0,0 +1,180 @@
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from redis.exceptions import ConnectionError
+
+from core.cache import TieredCache
+
+
+class InMemoryPipeline:
+    """A minimal stand-in for a non-transactional Redis pipeline."""
+
+    def __init__(self, redis: "InMemoryRedis") -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> "InMemoryPipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: self.calls.append((name, args))
+
+    async def execute(self) -> None:
+        for name, args in self.calls:
+            await getattr(self.redis, name)(*args)
+
+
+class InMemoryRedis:
+    """A minimal in-memory stand-in for the Redis commands used by the cache."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.published: list[tuple[str, str]] = []
+
+    async def mget(self, *keys: str) -> list[bytes | None]:
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    async def incr(self, key: str) -> None:
+        self.data[key] = b"%d" % (int(self.data.get(key, 0)) + 1)
+
+    async def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.published.append((channel, message))
+
+    def pipeline(self, transaction: bool = True) -> InMemoryPipeline:
+        return InMemoryPipeline(self)
+
+
+@pytest_asyncio.fixture
+def redis_client() -> InMemoryRedis:
+    return InMemoryRedis()
+
+
+@pytest_asyncio.fixture
+def cache(redis_client: InMemoryRedis) -> TieredCache:
+    """
+    Provides a cache backed by the in-memory Redis stand-in.
+    """
+    return TieredCache(
+        redis_client=redis_client,  # type: ignore[arg-type]
+        namespace="test",
+        ttl_seconds=60,
+        local_ttl_seconds=60,
+        local_max_size=2,
+        channel="test:invalidate",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_caches_payload(cache: TieredCache) -> None:
+    """
+    Tests that the factory is only called on a miss.
+    """
+    factory = AsyncMock(return_value=b'{"id":1}')
+
+    assert await cache.get_or_set(1, factory) == b'{"id":1}'
+    assert await cache.get_or_set(1, factory) == b'{"id":1}'
+
+    factory.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload_and_broadcasts(
+    cache: TieredCache,
+    redis_client: InMemoryRedis,
+) -> None:
+    """
+    Tests that invalidation drops the payload and notifies other workers.
+    """
+    factory = AsyncMock(side_effect=[b"old", b"new"])
+
+    await cache.get_or_set(1, factory)
+    await cache.invalidate(1)
+
+    assert await cache.get_or_set(1, factory) == b"new"
+    assert redis_client.published == [("test:invalidate", "test:1")]
+
+
+@pytest.mark.asyncio
+async def test_payload_computed_before_write_is_not_served(
+    cache: TieredCache,
+) -> None:
+    """
+    Tests that a payload stored under an outdated version is treated as a miss.
+
+    This covers a reader that loaded data before a concurrent write
+    and stored it after the write invalidated the key.
+    """
+
+    async def stale_factory() -> bytes:
+        await cache.invalidate(1)
+        return b"stale"
+
+    await cache.get_or_set(1, stale_factory)
+    fresh_factory = AsyncMock(return_value=b"fresh")
+
+    assert await cache.get_or_set(1, fresh_factory) == b"fresh"
+    fresh_factory.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded_and_evicted(
+    cache: TieredCache,
+    redis_client: InMemoryRedis,
+) -> None:
+    """
+    Tests the in-process tier: hits skip Redis, size is bounded,
+    and invalidation messages from other workers evict entries.
+    """
+    cache._subscribed = True
+    for key in (1, 2, 3):
+        await cache.get_or_set(key, AsyncMock(return_value=b"%d" % key))
+
+    assert list(cache._local) == ["2", "3"]
+
+    redis_client.data.clear()
+    assert await cache.get_or_set(3, AsyncMock()) == b"3"
+
+    cache._evict_local("3")
+    factory = AsyncMock(return_value=b"reloaded")
+    assert await cache.get_or_set(3, factory) == b"reloaded"
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_factory(cache: TieredCache) -> None:
+    """
+    Tests that an unavailable Redis never fails the read path.
+    """
+    cache.redis = AsyncMock()
+    cache.redis.mget.side_effect = ConnectionError("redis down")
+    factory = AsyncMock(return_value=b"payload")
+
+    assert await cache.get_or_set(1, factory) == b"payload"
+    cache.redis.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_is_pass_through(cache: TieredCache) -> None:
+    """
+    Tests that a disabled cache always calls the factory.
+    """
+    cache.enabled = False
+    factory = AsyncMock(return_value=b"payload")
+
+    await cache.get_or_set(1, factory)
+    await cache.get_or_set(1, factory)
+
+    assert factory.await_count == 2
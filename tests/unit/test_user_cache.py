@@ -0,0 +1,157 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from _pytest.monkeypatch import MonkeyPatch
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.auth import strategy as strategy_module
+from core.auth.strategy import CachedRedisStrategy
+from core.cache import UserCache
+from domains.users import User
+
+
+@pytest_asyncio.fixture
+def cache(monkeypatch: MonkeyPatch) -> UserCache:
+    """
+    Provides a subscribed user cache used by the auth strategy.
+    """
+    cache = UserCache(
+        redis_client=AsyncMock(),
+        ttl_seconds=60,
+        max_size=2,
+        channel="test:auth",
+    )
+    cache._subscribed = True
+    monkeypatch.setattr(strategy_module, "user_cache", cache)
+    return cache
+
+
+def make_user() -> User:
+    return User(id=uuid4(), first_name="Test", last_name="User", is_active=True)
+
+
+@pytest.mark.asyncio
+async def test_hot_token_skips_redis_and_database(cache: UserCache) -> None:
+    """
+    Tests that a cached token needs neither the Redis lookup nor the SELECT.
+    """
+    user = make_user()
+    redis = AsyncMock()
+    redis.get.return_value = str(user.id)
+    user_manager = MagicMock()
+    user_manager.parse_id.side_effect = lambda value: value
+    user_manager.get = AsyncMock(return_value=user)
+    strategy = CachedRedisStrategy(redis, 60)
+
+    assert await strategy.read_token("token", user_manager) is user
+    assert (await strategy.read_token("token", user_manager)).id == user.id
+
+    redis.get.assert_awaited_once()
+    user_manager.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_logout_drops_token(cache: UserCache) -> None:
+    """
+    Tests that destroying a token removes it from the cache and notifies workers.
+    """
+    user = make_user()
+    cache.set("token", user, cache.epoch)
+
+    await CachedRedisStrategy(AsyncMock(), 60).destroy_token("token", user)
+
+    assert cache.get("token") is None
+    cache.redis.publish.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_user_invalidation_drops_all_tokens(cache: UserCache) -> None:
+    """
+    Tests that a user update drops every token of that user only.
+    """
+    user, other_user = make_user(), make_user()
+    cache.set("a", user, cache.epoch)
+    cache.set("b", user, cache.epoch)
+
+    await cache.invalidate_user(user.id)
+    cache.set("c", other_user, cache.epoch)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c").id == other_user.id
+
+
+def test_cache_is_bounded_and_ignores_stale_fills(cache: UserCache) -> None:
+    """
+    Tests the size bound and that a user loaded before an invalidation
+    is not cached.
+    """
+    users = [make_user() for _ in range(3)]
+    for i, user in enumerate(users):
+        cache.set(str(i), user, cache.epoch)
+
+    assert cache.get("0") is None
+    assert cache.get("2").id == users[2].id
+
+    epoch = cache.epoch
+    cache._evict(f"user:{users[1].id}")
+    cache.set("3", users[1], epoch)
+    assert cache.get("3") is None
+
+
+def test_unsubscribed_cache_is_bypassed(cache: UserCache) -> None:
+    """
+    Tests that nothing is served while invalidations cannot be received.
+    """
+    user = make_user()
+    cache.set("token", user, cache.epoch)
+    cache._subscribed = False
+
+    assert cache.get("token") is None
+
+
+def test_hits_are_independent_snapshots(cache: UserCache) -> None:
+    """
+    Tests that every hit is a new detached user built from the snapshot
+    taken when it was cached, so changes to one never leak into another.
+    """
+    user = make_user()
+    cache.set("token", user, cache.epoch)
+    user.first_name = "Changed"
+
+    first, second = cache.get("token"), cache.get("token")
+    first.is_active = False
+
+    assert first is not second
+    assert first is not user
+    assert (second.id, second.first_name, second.is_active) == (
+        user.id,
+        "Test",
+        True,
+    )
+    assert inspect(second).detached
+
+
+@pytest.mark.asyncio
+async def test_hit_can_be_updated(cache: UserCache, test_session: AsyncSession) -> None:
+    """
+    Tests that a cached user added to a session updates its row
+    (as fastapi-users does on a profile update) instead of inserting it.
+    """
+    user = make_user()
+    user.email, user.hashed_password = "user@example.com", "x"
+    test_session.add(user)
+    await test_session.commit()
+    cache.set("token", user, cache.epoch)
+
+    hit = cache.get("token")
+    hit.first_name = "Changed"
+    test_session.expunge_all()
+    test_session.add(hit)
+    await test_session.commit()
+
+    names = (await test_session.execute(select(User.first_name))).scalars().all()
+    assert names == ["Changed"]
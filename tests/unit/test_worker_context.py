@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+from typing import Generator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from tasks import worker
+from tasks.tasks import process_error, process_log_batch
+
+
+@pytest.fixture
+def mongo_manager(monkeypatch: MonkeyPatch) -> Generator[MagicMock]:
+    """
+    Replaces the MongoDB manager and resets the worker context around the test.
+    """
+    manager = MagicMock()
+    manager.get_collection.return_value.insert_one = AsyncMock()
+    manager.get_collection.return_value.insert_many = AsyncMock()
+    get_mongo_manager = MagicMock(return_value=manager)
+    monkeypatch.setattr(worker, "get_mongo_manager", get_mongo_manager)
+
+    worker.shutdown_worker_process()
+    yield get_mongo_manager
+    worker.shutdown_worker_process()
+
+
+def test_tasks_share_worker_loop_and_client(mongo_manager: MagicMock) -> None:
+    """
+    Tests that consecutive tasks reuse one event loop and one MongoDB client.
+    """
+    worker.init_worker_process()
+    loop = worker.get_worker_context().loop
+
+    for _ in range(3):
+        process_error.run({"error": "boom"})
+
+    mongo_manager.assert_called_once()
+    assert worker.get_worker_context().loop is loop
+    assert not loop.is_closed()
+
+
+def test_log_batch_uses_one_insert_per_collection(mongo_manager: MagicMock) -> None:
+    """
+    Tests that a batch is written with `insert_many`, grouped by collection.
+    """
+    entry = {
+        "action": "POST",
+        "parameters": {},
+        "status": "success",
+        "timestamp": datetime.now(timezone.utc),
+    }
+    batch = [
+        {**entry, "collection_name": "queues"},
+        {**entry, "collection_name": "queue_entries"},
+        {**entry, "collection_name": "queues"},
+    ]
+
+    process_log_batch.run(batch)
+
+    manager = mongo_manager.return_value
+    assert [c.args[0] for c in manager.get_collection.call_args_list] == [
+        "queues",
+        "queue_entries",
+    ]
+    insert_many = manager.get_collection.return_value.insert_many
+    assert [len(c.args[0]) for c in insert_many.await_args_list] == [2, 1]
+    assert batch[0]["collection_name"] == "queues"
+
+
+def test_shutdown_closes_context(mongo_manager: MagicMock) -> None:
+    """
+    Tests that process shutdown closes the client and the loop.
+    """
+    context = worker.get_worker_context()
+
+    worker.shutdown_worker_process()
+
+    assert context.loop.is_closed()
+    mongo_manager.return_value.client.close.assert_called_once()
+    assert worker.get_worker_context() is not context